@@ -132,5 +132,52 @@ class KerasModelCPUBenchmark(  # pylint: disable=undefined-variable
         iters=run_iters, wall_time=wall_time, metrics=metrics, extras=extras)
 
 
+class KerasLoggingCPUBenchmark(  # pylint: disable=undefined-variable
+    tf.test.Benchmark, metaclass=tf.__internal__.test.ParameterizedBenchmark):
+  """Benchmarks of the cost of progress logging with small training steps.
+
+  With small batches, a training step is cheap compared to blocking the host
+  on its results. Comparing `verbose=1` to `verbose=0` shows how much of the
+  throughput is lost to logging.
+  """
+  # The parameters of each benchmark is a tuple:
+
+  # (benchmark_name_suffix, batch_size, run_iters).
+  _benchmark_parameters = [
+      ('bs_1', 1, 2), ('bs_4', 4, 2), ('bs_16', 16, 2)]
+
+  def _small_mlp(self):
+    """Small MLP model, so that steps are dominated by overhead."""
+    model = tf.keras.Sequential()
+    model.add(tf.keras.layers.Dense(32, activation='relu', input_shape=(32,)))
+    model.add(tf.keras.layers.Dense(1, activation='sigmoid'))
+
+    return model
+
+  def _benchmark_small_mlp(self, batch_size, run_iters, verbose):
+    x = np.random.random((2000, 32))
+    y = np.random.randint(0, 2, size=(2000, 1))
+    metrics, wall_time, extras = benchmark_util.measure_performance(
+        self._small_mlp,
+        x=x,
+        y=y,
+        batch_size=batch_size,
+        run_iters=run_iters,
+        optimizer=_OPTIMIZER,
+        loss=_LOSS,
+        metrics=['accuracy'],
+        verbose=verbose)
+    self.report_benchmark(
+        iters=run_iters, wall_time=wall_time, metrics=metrics, extras=extras)
+
+  def benchmark_small_mlp_progbar(self, batch_size, run_iters):
+    """Benchmark for a small MLP with the progress bar."""
+    self._benchmark_small_mlp(batch_size, run_iters, verbose=1)
+
+  def benchmark_small_mlp_silent(self, batch_size, run_iters):
+    """Benchmark for a small MLP without logging."""
+    self._benchmark_small_mlp(batch_size, run_iters, verbose=0)
+
+
 if __name__ == '__main__':
   tf.test.main()
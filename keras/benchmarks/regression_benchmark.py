@@ -0,0 +1,439 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""End-to-end regression benchmarks on a fixed model zoo.
+
+For every model of the zoo, this measures the throughput of `fit`, `evaluate`
+and `predict`, the latency of the first train and predict steps (which include
+tracing) and the time to save and load the model. The throughput of `adapt` is
+measured for a few preprocessing layers. Every benchmark runs in its own
+process, whose peak RSS is reported too.
+The results are written as JSON and compared to the checked-in baseline
+`regression_baseline.json`:
+
+  bazel run -c opt regression_benchmark -- --output=/tmp/results.json
+
+Metrics that are worse than the baseline by more than the tolerance are
+reported as regressions, and the run fails. The run also fails when metrics
+are missing from the baseline, e.g. for a new benchmark, unless
+`--allow_missing_baseline` is passed. After an intended performance change, or
+to record the metrics of new benchmarks, update the baseline on the reference
+machine with:
+
+  bazel run -c opt regression_benchmark -- \
+    --baseline=$PWD/keras/benchmarks/regression_baseline.json --update_baseline
+
+Baselines only make sense for the machine they were recorded on. The
+checked-in baseline was recorded with the CPU build of TensorFlow 2.8 and
+Python 3.9 on a Linux VM with 1 vCPU (Intel Xeon) and 5 GB of memory.
+"""
+
+import tensorflow.compat.v2 as tf
+
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from absl import app
+from absl import flags
+from absl import logging
+import numpy as np
+
+from keras.benchmarks import benchmark_util
+
+try:
+  import resource  # pylint:disable=g-import-not-at-top
+except ImportError:
+  resource = None
+
+FLAGS = flags.FLAGS
+flags.DEFINE_string('output', None, 'Path of the JSON file to write.')
+flags.DEFINE_string(
+    'baseline',
+    os.path.join(os.path.dirname(__file__), 'regression_baseline.json'),
+    'Path of the JSON baseline to compare to.')
+flags.DEFINE_float('tolerance', 0.1,
+                   'Relative change from the baseline tolerated for metrics.')
+flags.DEFINE_bool('update_baseline', False,
+                  'Whether to overwrite the baseline with the results.')
+flags.DEFINE_bool('allow_missing_baseline', False,
+                  'Whether to only warn about metrics missing from the '
+                  'baseline instead of failing.')
+flags.DEFINE_integer('repeats', 3,
+                     'Number of runs of the benchmarks. The median of every '
+                     'metric over the runs is reported.')
+flags.DEFINE_string('models', None,
+                    'Comma-separated names of the benchmarks to run. '
+                    'Defaults to all of them.')
+
+# Metrics for which higher values are better. Lower values are better for all
+# the others (times and memory).
+_HIGHER_IS_BETTER_SUFFIX = '_exp_per_sec'
+
+# Tolerances of the timings, from their spread over runs of the default
+# `--repeats` on the reference machine. The peak RSS is stable within 1%, and
+# uses `--tolerance`.
+DEFAULT_TOLERANCES = {
+    'fit_exp_per_sec': 0.3,
+    'evaluate_exp_per_sec': 0.3,
+    'predict_exp_per_sec': 0.3,
+    'adapt_exp_per_sec': 0.5,
+    'first_train_step_time': 0.4,
+    'first_predict_step_time': 0.4,
+    'save_time': 0.3,
+    'load_time': 0.3,
+}
+
+
+def _mlp():
+  model = tf.keras.Sequential([
+      tf.keras.layers.Dense(256, activation='relu', input_shape=(784,)),
+      tf.keras.layers.Dropout(0.2),
+      tf.keras.layers.Dense(10, activation='softmax'),
+  ])
+  return model
+
+
+def _convnet():
+  model = tf.keras.Sequential([
+      tf.keras.layers.Conv2D(
+          16, 3, activation='relu', input_shape=(28, 28, 1)),
+      tf.keras.layers.MaxPooling2D(),
+      tf.keras.layers.Conv2D(32, 3, activation='relu'),
+      tf.keras.layers.GlobalAveragePooling2D(),
+      tf.keras.layers.Dense(10, activation='softmax'),
+  ])
+  return model
+
+
+def _lstm():
+  model = tf.keras.Sequential([
+      tf.keras.layers.Embedding(2000, 32, input_length=50),
+      tf.keras.layers.LSTM(32),
+      tf.keras.layers.Dense(10, activation='softmax'),
+  ])
+  return model
+
+
+def _mlp_data(num_samples):
+  return np.random.random((num_samples, 784)), _labels(num_samples)
+
+
+def _convnet_data(num_samples):
+  return np.random.random((num_samples, 28, 28, 1)), _labels(num_samples)
+
+
+def _lstm_data(num_samples):
+  return (np.random.randint(0, 2000, size=(num_samples, 50)),
+          _labels(num_samples))
+
+
+def _labels(num_samples):
+  return tf.keras.utils.to_categorical(
+      np.random.randint(0, 10, size=(num_samples,)), 10)
+
+
+# Name: (model_fn, data_fn, batch_size).
+MODEL_ZOO = {
+    'mlp': (_mlp, _mlp_data, 128),
+    'convnet': (_convnet, _convnet_data, 64),
+    'lstm': (_lstm, _lstm_data, 64),
+}
+
+
+def _normalization():
+  return tf.keras.layers.Normalization(), np.random.random((20000, 32))
+
+
+def _string_lookup():
+  vocab = np.array(['token_%d' % i for i in range(1000)])
+  return (tf.keras.layers.StringLookup(),
+          vocab[np.random.randint(0, 1000, size=(20000, 8))])
+
+
+def _text_vectorization():
+  vocab = np.array(['token_%d' % i for i in range(1000)])
+  words = vocab[np.random.randint(0, 1000, size=(5000, 16))]
+  return (tf.keras.layers.TextVectorization(),
+          np.array([' '.join(row) for row in words]))
+
+
+# Name: function returning `(layer, data)`.
+ADAPT_ZOO = {
+    'normalization': _normalization,
+    'string_lookup': _string_lookup,
+    'text_vectorization': _text_vectorization,
+}
+
+
+def _peak_rss_mb():
+  """Returns the peak resident set size of the process in MiB, or `None`."""
+  if resource is None:
+    return None
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # Reported in bytes on macOS and in KiB on Linux.
+  if sys.platform == 'darwin':
+    return peak / 2.**20
+  return peak / 2.**10
+
+
+def _compiled(model_fn):
+  model = model_fn()
+  model.compile(
+      optimizer='rmsprop',
+      loss='categorical_crossentropy',
+      metrics=['accuracy'])
+  return model
+
+
+def _throughput(fn, num_examples, run_iters):
+  """Returns the examples per second of `fn`, after one untimed call."""
+  fn()
+  start = time.time()
+  for _ in range(run_iters):
+    fn()
+  return num_examples * run_iters / (time.time() - start)
+
+
+def run_model_benchmark(model_fn, data_fn, batch_size, num_samples=2000,
+                        run_iters=2):
+  """Runs the benchmarks of a model of the zoo.
+
+  Args:
+    model_fn: Function returning an uncompiled model.
+    data_fn: Function returning `(x, y)` NumPy arrays of `num_samples`
+      samples.
+    batch_size: Integer, batch size to use.
+    num_samples: Integer, number of samples of the data.
+    run_iters: Integer, number of timed runs of every measurement.
+
+  Returns:
+    A dict mapping metric names to values.
+  """
+  x, y = data_fn(num_samples)
+  results = {}
+
+  metrics, _, _ = benchmark_util.measure_performance(
+      model_fn,
+      x=x,
+      y=y,
+      batch_size=batch_size,
+      run_iters=run_iters,
+      optimizer='rmsprop',
+      loss='categorical_crossentropy',
+      metrics=['accuracy'])
+  metrics = {metric['name']: metric['value'] for metric in metrics}
+  results['fit_exp_per_sec'] = metrics['exp_per_sec']
+
+  # The first steps of a new model include tracing `tf.function`s.
+  model = _compiled(model_fn)
+  start = time.time()
+  model.train_on_batch(x[:batch_size], y[:batch_size])
+  results['first_train_step_time'] = time.time() - start
+  start = time.time()
+  model.predict_on_batch(x[:batch_size])
+  results['first_predict_step_time'] = time.time() - start
+
+  results['evaluate_exp_per_sec'] = _throughput(
+      lambda: model.evaluate(x, y, batch_size=batch_size, verbose=0),
+      num_samples, run_iters)
+  results['predict_exp_per_sec'] = _throughput(
+      lambda: model.predict(x, batch_size=batch_size), num_samples, run_iters)
+
+  save_dir = tempfile.mkdtemp()
+  try:
+    save_times, load_times = [], []
+    for _ in range(run_iters):
+      start = time.time()
+      model.save(save_dir, save_format='tf')
+      save_times.append(time.time() - start)
+      start = time.time()
+      tf.keras.models.load_model(save_dir)
+      load_times.append(time.time() - start)
+  finally:
+    shutil.rmtree(save_dir, ignore_errors=True)
+  results['save_time'] = float(np.median(save_times))
+  results['load_time'] = float(np.median(load_times))
+  return results
+
+
+def run_adapt_benchmark(layer_and_data_fn, run_iters=2):
+  """Runs the `adapt` benchmark of a preprocessing layer of the zoo."""
+  layer, data = layer_and_data_fn()
+  return {
+      'adapt_exp_per_sec':
+          _throughput(lambda: layer.adapt(data, batch_size=256), len(data),
+                      run_iters)
+  }
+
+
+def _run_benchmark(name, num_samples, run_iters):
+  """Runs the benchmark `name` of the zoo and returns its metrics."""
+  logging.info('Running benchmark %s.', name)
+  if name in MODEL_ZOO:
+    model_fn, data_fn, batch_size = MODEL_ZOO[name]
+    return run_model_benchmark(
+        model_fn, data_fn, batch_size, num_samples=num_samples,
+        run_iters=run_iters)
+  return run_adapt_benchmark(ADAPT_ZOO[name[len('adapt/'):]], run_iters)
+
+
+def _run_benchmark_with_peak_rss(name, num_samples, run_iters):
+  results = _run_benchmark(name, num_samples, run_iters)
+  peak_rss_mb = _peak_rss_mb()
+  if peak_rss_mb is not None:
+    results['peak_rss_mb'] = peak_rss_mb
+  return results
+
+
+def run_benchmarks(names=None, num_samples=2000, run_iters=2, isolate=False):
+  """Runs the benchmarks of the zoo.
+
+  Args:
+    names: Optional list of benchmark names, e.g. `['mlp',
+      'adapt/normalization']`. Defaults to all the benchmarks.
+    num_samples: Integer, number of samples of the model benchmarks.
+    run_iters: Integer, number of timed runs of every measurement.
+    isolate: Boolean, whether to run every benchmark in a new process. The
+      peak RSS of the process, `'peak_rss_mb'`, is then reported as well. It
+      does not depend on the other benchmarks that are run.
+
+  Returns:
+    A dict mapping benchmark names to dicts of metrics.
+  """
+  all_names = list(MODEL_ZOO) + ['adapt/' + name for name in ADAPT_ZOO]
+  results = {}
+  for name in all_names:
+    if names is not None and name not in names:
+      continue
+    if not isolate:
+      results[name] = _run_benchmark(name, num_samples, run_iters)
+      continue
+    # A spawned process does not inherit the memory of this one.
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+      results[name] = pool.apply(_run_benchmark_with_peak_rss,
+                                 (name, num_samples, run_iters))
+  return results
+
+
+def median_of_runs(runs):
+  """Returns the median of every metric over several runs of the benchmarks.
+
+  Args:
+    runs: List of dicts returned by `run_benchmarks`.
+
+  Returns:
+    A dict with the same structure as the elements of `runs`.
+  """
+  results = {}
+  for name in runs[0]:
+    results[name] = {
+        metric: float(np.median([run[name][metric] for run in runs]))
+        for metric in runs[0][name]
+    }
+  return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.1, tolerances=None):
+  """Compares benchmark results to a baseline.
+
+  Args:
+    results: Dict mapping benchmark names to dicts of metrics, as returned by
+      `run_benchmarks`.
+    baseline: Dict with the same structure as `results`.
+    tolerance: Float, relative change from the baseline that is tolerated.
+    tolerances: Optional dict mapping metric names to tolerances overriding
+      `tolerance`.
+
+  Returns:
+    A list of strings describing the regressions, empty if there are none.
+    Metrics missing from the baseline are not compared, see
+    `missing_from_baseline`.
+  """
+  tolerances = tolerances or {}
+  regressions = []
+  for name, metrics in sorted(results.items()):
+    for metric, value in sorted(metrics.items()):
+      expected = baseline.get(name, {}).get(metric)
+      if expected is None or value is None:
+        continue
+      metric_tolerance = tolerances.get(metric, tolerance)
+      if metric.endswith(_HIGHER_IS_BETTER_SUFFIX):
+        regressed = value < expected * (1 - metric_tolerance)
+      else:
+        regressed = value > expected * (1 + metric_tolerance)
+      if regressed:
+        regressions.append(
+            '{}/{}: {:.4g} vs. baseline {:.4g} ({:+.1%}, tolerance {:.0%})'
+            .format(name, metric, value, expected, value / expected - 1,
+                    metric_tolerance))
+  return regressions
+
+
+def missing_from_baseline(results, baseline):
+  """Returns the sorted `'name/metric'` results missing from a baseline."""
+  return sorted(
+      '{}/{}'.format(name, metric)
+      for name, metrics in results.items()
+      for metric, value in metrics.items()
+      if value is not None and baseline.get(name, {}).get(metric) is None)
+
+
+def main(_):
+  names = FLAGS.models.split(',') if FLAGS.models else None
+  results = median_of_runs(
+      [run_benchmarks(names, isolate=True) for _ in range(FLAGS.repeats)])
+
+  if FLAGS.output:
+    with tf.io.gfile.GFile(FLAGS.output, 'w') as f:
+      json.dump(results, f, indent=2, sort_keys=True)
+  baseline = {}
+  if tf.io.gfile.exists(FLAGS.baseline):
+    with tf.io.gfile.GFile(FLAGS.baseline, 'r') as f:
+      baseline = json.load(f)
+  if FLAGS.update_baseline:
+    # Benchmarks that were not run keep their recorded metrics.
+    baseline.update(results)
+    with tf.io.gfile.GFile(FLAGS.baseline, 'w') as f:
+      json.dump(baseline, f, indent=2, sort_keys=True)
+    logging.info('Updated the baseline %s.', FLAGS.baseline)
+    return
+
+  tolerances = {
+      metric: max(tolerance, FLAGS.tolerance)
+      for metric, tolerance in DEFAULT_TOLERANCES.items()
+  }
+  regressions = compare_to_baseline(
+      results, baseline, FLAGS.tolerance, tolerances)
+  missing = missing_from_baseline(results, baseline)
+  if missing:
+    log_fn = logging.warning if FLAGS.allow_missing_baseline else logging.error
+    log_fn(
+        'Metrics missing from the baseline %s, which were not compared. '
+        'Record them on the reference machine with --update_baseline:\n%s',
+        FLAGS.baseline, '\n'.join(missing))
+  if regressions:
+    logging.error('Regressions compared to %s:\n%s', FLAGS.baseline,
+                  '\n'.join(regressions))
+  if regressions or (missing and not FLAGS.allow_missing_baseline):
+    sys.exit(1)
+  logging.info('No regressions compared to %s.', FLAGS.baseline)
+
+
+if __name__ == '__main__':
+  app.run(main)
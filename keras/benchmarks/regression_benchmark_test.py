@@ -0,0 +1,106 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the end-to-end regression benchmarks."""
+
+import tensorflow.compat.v2 as tf
+
+import json
+import os
+
+from keras.benchmarks import regression_benchmark
+
+
+class RegressionBenchmarkTest(tf.test.TestCase):
+
+  def test_compare_to_baseline(self):
+    baseline = {
+        'mlp': {'fit_exp_per_sec': 1000., 'save_time': 1., 'load_time': 1.},
+    }
+    results = {
+        'mlp': {
+            'fit_exp_per_sec': 850.,
+            'save_time': 1.05,
+            'load_time': 1.3,
+            'predict_exp_per_sec': 1.,
+        },
+        'lstm': {'fit_exp_per_sec': 1.},
+    }
+    regressions = regression_benchmark.compare_to_baseline(
+        results, baseline, tolerance=0.1, tolerances={'load_time': 0.5})
+    self.assertLen(regressions, 1)
+    self.assertStartsWith(regressions[0], 'mlp/fit_exp_per_sec: 850 vs.')
+
+    # Improvements are not regressions.
+    results['mlp']['fit_exp_per_sec'] = 2000.
+    self.assertEmpty(
+        regression_benchmark.compare_to_baseline(
+            results, baseline, tolerance=0.1, tolerances={'load_time': 0.5}))
+
+  def test_median_of_runs(self):
+    runs = [
+        {'mlp': {'fit_exp_per_sec': 3., 'save_time': 1.}},
+        {'mlp': {'fit_exp_per_sec': 1., 'save_time': 2.}},
+        {'mlp': {'fit_exp_per_sec': 2., 'save_time': 9.}},
+    ]
+    self.assertEqual(
+        regression_benchmark.median_of_runs(runs),
+        {'mlp': {'fit_exp_per_sec': 2., 'save_time': 2.}})
+
+  def test_missing_from_baseline(self):
+    baseline = {'mlp': {'fit_exp_per_sec': 1000.}}
+    results = {
+        'mlp': {'fit_exp_per_sec': 1000., 'save_time': 1.},
+        'lstm': {'fit_exp_per_sec': 1.},
+    }
+    self.assertEqual(
+        regression_benchmark.missing_from_baseline(results, baseline),
+        ['lstm/fit_exp_per_sec', 'mlp/save_time'])
+    self.assertEmpty(
+        regression_benchmark.missing_from_baseline(results, results))
+
+  def test_baseline_covers_known_benchmarks(self):
+    with open(os.path.join(os.path.dirname(regression_benchmark.__file__),
+                           'regression_baseline.json')) as f:
+      baseline = json.load(f)
+    known = set(regression_benchmark.MODEL_ZOO)
+    known.update('adapt/' + name for name in regression_benchmark.ADAPT_ZOO)
+    self.assertContainsSubset(baseline, known)
+
+  def test_run_benchmarks(self):
+    results = regression_benchmark.run_benchmarks(
+        ['mlp', 'adapt/normalization'], num_samples=256, run_iters=1)
+    self.assertEqual(set(results), {'mlp', 'adapt/normalization'})
+    self.assertContainsSubset(
+        ['fit_exp_per_sec', 'evaluate_exp_per_sec', 'predict_exp_per_sec',
+         'first_train_step_time', 'first_predict_step_time', 'save_time',
+         'load_time'], results['mlp'])
+    for metrics in results.values():
+      for value in metrics.values():
+        self.assertGreater(value, 0)
+    self.assertEmpty(
+        regression_benchmark.compare_to_baseline(results, results))
+
+  def test_run_benchmarks_isolated(self):
+    results = regression_benchmark.run_benchmarks(
+        ['adapt/normalization'], run_iters=1, isolate=True)
+    self.assertEqual(set(results), {'adapt/normalization'})
+    metrics = results['adapt/normalization']
+    self.assertGreater(metrics['adapt_exp_per_sec'], 0)
+    if regression_benchmark.resource is not None:
+      self.assertGreater(metrics['peak_rss_mb'], 0)
+
+
+if __name__ == '__main__':
+  tf.test.main()
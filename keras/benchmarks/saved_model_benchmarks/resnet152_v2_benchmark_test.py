@@ -24,21 +24,31 @@ from keras.benchmarks.saved_model_benchmarks import saved_model_benchmark_util
 
 class BenchmarkSaveApplications(tf.test.Benchmark):
 
-  def benchmark_save_and_load_resnet152_v2(self):
+  def _benchmark_save_and_load(self, share_layer_functions):
     app = tf.keras.applications.ResNet152V2
     save_result, load_result = (
-        saved_model_benchmark_util.save_and_load_benchmark(app))
+        saved_model_benchmark_util.save_and_load_benchmark(
+            app, share_layer_functions=share_layer_functions))
 
     self.report_benchmark(
         iters=save_result['iters'],
         wall_time=save_result['wall_time'],
-        name=save_result['name'])
+        name=save_result['name'],
+        extras=save_result['extras'])
 
     self.report_benchmark(
         iters=load_result['iters'],
         wall_time=load_result['wall_time'],
         name=load_result['name'])
 
+  def benchmark_save_and_load_resnet152_v2(self):
+    self._benchmark_save_and_load(share_layer_functions=True)
+
+  # ResNet152V2 has many identical stateless layers (activations, additions,
+  # paddings), which share their traced functions by default.
+  def benchmark_save_and_load_resnet152_v2_without_shared_functions(self):
+    self._benchmark_save_and_load(share_layer_functions=False)
+
 
 if __name__ == '__main__':
   tf.test.main()
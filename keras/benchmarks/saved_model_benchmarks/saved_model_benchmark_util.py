@@ -20,16 +20,43 @@ from __future__ import print_function
 
 import tensorflow.compat.v2 as tf
 
+import os
 import tempfile
 import time
 
+from keras.saving.saved_model import save_impl
 
-def save_and_load_benchmark(app):
-  """Util for saved model benchmarks."""
+
+def _get_saved_model_size(save_dir):
+  """Returns the total size in bytes of the files of a SavedModel."""
+  size = 0
+  for dir_name, _, file_names in tf.io.gfile.walk(save_dir):
+    for file_name in file_names:
+      size += tf.io.gfile.stat(os.path.join(dir_name, file_name)).length
+  return size
+
+
+def save_and_load_benchmark(app, share_layer_functions=True):
+  """Util for saved model benchmarks.
+
+  Args:
+    app: Function returning a Keras application model.
+    share_layer_functions: Whether identical stateless layers share their
+      traced functions when saving. Disabling it measures the baseline of
+      tracing every layer separately.
+
+  Returns:
+    The results of the save and load benchmarks, as dicts. The results of the
+    save benchmark include the size of the SavedModel in `extras`.
+  """
   trials = 3
 
   model = app(weights=None)
   model_name = app.__name__
+  if not share_layer_functions:
+    model_name += '_without_shared_functions'
+  share_functions = save_impl._SHARE_STATELESS_LAYER_FUNCTIONS  # pylint: disable=protected-access
+  save_impl._SHARE_STATELESS_LAYER_FUNCTIONS = share_layer_functions  # pylint: disable=protected-access
 
   tmp_dir = tf.compat.v1.test.get_temp_dir()
   tf.io.gfile.makedirs(tmp_dir)
@@ -42,19 +69,23 @@ def save_and_load_benchmark(app):
   model.save(save_dir, save_format='tf')
   tf.keras.models.load_model(save_dir)
 
-  for _ in range(trials):
-    start_time = time.time()
-    model.save(save_dir, save_format='tf')
-    total_save_time += time.time() - start_time
+  try:
+    for _ in range(trials):
+      start_time = time.time()
+      model.save(save_dir, save_format='tf')
+      total_save_time += time.time() - start_time
 
-    start_time = time.time()
-    tf.keras.models.load_model(save_dir)
-    total_load_time += time.time() - start_time
+      start_time = time.time()
+      tf.keras.models.load_model(save_dir)
+      total_load_time += time.time() - start_time
+  finally:
+    save_impl._SHARE_STATELESS_LAYER_FUNCTIONS = share_functions  # pylint: disable=protected-access
 
   save_result = {
       'iters': trials,
       'wall_time': total_save_time / trials,
-      'name': '{}.save'.format(model_name)
+      'name': '{}.save'.format(model_name),
+      'extras': {'saved_model_size': _get_saved_model_size(save_dir)}
   }
 
   load_result = {
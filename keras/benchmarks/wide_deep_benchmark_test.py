@@ -0,0 +1,127 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks of WideDeepModel training on synthetic Criteo-like data."""
+
+import tensorflow.compat.v2 as tf
+
+import timeit
+
+import numpy as np
+
+# Criteo-like features: dense features, and high cardinality categorical
+# features whose ids are offset so that every feature has its own id range.
+_NUM_DENSE = 13
+_NUM_CATEGORICAL = 26
+_CARDINALITY = 10000
+_VOCABULARY_SIZE = _NUM_CATEGORICAL * _CARDINALITY
+_EMBEDDING_DIM = 8
+_NUM_EXAMPLES = 2**15
+
+
+def _get_dataset(batch_size):
+  """Returns a dataset of `((linear_inputs, dnn_inputs), labels)`.
+
+  The linear inputs are a `SparseTensor` with one column per categorical id,
+  and the dnn inputs are the dense features and the categorical ids.
+  """
+  dense = np.random.random((_NUM_EXAMPLES, _NUM_DENSE)).astype('float32')
+  ids = np.random.randint(
+      0, _CARDINALITY, size=(_NUM_EXAMPLES, _NUM_CATEGORICAL))
+  ids += np.arange(_NUM_CATEGORICAL) * _CARDINALITY
+  labels = np.random.randint(0, 2, size=(_NUM_EXAMPLES, 1)).astype('float32')
+
+  def to_model_inputs(dense, ids, labels):
+    batch = tf.shape(ids, out_type=tf.int64)[0]
+    rows = tf.repeat(tf.range(batch), _NUM_CATEGORICAL)
+    # The ids of every row are increasing, so the indices are ordered.
+    indices = tf.stack([rows, tf.reshape(ids, [-1])], axis=1)
+    sparse_ids = tf.SparseTensor(
+        indices=indices,
+        values=tf.ones_like(rows, dtype=tf.float32),
+        dense_shape=tf.stack([batch, _VOCABULARY_SIZE]))
+    return (sparse_ids, (dense, ids)), labels
+
+  dataset = tf.data.Dataset.from_tensor_slices((dense, ids, labels))
+  dataset = dataset.batch(batch_size, drop_remainder=True)
+  return dataset.map(to_model_inputs).cache().prefetch(tf.data.AUTOTUNE)
+
+
+def _get_wide_deep_model(dnn_jit_compile):
+  linear_model = tf.keras.experimental.LinearModel(units=1)
+  dense = tf.keras.Input(shape=(_NUM_DENSE,))
+  ids = tf.keras.Input(shape=(_NUM_CATEGORICAL,), dtype='int64')
+  embeddings = tf.keras.layers.Embedding(_VOCABULARY_SIZE, _EMBEDDING_DIM)(ids)
+  x = tf.keras.layers.concatenate(
+      [dense, tf.keras.layers.Flatten()(embeddings)])
+  x = tf.keras.layers.Dense(256, activation='relu')(x)
+  x = tf.keras.layers.Dense(128, activation='relu')(x)
+  outputs = tf.keras.layers.Dense(1)(x)
+  dnn_model = tf.keras.Model([dense, ids], outputs)
+  return tf.keras.experimental.WideDeepModel(
+      linear_model,
+      dnn_model,
+      activation='sigmoid',
+      dnn_jit_compile=dnn_jit_compile)
+
+
+class WideDeepCPUBenchmark(  # pylint: disable=undefined-variable
+    tf.test.Benchmark, metaclass=tf.__internal__.test.ParameterizedBenchmark):
+  """Benchmarks of the training throughput of `WideDeepModel`.
+
+  The linear model is trained with FTRL and the dnn model with Adagrad, which
+  both apply the sparse gradients of the linear kernel and of the embeddings
+  as row-sparse updates.
+  """
+  # The parameters of each benchmark is a tuple:
+
+  # (benchmark_name_suffix, batch_size, run_iters).
+  _benchmark_parameters = [
+      ('bs_256', 256, 2), ('bs_1024', 1024, 2), ('bs_4096', 4096, 2)]
+
+  def _benchmark_fit(self, batch_size, run_iters, dnn_jit_compile):
+    dataset = _get_dataset(batch_size)
+    steps = _NUM_EXAMPLES // batch_size
+    wall_times = []
+    for _ in range(run_iters):
+      model = _get_wide_deep_model(dnn_jit_compile)
+      model.compile(optimizer=['ftrl', 'adagrad'], loss='binary_crossentropy')
+      # Run one warm up epoch, which traces the train function.
+      model.fit(dataset, epochs=1, verbose=0)
+      start_time = timeit.default_timer()
+      model.fit(dataset, epochs=1, verbose=0)
+      wall_times.append(timeit.default_timer() - start_time)
+
+    wall_time = np.mean(wall_times)
+    metrics = [
+        {'name': 'steps_per_sec', 'value': steps / wall_time},
+        {'name': 'exp_per_sec', 'value': steps * batch_size / wall_time},
+    ]
+    self.report_benchmark(
+        iters=run_iters,
+        wall_time=wall_time,
+        metrics=metrics,
+        extras={'dnn_jit_compile': dnn_jit_compile})
+
+  def benchmark_wide_deep(self, batch_size, run_iters):
+    """Benchmark for WideDeepModel."""
+    self._benchmark_fit(batch_size, run_iters, dnn_jit_compile=False)
+
+  def benchmark_wide_deep_dnn_jit_compile(self, batch_size, run_iters):
+    """Benchmark for WideDeepModel with an XLA compiled dnn model."""
+    self._benchmark_fit(batch_size, run_iters, dnn_jit_compile=True)
+
+
+if __name__ == '__main__':
+  tf.test.main()
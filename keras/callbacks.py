@@ -22,9 +22,12 @@ import collections
 import copy
 import csv
 import json
+import math
 import os
+import queue
 import re
 import sys
+import threading
 import time
 
 import numpy as np
@@ -221,13 +224,20 @@ class CallbackList:
         if cb._implements_train_batch_hooks() or cb
         ._implements_test_batch_hooks() or cb._implements_predict_batch_hooks())
 
+    # Callbacks declaring `batch_hook_freq='epoch'` never need batch hooks.
     self._should_call_train_batch_hooks = any(
-        cb._implements_train_batch_hooks() for cb in self.callbacks)
+        cb._implements_train_batch_hooks() and
+        _get_batch_hook_freq(cb) != 'epoch' for cb in self.callbacks)
     self._should_call_test_batch_hooks = any(
-        cb._implements_test_batch_hooks() for cb in self.callbacks)
+        cb._implements_test_batch_hooks() and
+        _get_batch_hook_freq(cb) != 'epoch' for cb in self.callbacks)
     self._should_call_predict_batch_hooks = any(
-        cb._implements_predict_batch_hooks() for cb in self.callbacks)
+        cb._implements_predict_batch_hooks() and
+        _get_batch_hook_freq(cb) != 'epoch' for cb in self.callbacks)
     # pylint: enable=protected-access
+    # Maps batch hook names to the index of the last window of batches each
+    # callback was called for, by callback id. Reset at the start of epochs.
+    self._batch_hook_windows = {}
 
     self._disallow_batch_hooks_in_ps_strategy()
 
@@ -267,6 +277,9 @@ class CallbackList:
       return logs
     if is_batch_hook and self._batch_hooks_support_tf_logs:
       return logs
+    if is_batch_hook:
+      # Only block on the step results if a callback reads them.
+      return _LazyLogs(logs)
     return tf_utils.sync_to_numpy_or_python_type(logs)
 
   def append(self, callback):
@@ -348,16 +361,82 @@ class CallbackList:
     if self._check_timing:
       start_time = time.time()
 
-    logs = self._process_logs(logs, is_batch_hook=True)
-    for callback in self.callbacks:
-      hook = getattr(callback, hook_name)
-      hook(batch, logs)
+    callbacks = self._get_due_callbacks(hook_name, batch)
+    # Logs are not processed at all when no callback needs this batch.
+    if callbacks:
+      logs = self._process_logs(logs, is_batch_hook=True)
+      for callback in callbacks:
+        hook = getattr(callback, hook_name)
+        hook(batch, logs)
 
     if self._check_timing:
       if hook_name not in self._hook_times:
         self._hook_times[hook_name] = []
       self._hook_times[hook_name].append(time.time() - start_time)
 
+  def _get_due_callbacks(self, hook_name, batch):
+    """Returns the callbacks whose `hook_name` hook is due at `batch`.
+
+    A callback with a `batch_hook_freq` of `N` has its begin hook called for
+    the first batch of every window of `N` batches of an epoch, and its end
+    hook for the last one. When the executions of `steps_per_execution`
+    batches do not line up with these windows, the hooks are called for the
+    first execution starting, resp. ending, in a new window.
+
+    Args:
+      hook_name: Name of the batch hook, e.g. `'on_train_batch_end'`.
+      batch: Integer, index of the batch the hook is called for.
+
+    Returns:
+      The list of callbacks to call.
+    """
+    windows = self._batch_hook_windows.setdefault(hook_name, {})
+    is_end_hook = hook_name.endswith('_end')
+    callbacks = []
+    for callback in self.callbacks:
+      freq = _get_batch_hook_freq(callback)
+      if freq == 1:
+        callbacks.append(callback)
+      elif freq != 'epoch':
+        if is_end_hook:
+          window, last_window = (batch + 1) // freq, windows.get(
+              id(callback), 0)
+        else:
+          window, last_window = batch // freq, windows.get(id(callback), -1)
+        if window > last_window:
+          windows[id(callback)] = window
+          callbacks.append(callback)
+    return callbacks
+
+  def _reset_batch_hook_windows(self, mode):
+    for hook in ('begin', 'end'):
+      self._batch_hook_windows.pop(
+          'on_{mode}_batch_{hook}'.format(mode=mode, hook=hook), None)
+
+  def _get_batch_hook_interval(self, mode):
+    """Returns the largest `steps_per_execution` calling every due batch hook.
+
+    With this number of batches per execution, every window of batches of the
+    `batch_hook_freq` of the callbacks ends with an execution, so that no batch
+    hook is skipped or called late.
+
+    Args:
+      mode: One of `ModeKeys.TRAIN`, `ModeKeys.TEST` or `ModeKeys.PREDICT`.
+
+    Returns:
+      An integer, or `None` if no callback needs the batch hooks of `mode`.
+    """
+    interval = None
+    for callback in self.callbacks:
+      implements_batch_hooks = getattr(
+          callback, '_implements_{mode}_batch_hooks'.format(mode=mode))
+      if not implements_batch_hooks():
+        continue
+      freq = _get_batch_hook_freq(callback)
+      if freq != 'epoch':
+        interval = freq if interval is None else math.gcd(interval, freq)
+    return interval
+
   def _call_begin_hook(self, mode):
     """Helper function for on_{train|test|predict}_begin methods."""
     if mode == ModeKeys.TRAIN:
@@ -394,6 +473,7 @@ class CallbackList:
         logs: Dict. Currently no data is passed to this argument for this method
           but that may change in the future.
     """
+    self._reset_batch_hook_windows(ModeKeys.TRAIN)
     logs = self._process_logs(logs)
     for callback in self.callbacks:
       callback.on_epoch_begin(epoch, logs)
@@ -508,6 +588,7 @@ class CallbackList:
         logs: Dict. Currently no data is passed to this argument for this method
           but that may change in the future.
     """
+    self._reset_batch_hook_windows(ModeKeys.TEST)
     logs = self._process_logs(logs)
     for callback in self.callbacks:
       callback.on_test_begin(logs)
@@ -530,6 +611,7 @@ class CallbackList:
         logs: Dict. Currently no data is passed to this argument for this method
           but that may change in the future.
     """
+    self._reset_batch_hook_windows(ModeKeys.PREDICT)
     logs = self._process_logs(logs)
     for callback in self.callbacks:
       callback.on_predict_begin(logs)
@@ -570,6 +652,92 @@ class CallbackList:
     # pylint: enable=protected-access
 
 
+class _LazyLogs(dict):
+  """`dict` of logs converting its values to NumPy or Python on first read.
+
+  Converting the logs blocks until the step that produced them is done, so the
+  conversion of all values happens at once, and only when a value is read.
+  Callbacks that only use the keys of the logs, or ignore them, do not block.
+  """
+
+  def __init__(self, logs):
+    super(_LazyLogs, self).__init__(logs)
+    self._synced = False
+
+  def _sync(self):
+    if not self._synced:
+      self._synced = True
+      super(_LazyLogs, self).update(
+          tf_utils.sync_to_numpy_or_python_type(
+              dict(super(_LazyLogs, self).items())))
+
+  def __getitem__(self, key):
+    self._sync()
+    return super(_LazyLogs, self).__getitem__(key)
+
+  def __setitem__(self, key, value):
+    # The new value may be a Tensor.
+    self._synced = False
+    super(_LazyLogs, self).__setitem__(key, value)
+
+  def __iter__(self):
+    # Overriding `__iter__` keeps `dict(logs)` and `**logs` from copying the
+    # unconverted values, since they then go through `keys` and `__getitem__`.
+    return iter(self.keys())
+
+  def __eq__(self, other):
+    self._sync()
+    return super(_LazyLogs, self).__eq__(other)
+
+  def __ne__(self, other):
+    return not self == other
+
+  __hash__ = None
+
+  def __repr__(self):
+    self._sync()
+    return super(_LazyLogs, self).__repr__()
+
+  def get(self, key, default=None):
+    self._sync()
+    return super(_LazyLogs, self).get(key, default)
+
+  def items(self):
+    self._sync()
+    return super(_LazyLogs, self).items()
+
+  def values(self):
+    self._sync()
+    return super(_LazyLogs, self).values()
+
+  def copy(self):
+    self._sync()
+    return dict(super(_LazyLogs, self).items())
+
+  __copy__ = copy
+
+  def pop(self, key, *args):
+    self._sync()
+    return super(_LazyLogs, self).pop(key, *args)
+
+  def popitem(self):
+    self._sync()
+    return super(_LazyLogs, self).popitem()
+
+  def setdefault(self, key, default=None):
+    self._sync()
+    return super(_LazyLogs, self).setdefault(key, default)
+
+
+def _get_batch_hook_freq(callback):
+  """Returns the `batch_hook_freq` of a callback, 1 if it does not set one."""
+  freq = getattr(callback, 'batch_hook_freq', 1)
+  if freq != 'epoch' and (not isinstance(freq, int) or freq < 1):
+    raise ValueError('`batch_hook_freq` must be a positive integer or '
+                     f'\'epoch\'. Received: {freq} for callback {callback}.')
+  return freq
+
+
 @keras_export('keras.callbacks.Callback')
 class Callback:
   """Abstract base class used to build new callbacks.
@@ -624,6 +792,14 @@ class Callback:
           (eg. verbosity, batch size, number of epochs...).
       model: Instance of `keras.models.Model`.
           Reference of the model being trained.
+      batch_hook_freq: Integer or `'epoch'`. How often the batch hooks of the
+          callback need to be called. Defaults to 1, i.e. for every batch (or
+          every execution, see `steps_per_execution` in `Model.compile`).
+          With `N`, the `on_*_batch_begin` hooks are called for the first batch
+          of every `N` batches of an epoch, and the `on_*_batch_end` hooks for
+          the last one. With `'epoch'`, the batch hooks are never called. This
+          lets `Model.compile(steps_per_execution='auto')` run more batches per
+          execution, and avoids fetching the logs of the skipped batches.
 
   The `logs` dictionary that callback methods
   take as argument will contain keys for quantities relevant to
@@ -638,6 +814,7 @@ class Callback:
     # TODO(omalleyt): Make this attr public once solution is stable.
     self._chief_worker_only = None
     self._supports_tf_logs = False
+    self.batch_hook_freq = 1
 
   def set_params(self, params):
     self.params = params
@@ -1100,7 +1277,11 @@ class ProgbarLogger(Callback):
       self.seen += add_seen
 
     if self.verbose == 1:
-      # Only block async when verbose = 1.
+      # Only block async when verbose = 1, and only when the progress bar is
+      # due for a refresh. Metrics are running averages over the epoch, so the
+      # steps in between do not need to be read.
+      if not self.progbar.is_update_due():
+        return
       logs = tf_utils.sync_to_numpy_or_python_type(logs)
       self.progbar.update(self.seen, list(logs.items()), finalize=False)
 
@@ -2030,6 +2211,120 @@ def keras_model_summary(name, data, step=None):
         tag=tag, tensor=tensor, step=step, metadata=summary_metadata)
 
 
+def _numpy_histogram(values, bucket_count=30):
+  """Computes the buckets of a TensorBoard histogram summary in NumPy.
+
+  Non-finite values are ignored.
+
+  Args:
+    values: A NumPy array.
+    bucket_count: Number of equal-width buckets between the minimum and the
+      maximum of `values`.
+
+  Returns:
+    A float64 array of shape `[k, 3]` of `(left_edge, right_edge, count)`
+    buckets, as written by `tf.summary.histogram`.
+  """
+  values = np.asarray(values, dtype=np.float64).ravel()
+  values = values[np.isfinite(values)]
+  if not values.size:
+    return np.zeros((0, 3))
+  low, high = values.min(), values.max()
+  if low == high:
+    return np.array([[low - 0.5, high + 0.5, values.size]])
+  counts, edges = np.histogram(values, bins=bucket_count, range=(low, high))
+  return np.stack([edges[:-1], edges[1:], counts], axis=1).astype(np.float64)
+
+
+def _write_histogram(name, buckets, step):
+  """Writes histogram `buckets` computed by `_numpy_histogram`."""
+  summary_metadata = tf.compat.v1.SummaryMetadata()
+  summary_metadata.plugin_data.plugin_name = 'histograms'
+  with tf.summary.experimental.summary_scope(
+      name, 'histogram_summary', [buckets, step]) as (tag, _):
+    return tf.summary.write(
+        tag=tag,
+        tensor=tf.constant(buckets, dtype=tf.float64),
+        step=step,
+        metadata=summary_metadata)
+
+
+class _WeightSummaryWriter:
+  """Writes weight histograms and images to TensorBoard in a worker thread.
+
+  `write` snapshots the weights on the calling thread with a single
+  `backend.batch_get_value` call and returns. Histograms are computed in NumPy
+  and written by a background thread, so training resumes while they are
+  being written. At most `max_pending` snapshots are kept in memory: `write`
+  blocks when the worker falls further behind.
+
+  Args:
+    writer: The `tf.summary` writer to write to.
+    image_fn: Optional function called on the worker thread with
+      `(value, name, step)` for every weight, to also log them as images.
+    sample_size: Optional integer. Weights with more elements than this are
+      subsampled uniformly to `sample_size` elements before their histogram
+      is computed.
+    max_pending: Maximum number of snapshots waiting to be written.
+  """
+
+  def __init__(self, writer, image_fn=None, sample_size=None, max_pending=2):
+    self._writer = writer
+    self._image_fn = image_fn
+    self._sample_size = sample_size
+    self._rng = np.random.default_rng(0)
+    self._queue = queue.Queue(maxsize=max_pending)
+    self._error = None
+    self._thread = threading.Thread(target=self._run, daemon=True)
+    self._thread.start()
+
+  def write(self, weights, step):
+    """Snapshots `weights` and queues their summaries at `step`."""
+    self._raise_error()
+    names = [weight.name.replace(':', '_') for weight in weights]
+    values = backend.batch_get_value(weights)
+    self._queue.put((names, values, step))
+
+  def close(self):
+    """Waits for the queued summaries to be written and stops the worker."""
+    self._queue.put(None)
+    self._thread.join()
+    self._raise_error()
+
+  def _raise_error(self):
+    if self._error is not None:
+      error, self._error = self._error, None
+      raise error
+
+  def _run(self):
+    while True:
+      item = self._queue.get()
+      if item is None:
+        return
+      if self._error is not None:
+        continue
+      try:
+        self._write(*item)
+      except Exception as e:  # pylint: disable=broad-except
+        # Raised on the training thread by the next `write` or `close`.
+        self._error = e
+
+  def _subsample(self, value):
+    if self._sample_size is None or value.size <= self._sample_size:
+      return value
+    indices = self._rng.choice(value.size, self._sample_size, replace=False)
+    return value.ravel()[indices]
+
+  def _write(self, names, values, step):
+    with self._writer.as_default(), tf.summary.record_if(True):
+      for name, value in zip(names, values):
+        _write_histogram(
+            name, _numpy_histogram(self._subsample(value)), step=step)
+        if self._image_fn is not None:
+          self._image_fn(value, name, step)
+      self._writer.flush()
+
+
 @keras_export('keras.callbacks.TensorBoard', v1=[])
 class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
   # pylint: disable=line-too-long
@@ -2089,6 +2384,10 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
         filename of a file in which to save metadata for the embedding layer.
         In case the same metadata file is to be
         used for all embedding layers, a single filename can be passed.
+      histogram_sample_size: Optional integer. When computing weight
+        histograms, weights with more elements than this are subsampled
+        uniformly at random to this many elements. Defaults to `None`, which
+        uses all the elements.
 
   Examples:
 
@@ -2170,6 +2469,7 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
                profile_batch=0,
                embeddings_freq=0,
                embeddings_metadata=None,
+               histogram_sample_size=None,
                **kwargs):
     super(TensorBoard, self).__init__()
     self._supports_tf_logs = True
@@ -2183,6 +2483,7 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
     self.update_freq = 1 if update_freq == 'batch' else update_freq
     self.embeddings_freq = embeddings_freq
     self.embeddings_metadata = embeddings_metadata
+    self.histogram_sample_size = histogram_sample_size
     self._init_profile_batch(profile_batch)
     self._global_train_batch = 0
     self._previous_epoch_iterations = 0
@@ -2196,6 +2497,9 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
     # Used to restore any existing `SummaryWriter` after training ends.
     self._prev_summary_state = []
 
+    # Writes weight histograms in the background, created by `_log_weights`.
+    self._weight_summary_writer = None
+
   def _validate_kwargs(self, kwargs):
     """Handle arguments were supported in V1."""
     if kwargs.get('write_grads', False):
@@ -2402,6 +2706,8 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
   def on_train_begin(self, logs=None):
     self._global_train_batch = 0
     self._previous_epoch_iterations = 0
+    # Left over if a previous `fit` did not reach `on_train_end`.
+    self._close_weight_summary_writer()
     self._push_writer(self._train_writer, self._train_step)
 
   def on_train_end(self, logs=None):
@@ -2410,6 +2716,7 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
     if self._is_tracing:
       self._stop_trace()
 
+    self._close_weight_summary_writer()
     self._close_writers()
     self._delete_tmp_write_dir()
 
@@ -2527,16 +2834,22 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
             tf.summary.scalar('epoch_' + name, value, step=epoch)
 
   def _log_weights(self, epoch):
-    """Logs the weights of the Model to TensorBoard."""
-    with self._train_writer.as_default():
-      with tf.summary.record_if(True):
-        for layer in self.model.layers:
-          for weight in layer.weights:
-            weight_name = weight.name.replace(':', '_')
-            tf.summary.histogram(weight_name, weight, step=epoch)
-            if self.write_images:
-              self._log_weight_as_image(weight, weight_name, epoch)
-        self._train_writer.flush()
+    """Logs the weights of the Model to TensorBoard in the background."""
+    if self._weight_summary_writer is None:
+      self._weight_summary_writer = _WeightSummaryWriter(
+          self._train_writer,
+          image_fn=self._log_weight_as_image if self.write_images else None,
+          sample_size=self.histogram_sample_size)
+    weights = []
+    for layer in self.model.layers:
+      weights.extend(layer.weights)
+    self._weight_summary_writer.write(weights, epoch)
+
+  def _close_weight_summary_writer(self):
+    if self._weight_summary_writer is not None:
+      weight_summary_writer = self._weight_summary_writer
+      self._weight_summary_writer = None
+      weight_summary_writer.close()
 
   def _log_weight_as_image(self, weight, weight_name, epoch):
     """Logs a weight as a TensorBoard image."""
@@ -2807,6 +3120,178 @@ class CSVLogger(Callback):
     self.writer = None
 
 
+@keras_export('keras.callbacks.experimental.StepTimeProfiler', v1=[])
+class StepTimeProfiler(Callback):
+  """Callback that breaks down the wall time of training steps.
+
+  The wall time of every training step is split into three parts:
+
+  - `input_wait`: time spent by `train_function` waiting for the next batch of
+    the input pipeline.
+  - `compute`: the rest of the time spent in `train_function`.
+  - `callbacks`: time spent between two calls of `train_function`, which is
+    mostly spent in callbacks (including progress bar logging) and in the
+    training loop itself.
+
+  At the end of every epoch, the mean, total and percentiles of each part are
+  available in `stats`, and are optionally appended as a JSON line to
+  `filename` and written as TensorBoard scalars and histograms to `log_dir`.
+
+  Example:
+
+  ```python
+  profiler = tf.keras.callbacks.experimental.StepTimeProfiler(
+      filename='step_times.jsonl')
+  model.fit(dataset, epochs=10, callbacks=[profiler])
+  # A large `input_wait` share means training is input-bound.
+  print(profiler.stats[-1]['input_wait']['fraction'])
+  ```
+
+  Note:
+  1. Input waits are measured inside `train_function`, so the profiler
+  recreates it at the beginning and at the end of `Model.fit` (this costs a
+  retracing). The train function is also synchronized with the host after
+  every call, which makes `compute` account for the asynchronous work of the
+  step instead of the first callback reading the logs.
+  2. With `steps_per_execution > 1`, a "step" is one call of `train_function`.
+  3. This callback is not supported with
+  `tf.distribute.experimental.ParameterServerStrategy`.
+
+  Args:
+      log_dir: Optional path of the directory where to write TensorBoard
+        summaries.
+      filename: Optional path of a file where to append one JSON object per
+        epoch.
+      percentiles: Sequence of percentiles (between 0 and 100) to report.
+      warmup_steps: Number of steps at the beginning of `Model.fit` to leave
+        out of the statistics, since they include the tracing of
+        `train_function`.
+  """
+
+  _PARTS = ('input_wait', 'compute', 'callbacks')
+
+  def __init__(self,
+               log_dir=None,
+               filename=None,
+               percentiles=(50, 90, 99),
+               warmup_steps=1):
+    super(StepTimeProfiler, self).__init__()
+    self.log_dir = path_to_string(log_dir)
+    self.filename = path_to_string(filename)
+    self.percentiles = tuple(percentiles)
+    self.warmup_steps = warmup_steps
+    self.stats = []
+    self._input_wait_time = None
+    self._train_function = None
+    self._durations = {part: [] for part in self._PARTS}
+    self._steps_seen = 0
+    self._last_call_end = None
+    self._last_input_wait_time = 0.
+    self._writer = None
+    self._file = None
+
+  def on_train_begin(self, logs=None):
+    if self.model._cluster_coordinator:  # pylint: disable=protected-access
+      raise ValueError('`StepTimeProfiler` does not support '
+                       '`ParameterServerStrategy`.')
+    if self._input_wait_time is None:
+      with self.model.distribute_strategy.scope():
+        self._input_wait_time = tf.Variable(
+            0.,
+            dtype='float64',
+            trainable=False,
+            aggregation=tf.VariableAggregation.ONLY_FIRST_REPLICA)
+    self.model._set_input_wait_time(self._input_wait_time)  # pylint: disable=protected-access
+    self._train_function = self.model.make_train_function(force=True)
+    self.model.train_function = self._timed_train_function
+    self._steps_seen = 0
+    if self.log_dir and self._writer is None:
+      self._writer = tf.summary.create_file_writer(self.log_dir)
+    if self.filename:
+      self._file = tf.io.gfile.GFile(self.filename, 'a')
+
+  def on_epoch_begin(self, epoch, logs=None):
+    self._durations = {part: [] for part in self._PARTS}
+    self._last_call_end = None
+    if self._input_wait_time is not None:
+      self._last_input_wait_time = self._input_wait_time.numpy()
+
+  def _timed_train_function(self, iterator):
+    start = time.perf_counter()
+    if self._last_call_end is not None:
+      self._durations['callbacks'].append(start - self._last_call_end)
+    outputs = self._train_function(iterator)
+    # Reading the Variable waits for `train_function` to complete.
+    input_wait_time = self._input_wait_time.numpy()
+    end = time.perf_counter()
+    self._steps_seen += 1
+    if self._steps_seen > self.warmup_steps:
+      input_wait = input_wait_time - self._last_input_wait_time
+      self._durations['input_wait'].append(input_wait)
+      self._durations['compute'].append(max(end - start - input_wait, 0.))
+      self._last_call_end = end
+    self._last_input_wait_time = input_wait_time
+    return outputs
+
+  def _close_step(self):
+    # Time after the last step of the epoch counts until validation or the end
+    # of the epoch.
+    if self._last_call_end is not None:
+      self._durations['callbacks'].append(
+          time.perf_counter() - self._last_call_end)
+      self._last_call_end = None
+
+  def on_test_begin(self, logs=None):
+    self._close_step()
+
+  def on_epoch_end(self, epoch, logs=None):
+    self._close_step()
+    durations = {
+        part: np.asarray(values, dtype='float64')
+        for part, values in self._durations.items()
+    }
+    if not durations['compute'].size:
+      return
+    grand_total = sum(values.sum() for values in durations.values())
+    record = {'epoch': epoch, 'steps': int(durations['compute'].size)}
+    for part, values in durations.items():
+      total = values.sum() if values.size else 0.
+      part_stats = {
+          'mean': float(values.mean()) if values.size else 0.,
+          'total': float(total),
+          'fraction': float(total / grand_total) if grand_total else 0.,
+      }
+      if values.size:
+        for q, value in zip(self.percentiles,
+                            np.percentile(values, self.percentiles)):
+          part_stats['p{:g}'.format(q)] = float(value)
+      record[part] = part_stats
+    self.stats.append(record)
+
+    if self._file is not None:
+      self._file.write(json.dumps(record) + '\n')
+      self._file.flush()
+    if self._writer is not None:
+      with self._writer.as_default():
+        for part in self._PARTS:
+          for name, value in record[part].items():
+            tf.summary.scalar(
+                'step_time/{}_{}'.format(part, name), value, step=epoch)
+          if durations[part].size:
+            tf.summary.histogram(
+                'step_time/{}'.format(part), durations[part], step=epoch)
+      self._writer.flush()
+
+  def on_train_end(self, logs=None):
+    self.model._set_input_wait_time(None)  # pylint: disable=protected-access
+    # Drop the timed train function, it is recreated by the next `fit`.
+    self.model.train_function = None
+    self._train_function = None
+    if self._file is not None:
+      self._file.close()
+      self._file = None
+
+
 @keras_export('keras.callbacks.LambdaCallback')
 class LambdaCallback(Callback):
   r"""Callback for creating simple, custom callbacks on-the-fly.
@@ -17,6 +17,7 @@
 import tensorflow.compat.v2 as tf
 
 import collections
+import copy
 import csv
 import json
 import os
@@ -1620,6 +1621,57 @@ class KerasCallbacksTest(keras_parameterized.TestCase):
             values.append(x)
       assert 'nan' in values[-1], 'The last epoch was not logged.'
 
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_StepTimeProfiler(self):
+    model = self._get_model(input_shape=(3,))
+    num_weights = len(model.weights)
+    x = np.ones((40, 3))
+    y = np.zeros((40, 2))
+    temp_dir = self.get_temp_dir()
+    self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+    filename = os.path.join(temp_dir, 'step_times.jsonl')
+    log_dir = os.path.join(temp_dir, 'logs')
+
+    profiler = keras.callbacks.experimental.StepTimeProfiler(
+        log_dir=log_dir, filename=filename, percentiles=(50, 99))
+    model.fit(
+        x,
+        y,
+        batch_size=10,
+        epochs=2,
+        validation_data=(x, y),
+        callbacks=[profiler],
+        verbose=0)
+
+    with open(filename) as f:
+      records = [json.loads(line) for line in f]
+    self.assertEqual(records, profiler.stats)
+    # The first step is left out as warmup.
+    self.assertEqual([r['steps'] for r in records], [3, 4])
+    for record in records:
+      fractions = 0.
+      for part in ('input_wait', 'compute', 'callbacks'):
+        self.assertEqual(
+            set(record[part]), {'mean', 'total', 'fraction', 'p50', 'p99'})
+        self.assertGreaterEqual(record[part]['mean'], 0.)
+        fractions += record[part]['fraction']
+      self.assertAllClose(fractions, 1.)
+    self.assertNotEmpty(os.listdir(log_dir))
+
+    # The model is left untouched.
+    self.assertIsNone(model.train_function)
+    self.assertLen(model.weights, num_weights)
+    model.fit(x, y, batch_size=10, verbose=0)
+    self.assertLen(profiler.stats, 2)
+
+  def test_StepTimeProfiler_hooks_before_training(self):
+    profiler = keras.callbacks.experimental.StepTimeProfiler()
+    profiler.on_epoch_begin(0)
+    profiler.on_test_begin()
+    profiler.on_epoch_end(0)
+    self.assertEqual(profiler._steps_seen, 0)
+    self.assertEmpty(profiler.stats)
+
   @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
   def test_TerminateOnNaN(self):
     np.random.seed(1337)
@@ -1917,6 +1969,42 @@ class KerasCallbacksTest(keras_parameterized.TestCase):
     cb_list.on_train_begin(logs={'all': 0})
     cb_list.on_train_end(logs={'all': 0})
 
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_batch_logs_are_converted_lazily(self):
+
+    class RecordLogs(keras.callbacks.Callback):
+
+      def __init__(self, read):
+        super(RecordLogs, self).__init__()
+        self.read = read
+        self.logs = []
+
+      def on_train_batch_end(self, batch, logs=None):
+        self.logs.append(logs)
+        # The first batch checks that logs which are not read stay unsynced.
+        if self.read and batch > 0:
+          self.loss = logs['loss']
+
+    ignore_logs = RecordLogs(read=False)
+    read_logs = RecordLogs(read=True)
+    cb_list = keras.callbacks.CallbackList([ignore_logs, read_logs])
+    logs = {'loss': tf.constant(2.), 'acc': tf.constant([1., 0.])}
+
+    cb_list.on_train_batch_end(0, logs={'loss': tf.constant(1.)})
+    self.assertFalse(ignore_logs.logs[0]._synced)
+
+    cb_list.on_train_batch_end(1, logs=logs)
+    batch_logs = ignore_logs.logs[1]
+    self.assertIs(batch_logs, read_logs.logs[1])
+    self.assertTrue(batch_logs._synced)
+    self.assertEqual(read_logs.loss, 2.)
+    self.assertIsInstance(read_logs.loss, float)
+    self.assertEqual(list(batch_logs), ['loss', 'acc'])
+    for copied_logs in (dict(batch_logs), batch_logs.copy(),
+                        copy.copy(batch_logs)):
+      self.assertIsInstance(copied_logs['acc'], np.ndarray)
+      self.assertAllEqual(copied_logs['acc'], [1., 0.])
+
   @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
   def test_implements_batch_hooks_override(self):
 
@@ -1978,6 +2066,98 @@ class KerasCallbacksTest(keras_parameterized.TestCase):
     self.assertEqual(my_cb.test_batches, 0)
     self.assertEqual(my_cb.predict_batches, 0)
 
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_batch_hook_freq(self):
+
+    class RecordBatches(keras.callbacks.Callback):
+
+      def __init__(self, batch_hook_freq):
+        super(RecordBatches, self).__init__()
+        self.batch_hook_freq = batch_hook_freq
+        self.begin_batches = []
+        self.end_batches = []
+        self.steps_per_execution = []
+
+      def on_train_batch_begin(self, batch, logs=None):
+        self.begin_batches.append(batch)
+        self.steps_per_execution.append(
+            self.model._steps_per_execution.numpy().item())
+
+      def on_train_batch_end(self, batch, logs=None):
+        self.end_batches.append(batch)
+
+    every_batch = RecordBatches(1)
+    every_third_batch = RecordBatches(3)
+    epoch_only = RecordBatches('epoch')
+    cb_list = keras.callbacks.CallbackList([every_third_batch, epoch_only])
+    self.assertTrue(cb_list._should_call_train_batch_hooks)
+    self.assertEqual(cb_list._get_batch_hook_interval('train'), 3)
+    self.assertIsNone(cb_list._get_batch_hook_interval('test'))
+    cb_list = keras.callbacks.CallbackList([epoch_only])
+    self.assertFalse(cb_list._should_call_train_batch_hooks)
+    with self.assertRaisesRegex(ValueError, '`batch_hook_freq` must be'):
+      keras.callbacks.CallbackList([RecordBatches(0)])
+
+    # 7 batches per epoch.
+    x, y = np.ones((14, 1)), np.ones((14, 1))
+    model = keras.Sequential([keras.layers.Dense(1)])
+    model.compile('sgd', 'mse', run_eagerly=testing_utils.should_run_eagerly())
+    model.fit(
+        x,
+        y,
+        batch_size=2,
+        epochs=2,
+        callbacks=[every_batch, every_third_batch, epoch_only],
+        verbose=0)
+    self.assertEqual(every_batch.end_batches, list(range(7)) * 2)
+    self.assertEqual(every_third_batch.begin_batches, [0, 3, 6] * 2)
+    self.assertEqual(every_third_batch.end_batches, [2, 5] * 2)
+    self.assertEmpty(epoch_only.begin_batches + epoch_only.end_batches)
+
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_auto_steps_per_execution(self):
+
+    class RecordBatches(keras.callbacks.Callback):
+
+      def __init__(self):
+        super(RecordBatches, self).__init__()
+        self.batch_hook_freq = 4
+        self.end_batches = []
+        self.steps_per_execution = []
+
+      def on_train_batch_end(self, batch, logs=None):
+        self.end_batches.append(batch)
+        self.steps_per_execution.append(
+            self.model._steps_per_execution.numpy().item())
+
+    # 10 batches per epoch.
+    x, y = np.ones((20, 1)), np.ones((20, 1))
+    model = keras.Sequential([keras.layers.Dense(1)])
+    model.compile(
+        'sgd',
+        'mse',
+        steps_per_execution='auto',
+        run_eagerly=testing_utils.should_run_eagerly())
+    record_batches = RecordBatches()
+    model.fit(
+        x,
+        y,
+        batch_size=2,
+        epochs=2,
+        validation_data=(x, y),
+        callbacks=[record_batches],
+        verbose=0)
+    self.assertEqual(record_batches.end_batches, [3, 7] * 2)
+    self.assertEqual(record_batches.steps_per_execution, [4, 4] * 2)
+    self.assertEqual(model._train_counter.numpy(), 10)
+    self.assertEqual(model._steps_per_execution.numpy(), 1)
+
+    # Batches that no callback needs run in the same execution.
+    model.evaluate(x, y, batch_size=2, verbose=0)
+    self.assertEqual(model._test_counter.numpy(), 10)
+    self.assertEqual(model.predict(x, batch_size=2).shape, (20, 1))
+    model.train_on_batch(x, y)
+
   @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
   def test_default_callbacks_do_not_call_batch_hooks(self):
     model = keras.Sequential([keras.layers.Dense(1)])
@@ -2433,6 +2613,38 @@ class TestTensorBoardV2(keras_parameterized.TestCase):
         expected
     )
 
+  def test_TensorBoard_weight_histograms_sampled(self):
+    model = self._get_model()
+    x, y = np.ones((10, 10, 10, 1)), np.ones((10, 1))
+    tb_cbk = keras.callbacks.TensorBoard(
+        self.logdir, histogram_freq=1, histogram_sample_size=16)
+
+    model.fit(x, y, batch_size=2, epochs=2, callbacks=[tb_cbk])
+
+    # Histograms are written in the background and flushed by `on_train_end`.
+    expected_counts = {
+        'kernel_0': 16,  # Subsampled from the 72 and 512 kernel elements.
+        'bias_0': None,
+    }
+    num_histograms = 0
+    for filename in tf.io.gfile.listdir(self.train_dir):
+      if not filename.startswith('events.out.'):
+        continue
+      path = os.path.join(self.train_dir, filename)
+      for event in tf.compat.v1.train.summary_iterator(path):
+        for value in event.summary.value:
+          if value.metadata.plugin_data.plugin_name != 'histograms':
+            continue
+          num_histograms += 1
+          buckets = tf.make_ndarray(value.tensor)
+          self.assertEqual(buckets.shape[1], 3)
+          self.assertAllLessEqual(buckets[:, 0], buckets[:, 1])
+          expected = expected_counts[value.tag.split('/')[-1]]
+          if expected is not None:
+            self.assertEqual(buckets[:, 2].sum(), expected)
+    # Two kernels and two biases, for two epochs.
+    self.assertEqual(num_histograms, 8)
+
   def test_TensorBoard_projector_callback(self):
     layers = [
         keras.layers.Embedding(10, 10, name='test_embedding'),
@@ -0,0 +1,182 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Caching of processed dataset arrays, and vectorized sequence processing.
+
+The datasets loaders store the arrays they compute from the downloaded files
+as `.npy` files, in a directory keyed by the load arguments, and memory-map
+them on later loads with the same arguments.
+
+Datasets of integer sequences (e.g. IMDB and Reuters) are represented as flat
+`int32` values, with the lengths of the sequences, so that they are cached
+compactly and processed with vectorized NumPy operations.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from tensorflow.python.platform import tf_logging as logging
+
+# Version of the cached arrays. Increment it when the processing changes, so
+# that existing caches are not used.
+_CACHE_VERSION = 1
+
+
+def get_cache_dir(path, **kwargs):
+  """Returns the directory of the arrays processed from `path`.
+
+  Args:
+    path: Path of the downloaded file or directory the arrays are computed
+      from.
+    **kwargs: JSON-serializable arguments of the processing.
+
+  Returns:
+    A path next to `path`, keyed by `kwargs` and the size and modification
+    time of `path`.
+  """
+  stat = os.stat(path)
+  key = json.dumps(
+      dict(kwargs, version=_CACHE_VERSION, size=stat.st_size,
+           mtime=stat.st_mtime),
+      sort_keys=True)
+  digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+  name = os.path.basename(os.path.normpath(path))
+  return os.path.join(os.path.dirname(os.path.normpath(path)), 'processed',
+                      f'{name}-{digest}')
+
+
+def load_arrays(cache_dir, names):
+  """Memory-maps cached arrays.
+
+  The arrays are mapped copy-on-write: they can be modified in place, but the
+  changes are not written to the cache.
+
+  Args:
+    cache_dir: Directory returned by `get_cache_dir`.
+    names: Names of the arrays to load.
+
+  Returns:
+    A dict mapping the names to the arrays, or `None` if they are not cached.
+  """
+  arrays = {}
+  for name in names:
+    try:
+      arrays[name] = np.load(
+          os.path.join(cache_dir, name + '.npy'), mmap_mode='c')
+    except (IOError, ValueError):
+      return None
+  return arrays
+
+
+def save_arrays(cache_dir, arrays):
+  """Writes arrays to the cache.
+
+  The arrays are written to a temporary directory, which is then renamed, so
+  that concurrent loaders never read a partial cache. Errors are logged and
+  otherwise ignored, since the cache is only an optimization.
+
+  Args:
+    cache_dir: Directory returned by `get_cache_dir`.
+    arrays: Dict mapping names to NumPy arrays.
+  """
+  tmp_dir = None
+  try:
+    parent_dir = os.path.dirname(cache_dir)
+    os.makedirs(parent_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent_dir)
+    for name, array in arrays.items():
+      np.save(os.path.join(tmp_dir, name + '.npy'), array)
+    os.rename(tmp_dir, cache_dir)
+  except OSError as e:
+    if not os.path.isdir(cache_dir):
+      logging.warning(f'Unable to cache the dataset arrays in {cache_dir}. '
+                      f'Received error: {e}')
+    if tmp_dir is not None:
+      shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def flatten_sequences(sequences):
+  """Returns the `int32` values and the lengths of a list of sequences."""
+  lengths = np.fromiter((len(s) for s in sequences), dtype='int64',
+                        count=len(sequences))
+  values = np.fromiter(itertools.chain.from_iterable(sequences), dtype='int32',
+                       count=int(lengths.sum()))
+  return values, lengths
+
+
+def to_object_array(values, lengths):
+  """Returns a 1D object array with the sequences as lists of integers."""
+  flat_values = values.tolist()
+  ends = np.cumsum(lengths).tolist()
+  sequences = np.empty(len(ends), dtype='object')
+  start = 0
+  for i, end in enumerate(ends):
+    sequences[i] = flat_values[start:end]
+    start = end
+  return sequences
+
+
+def shift_sequences(values, lengths, start_char, index_from):
+  """Adds `index_from` to the values, and prepends `start_char` if not `None`.
+
+  Args:
+    values: Flat `int32` values of the sequences.
+    lengths: Lengths of the sequences.
+    start_char: Integer to prepend to every sequence, or `None`.
+    index_from: Integer to add to every value.
+
+  Returns:
+    The values and lengths of the new sequences.
+  """
+  if index_from:
+    values = values + index_from
+  if start_char is not None:
+    starts = np.cumsum(lengths) - lengths
+    values = np.insert(values, starts, start_char)
+    lengths = lengths + 1
+  return values, lengths
+
+
+def remove_long_sequences(maxlen, values, lengths, labels):
+  """Removes the sequences of `maxlen` values or more, and their labels."""
+  keep = lengths < maxlen
+  values = values[np.repeat(keep, lengths)]
+  return values, lengths[keep], np.asarray(labels)[keep]
+
+
+def filter_values(values, lengths, num_words, skip_top, oov_char):
+  """Replaces or removes the values outside of `[skip_top, num_words)`.
+
+  Args:
+    values: Flat `int32` values of the sequences.
+    lengths: Lengths of the sequences.
+    num_words: Integer, upper bound of the values to keep.
+    skip_top: Integer, lower bound of the values to keep.
+    oov_char: Integer replacing the other values, or `None` to remove them.
+
+  Returns:
+    The values and lengths of the new sequences.
+  """
+  keep = (values >= skip_top) & (values < num_words)
+  if oov_char is not None:
+    return np.where(keep, values, np.int32(oov_char)), lengths
+  row_ids = np.repeat(np.arange(len(lengths)), lengths)
+  lengths = np.bincount(row_ids[keep], minlength=len(lengths))
+  return values[keep], lengths
@@ -0,0 +1,147 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for cache_utils."""
+
+import tensorflow.compat.v2 as tf
+
+import os
+
+from absl.testing import parameterized
+import numpy as np
+from keras.datasets import cache_utils
+
+
+def _get_sequences():
+  return [[5, 1, 7], [], [2], [9, 3, 4, 8, 6], [0, 0]]
+
+
+def _to_lists(values, lengths):
+  return cache_utils.to_object_array(values, lengths).tolist()
+
+
+class CacheUtilsTest(tf.test.TestCase, parameterized.TestCase):
+
+  def test_flatten_sequences(self):
+    values, lengths = cache_utils.flatten_sequences(_get_sequences())
+    self.assertEqual(values.dtype, np.int32)
+    self.assertAllEqual(values, [5, 1, 7, 2, 9, 3, 4, 8, 6, 0, 0])
+    self.assertAllEqual(lengths, [3, 0, 1, 5, 2])
+    self.assertEqual(_to_lists(values, lengths), _get_sequences())
+
+    values, lengths = cache_utils.flatten_sequences([])
+    self.assertEmpty(values)
+    self.assertEmpty(_to_lists(values, lengths))
+
+  @parameterized.named_parameters(
+      ('start_char_and_index_from', 1, 3),
+      ('start_char', 1, 0),
+      ('index_from', None, 3),
+      ('unchanged', None, 0))
+  def test_shift_sequences(self, start_char, index_from):
+    sequences = _get_sequences()
+    if start_char is not None:
+      expected = [[start_char] + [w + index_from for w in x] for x in sequences]
+    else:
+      expected = [[w + index_from for w in x] for x in sequences]
+
+    values, lengths = cache_utils.shift_sequences(
+        *cache_utils.flatten_sequences(sequences), start_char, index_from)
+    self.assertEqual(_to_lists(values, lengths), expected)
+
+  @parameterized.named_parameters(('maxlen_1', 1), ('maxlen_3', 3),
+                                  ('maxlen_6', 6))
+  def test_remove_long_sequences(self, maxlen):
+    sequences = _get_sequences()
+    labels = np.arange(len(sequences))
+    expected = [x for x in sequences if len(x) < maxlen]
+    expected_labels = [y for x, y in zip(sequences, labels) if len(x) < maxlen]
+
+    values, lengths, new_labels = cache_utils.remove_long_sequences(
+        maxlen, *cache_utils.flatten_sequences(sequences), labels)
+    self.assertEqual(_to_lists(values, lengths), expected)
+    self.assertAllEqual(new_labels, expected_labels)
+
+  @parameterized.named_parameters(('oov_char', 2), ('no_oov_char', None))
+  def test_filter_values(self, oov_char):
+    sequences = _get_sequences()
+    num_words, skip_top = 8, 1
+    if oov_char is not None:
+      expected = [[w if skip_top <= w < num_words else oov_char for w in x]
+                  for x in sequences]
+    else:
+      expected = [[w for w in x if skip_top <= w < num_words]
+                  for x in sequences]
+
+    values, lengths = cache_utils.filter_values(
+        *cache_utils.flatten_sequences(sequences), num_words, skip_top,
+        oov_char)
+    self.assertEqual(_to_lists(values, lengths), expected)
+
+  def test_filter_values_removes_all_values(self):
+    values, lengths = cache_utils.filter_values(
+        *cache_utils.flatten_sequences(_get_sequences()), num_words=10,
+        skip_top=10, oov_char=None)
+    self.assertEqual(_to_lists(values, lengths), [[], [], [], [], []])
+
+  def test_save_and_load_arrays(self):
+    path = os.path.join(self.get_temp_dir(), 'dataset.npz')
+    with open(path, 'w') as f:
+      f.write('data')
+    cache_dir = cache_utils.get_cache_dir(path, num_words=10)
+    arrays = {
+        'values': np.arange(10, dtype='int32'),
+        'lengths': np.array([4, 0, 6]),
+    }
+    self.assertIsNone(cache_utils.load_arrays(cache_dir, list(arrays)))
+
+    cache_utils.save_arrays(cache_dir, arrays)
+    loaded = cache_utils.load_arrays(cache_dir, list(arrays))
+    self.assertEqual(set(loaded), set(arrays))
+    for name, array in arrays.items():
+      self.assertEqual(loaded[name].dtype, array.dtype)
+      self.assertAllEqual(loaded[name], array)
+    # The loaded arrays are copy-on-write.
+    loaded['values'][0] = 100
+    self.assertAllEqual(
+        cache_utils.load_arrays(cache_dir, ['values'])['values'],
+        arrays['values'])
+    # No temporary directory is left next to the cache.
+    self.assertEqual(os.listdir(os.path.dirname(cache_dir)),
+                     [os.path.basename(cache_dir)])
+    # Saving again, e.g. from a concurrent loader, keeps the cache.
+    cache_utils.save_arrays(cache_dir, arrays)
+    self.assertIsNotNone(cache_utils.load_arrays(cache_dir, list(arrays)))
+
+  def test_cache_dir_depends_on_key_and_file(self):
+    path = os.path.join(self.get_temp_dir(), 'dataset.npz')
+    with open(path, 'w') as f:
+      f.write('data')
+    cache_dir = cache_utils.get_cache_dir(path, num_words=10)
+    self.assertEqual(cache_dir, cache_utils.get_cache_dir(path, num_words=10))
+    cache_utils.save_arrays(cache_dir, {'values': np.arange(3)})
+
+    other_cache_dir = cache_utils.get_cache_dir(path, num_words=20)
+    self.assertNotEqual(cache_dir, other_cache_dir)
+    self.assertIsNone(cache_utils.load_arrays(other_cache_dir, ['values']))
+
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    other_cache_dir = cache_utils.get_cache_dir(path, num_words=10)
+    self.assertNotEqual(cache_dir, other_cache_dir)
+    self.assertIsNone(cache_utils.load_arrays(other_cache_dir, ['values']))
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -19,6 +19,7 @@ import os
 import numpy as np
 
 from keras import backend
+from keras.datasets import cache_utils
 from keras.datasets.cifar import load_batch
 from keras.utils.data_utils import get_file
 from tensorflow.python.util.tf_export import keras_export
@@ -64,6 +65,10 @@ def load_data():
   **y_test**: uint8 NumPy array of labels (integers in range 0-9)
     with shape `(10000, 1)` for the test data.
 
+  The processed arrays are cached in a `processed` directory next to the
+  downloaded data, and are memory-mapped by later calls with the same
+  arguments.
+
   Example:
 
   ```python
@@ -83,6 +88,22 @@ def load_data():
       file_hash=
       '6d958be074577803d12ecdefd02955f39262c83c16fe9348329d7fe0b5c001ce')
 
+  cache_dir = cache_utils.get_cache_dir(
+      path, image_data_format=backend.image_data_format())
+  arrays = cache_utils.load_arrays(cache_dir, _CACHED_ARRAYS)
+  if arrays is None:
+    arrays = _process(path)
+    cache_utils.save_arrays(cache_dir, arrays)
+
+  return ((arrays['x_train'], arrays['y_train']),
+          (arrays['x_test'], arrays['y_test']))
+
+
+_CACHED_ARRAYS = ('x_train', 'y_train', 'x_test', 'y_test')
+
+
+def _process(path):
+  """Computes the arrays returned by `load_data` from the batch files."""
   num_train_samples = 50000
 
   x_train = np.empty((num_train_samples, 3, 32, 32), dtype='uint8')
@@ -106,4 +127,5 @@ def load_data():
   x_test = x_test.astype(x_train.dtype)
   y_test = y_test.astype(y_train.dtype)
 
-  return (x_train, y_train), (x_test, y_test)
+  return {'x_train': x_train, 'y_train': y_train,
+          'x_test': x_test, 'y_test': y_test}
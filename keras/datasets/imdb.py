@@ -18,7 +18,7 @@ import json
 
 import numpy as np
 
-from keras.preprocessing.sequence import _remove_long_seq
+from keras.datasets import cache_utils
 from keras.utils.data_utils import get_file
 from tensorflow.python.platform import tf_logging as logging
 from tensorflow.python.util.tf_export import keras_export
@@ -85,6 +85,10 @@ def load_data(path='imdb.npz',
     ValueError: in case `maxlen` is so low
         that no input sequence could be kept.
 
+  The processed arrays are cached in a `processed` directory next to the
+  downloaded data, and are memory-mapped by later calls with the same
+  arguments.
+
   Note that the 'out of vocabulary' character is only used for
   words that were present in the training set but are not included
   because they're not making the `num_words` cut here.
@@ -105,6 +109,35 @@ def load_data(path='imdb.npz',
       origin=origin_folder + 'imdb.npz',
       file_hash=
       '69664113be75683a8fe16e3ed0ab59fda8886cb3cd7ada244f7d9544e4676b9f')
+  cache_dir = cache_utils.get_cache_dir(
+      path,
+      num_words=num_words,
+      skip_top=skip_top,
+      maxlen=maxlen,
+      seed=seed,
+      start_char=start_char,
+      oov_char=oov_char,
+      index_from=index_from)
+  arrays = cache_utils.load_arrays(cache_dir, _CACHED_ARRAYS)
+  if arrays is None:
+    arrays = _process(path, num_words, skip_top, maxlen, seed, start_char,
+                      oov_char, index_from)
+    cache_utils.save_arrays(cache_dir, arrays)
+
+  x_train = cache_utils.to_object_array(arrays['x_train_values'],
+                                        arrays['x_train_lengths'])
+  x_test = cache_utils.to_object_array(arrays['x_test_values'],
+                                       arrays['x_test_lengths'])
+  return (x_train, arrays['y_train']), (x_test, arrays['y_test'])
+
+
+_CACHED_ARRAYS = ('x_train_values', 'x_train_lengths', 'y_train',
+                  'x_test_values', 'x_test_lengths', 'y_test')
+
+
+def _process(path, num_words, skip_top, maxlen, seed, start_char, oov_char,
+             index_from):
+  """Computes the arrays returned by `load_data` from the downloaded file."""
   with np.load(path, allow_pickle=True) as f:  # pylint: disable=unexpected-keyword-arg
     x_train, labels_train = f['x_train'], f['y_train']
     x_test, labels_test = f['x_test'], f['y_test']
@@ -120,40 +153,39 @@ def load_data(path='imdb.npz',
   x_test = x_test[indices]
   labels_test = labels_test[indices]
 
-  if start_char is not None:
-    x_train = [[start_char] + [w + index_from for w in x] for x in x_train]
-    x_test = [[start_char] + [w + index_from for w in x] for x in x_test]
-  elif index_from:
-    x_train = [[w + index_from for w in x] for x in x_train]
-    x_test = [[w + index_from for w in x] for x in x_test]
+  x_train, lengths_train = cache_utils.shift_sequences(
+      *cache_utils.flatten_sequences(x_train), start_char, index_from)
+  x_test, lengths_test = cache_utils.shift_sequences(
+      *cache_utils.flatten_sequences(x_test), start_char, index_from)
 
   if maxlen:
-    x_train, labels_train = _remove_long_seq(maxlen, x_train, labels_train)
-    x_test, labels_test = _remove_long_seq(maxlen, x_test, labels_test)
-    if not x_train or not x_test:
+    x_train, lengths_train, labels_train = cache_utils.remove_long_sequences(
+        maxlen, x_train, lengths_train, labels_train)
+    x_test, lengths_test, labels_test = cache_utils.remove_long_sequences(
+        maxlen, x_test, lengths_test, labels_test)
+    if not lengths_train.size or not lengths_test.size:
       raise ValueError('After filtering for sequences shorter than maxlen='
                        f'{str(maxlen)}, no sequence was kept. Increase maxlen.')
 
-  xs = x_train + x_test
-  labels = np.concatenate([labels_train, labels_test])
-
   if not num_words:
-    num_words = max(max(x) for x in xs)
+    num_words = max(x_train.max(initial=0), x_test.max(initial=0))
 
   # by convention, use 2 as OOV word
   # reserve 'index_from' (=3 by default) characters:
   # 0 (padding), 1 (start), 2 (OOV)
-  if oov_char is not None:
-    xs = [
-        [w if (skip_top <= w < num_words) else oov_char for w in x] for x in xs
-    ]
-  else:
-    xs = [[w for w in x if skip_top <= w < num_words] for x in xs]
-
-  idx = len(x_train)
-  x_train, y_train = np.array(xs[:idx], dtype='object'), labels[:idx]
-  x_test, y_test = np.array(xs[idx:], dtype='object'), labels[idx:]
-  return (x_train, y_train), (x_test, y_test)
+  x_train, lengths_train = cache_utils.filter_values(
+      x_train, lengths_train, num_words, skip_top, oov_char)
+  x_test, lengths_test = cache_utils.filter_values(
+      x_test, lengths_test, num_words, skip_top, oov_char)
+
+  return {
+      'x_train_values': x_train,
+      'x_train_lengths': lengths_train,
+      'y_train': np.asarray(labels_train),
+      'x_test_values': x_test,
+      'x_test_lengths': lengths_test,
+      'y_test': np.asarray(labels_test),
+  }
 
 
 @keras_export('keras.datasets.imdb.get_word_index')
@@ -18,7 +18,7 @@ import json
 
 import numpy as np
 
-from keras.preprocessing.sequence import _remove_long_seq
+from keras.datasets import cache_utils
 from keras.utils.data_utils import get_file
 from tensorflow.python.platform import tf_logging as logging
 from tensorflow.python.util.tf_export import keras_export
@@ -91,6 +91,10 @@ def load_data(path='reuters.npz',
 
   **y_train, y_test**: lists of integer labels (1 or 0).
 
+  The processed arrays are cached in a `processed` directory next to the
+  downloaded data, and are memory-mapped by later calls with the same
+  arguments.
+
   Note: The 'out of vocabulary' character is only used for
   words that were present in the training set but are not included
   because they're not making the `num_words` cut here.
@@ -111,6 +115,36 @@ def load_data(path='reuters.npz',
       origin=origin_folder + 'reuters.npz',
       file_hash=
       'd6586e694ee56d7a4e65172e12b3e987c03096cb01eab99753921ef915959916')
+  cache_dir = cache_utils.get_cache_dir(
+      path,
+      num_words=num_words,
+      skip_top=skip_top,
+      maxlen=maxlen,
+      seed=seed,
+      start_char=start_char,
+      oov_char=oov_char,
+      index_from=index_from)
+  arrays = cache_utils.load_arrays(cache_dir, _CACHED_ARRAYS)
+  if arrays is None:
+    arrays = _process(path, num_words, skip_top, maxlen, seed, start_char,
+                      oov_char, index_from)
+    cache_utils.save_arrays(cache_dir, arrays)
+
+  xs = cache_utils.to_object_array(arrays['x_values'], arrays['x_lengths'])
+  labels = arrays['y']
+  idx = int(len(xs) * (1 - test_split))
+  x_train, y_train = xs[:idx], labels[:idx]
+  x_test, y_test = xs[idx:], labels[idx:]
+
+  return (x_train, y_train), (x_test, y_test)
+
+
+_CACHED_ARRAYS = ('x_values', 'x_lengths', 'y')
+
+
+def _process(path, num_words, skip_top, maxlen, seed, start_char, oov_char,
+             index_from):
+  """Computes the arrays returned by `load_data` from the downloaded file."""
   with np.load(path, allow_pickle=True) as f:  # pylint: disable=unexpected-keyword-arg
     xs, labels = f['x'], f['y']
 
@@ -120,30 +154,23 @@ def load_data(path='reuters.npz',
   xs = xs[indices]
   labels = labels[indices]
 
-  if start_char is not None:
-    xs = [[start_char] + [w + index_from for w in x] for x in xs]
-  elif index_from:
-    xs = [[w + index_from for w in x] for x in xs]
+  xs, lengths = cache_utils.shift_sequences(
+      *cache_utils.flatten_sequences(xs), start_char, index_from)
 
   if maxlen:
-    xs, labels = _remove_long_seq(maxlen, xs, labels)
+    xs, lengths, labels = cache_utils.remove_long_sequences(
+        maxlen, xs, lengths, labels)
 
   if not num_words:
-    num_words = max(max(x) for x in xs)
+    num_words = xs.max(initial=0)
 
   # by convention, use 2 as OOV word
   # reserve 'index_from' (=3 by default) characters:
   # 0 (padding), 1 (start), 2 (OOV)
-  if oov_char is not None:
-    xs = [[w if skip_top <= w < num_words else oov_char for w in x] for x in xs]
-  else:
-    xs = [[w for w in x if skip_top <= w < num_words] for x in xs]
+  xs, lengths = cache_utils.filter_values(xs, lengths, num_words, skip_top,
+                                          oov_char)
 
-  idx = int(len(xs) * (1 - test_split))
-  x_train, y_train = np.array(xs[:idx], dtype='object'), np.array(labels[:idx])
-  x_test, y_test = np.array(xs[idx:], dtype='object'), np.array(labels[idx:])
-
-  return (x_train, y_train), (x_test, y_test)
+  return {'x_values': xs, 'x_lengths': lengths, 'y': np.asarray(labels)}
 
 
 @keras_export('keras.datasets.reuters.get_word_index')
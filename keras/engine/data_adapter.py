@@ -27,6 +27,7 @@ import numpy as np
 from tensorflow.python.eager import context
 from keras import backend
 from keras.engine import training_utils
+from keras.utils import bucketed_sequences
 from keras.utils import data_utils
 from keras.utils import dataset_creator
 from keras.utils import tf_utils
@@ -624,6 +625,58 @@ class CompositeTensorDataAdapter(DataAdapter):
     return True
 
 
+class BucketedSequencesAdapter(DataAdapter):
+  """Adapter that handles length-bucketed sequences."""
+
+  @staticmethod
+  def can_handle(x, y=None):
+    return isinstance(x, bucketed_sequences.BucketedSequences)
+
+  def __init__(self,
+               x,
+               y=None,
+               sample_weights=None,
+               shuffle=False,
+               **kwargs):
+    super(BucketedSequencesAdapter, self).__init__(x, y, **kwargs)
+    if not is_none_or_empty(y):
+      raise ValueError("`y` argument is not supported when using "
+                       "`BucketedSequences` as input. Pass the targets to "
+                       "`BucketedSequences` instead.")
+    if not is_none_or_empty(sample_weights):
+      raise ValueError("`sample_weight` argument is not supported when using "
+                       "`BucketedSequences` as input. Pass the sample weights "
+                       "to `BucketedSequences` instead.")
+    self._bucketed_sequences = x
+    # `shuffle="batch"` also reshuffles, since batches never cross buckets.
+    self._dataset = x.get_dataset(shuffle=bool(shuffle))
+
+  def get_dataset(self):
+    return self._dataset
+
+  def get_size(self):
+    return self._bucketed_sequences.num_batches
+
+  def batch_size(self):
+    # Batches from different buckets may have different sizes.
+    return None
+
+  def representative_batch_size(self):
+    return self._bucketed_sequences.batch_size
+
+  def has_partial_batch(self):
+    return False
+
+  def partial_batch_size(self):
+    return None
+
+  def get_samples(self):
+    return self._bucketed_sequences.num_samples
+
+  def should_recreate_iterator(self):
+    return True
+
+
 class ListsOfScalarsDataAdapter(DataAdapter):
   """Adapter that handles lists of scalars and lists of lists of scalars."""
 
@@ -976,7 +1029,8 @@ class KerasSequenceAdapter(GeneratorDataAdapter):
 ALL_ADAPTER_CLS = [
     ListsOfScalarsDataAdapter, TensorLikeDataAdapter,
     GenericArrayLikeDataAdapter, DatasetAdapter, GeneratorDataAdapter,
-    KerasSequenceAdapter, CompositeTensorDataAdapter, DatasetCreatorAdapter
+    KerasSequenceAdapter, CompositeTensorDataAdapter, DatasetCreatorAdapter,
+    BucketedSequencesAdapter
 ]
 
 
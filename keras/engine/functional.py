@@ -32,6 +32,7 @@ from keras.engine import training as training_lib
 from keras.engine import training_utils
 from keras.saving.saved_model import network_serialization
 from keras.utils import generic_utils
+from keras.utils import layer_utils
 from keras.utils import tf_inspect
 from keras.utils import tf_utils
 from tensorflow.python.platform import tf_logging as logging
@@ -257,6 +258,9 @@ class Functional(training_lib.Model):
     self._set_save_spec(self._nested_inputs)
     tf_utils.assert_no_legacy_layers(self.layers)
 
+    # Built by `_structural_index` on first use.
+    self._structural_index_cache = None
+
   @property
   def input(self):
     """Retrieves the input tensor(s) of a layer.
@@ -859,6 +863,14 @@ class Functional(training_lib.Model):
     self._handle_deferred_layer_dependencies(deferred_layers)
 
     self._compute_tensor_usage_count()
+    self._structural_index_cache = None
+
+  @property
+  def _structural_index(self):
+    """The `_StructuralIndex` of the graph, cached until the graph changes."""
+    if getattr(self, '_structural_index_cache', None) is None:
+      self._structural_index_cache = _StructuralIndex(self)
+    return self._structural_index_cache
 
   def _compute_tensor_usage_count(self):
     """Compute the #. of tensor usages for all the output tensors of layers.
@@ -928,6 +940,64 @@ class Functional(training_lib.Model):
     return super(Functional, self)._get_save_spec(dynamic_batch, inputs_only)
 
 
+class _StructuralIndex:
+  """Per-layer structural information about the graph of a `Functional` model.
+
+  Built once by `Functional._structural_index` and discarded when the graph
+  changes, so that `Model.summary` runs in linear time in the number of layers
+  instead of looking up every node in the list of nodes of the graph, and
+  `Model.get_layer` does not scan the layers.
+
+  Attributes:
+    nodes: Set of the nodes of the graph.
+    sequential_like: Whether the graph is a single chain of layers, each with
+      a single input and a single node in the graph.
+    inbound: Dict mapping every layer of the graph to the list of
+      `(inbound_layer, node_index, tensor_index)` feeding its nodes of the
+      graph.
+    layers_by_name: Dict mapping layer names to the list of layers of the
+      graph with that name, in the order of `Model.layers`.
+  """
+
+  def __init__(self, model):
+    self.nodes = set()
+    self.sequential_like = True
+    for nodes in model._nodes_by_depth.values():
+      if (len(nodes) > 1 or
+          (len(nodes) == 1 and len(tf.nest.flatten(nodes[0].keras_inputs)) > 1)):
+        self.sequential_like = False
+      self.nodes.update(nodes)
+
+    self.inbound = {}
+    self.layers_by_name = {}
+    for layer in model.layers:
+      self.layers_by_name.setdefault(layer.name, []).append(layer)
+      inbound = []
+      num_nodes = 0
+      for node in layer._inbound_nodes:
+        if node not in self.nodes:
+          continue
+        num_nodes += 1
+        for inbound_layer, node_index, tensor_index, _ in node.iterate_inbound():
+          inbound.append((inbound_layer, node_index, tensor_index))
+      if num_nodes > 1:
+        # Shared layer.
+        self.sequential_like = False
+      self.inbound[layer] = inbound
+    self._output_shapes = {}
+
+  def get_output_shape(self, layer):
+    """Returns the output shape of `layer`, as displayed by `Model.summary`."""
+    # The output shape of a layer depends on all its nodes, including those
+    # created by calling it outside of the graph after the index was built.
+    num_nodes = len(layer._inbound_nodes)
+    cached = self._output_shapes.get(layer)
+    if cached is None or cached[0] != num_nodes:
+      cached = (num_nodes, layer_utils.get_summary_output_shape(layer))
+      self._output_shapes[layer] = cached
+    return cached[1]
+
+
 def _make_node_key(layer_name, node_index):
   return layer_name + '_ib-' + str(node_index)
 
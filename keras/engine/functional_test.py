@@ -149,6 +149,24 @@ class NetworkConstructionTest(keras_parameterized.TestCase):
     with self.assertRaisesRegex(ValueError, 'No such layer: dense_c.'):
       network.get_layer(name='dense_c')
 
+  def test_get_layer_after_sequential_add_and_pop(self):
+    model = sequential.Sequential([layers.Dense(4, input_shape=(3,),
+                                                name='dense_a')])
+    self.assertEqual(model.get_layer('dense_a').name, 'dense_a')
+
+    dense_b = layers.Dense(2, name='dense_b')
+    model.add(dense_b)
+    self.assertIs(model.get_layer('dense_b'), dense_b)
+
+    model.pop()
+    with self.assertRaisesRegex(ValueError, 'No such layer: dense_b.'):
+      model.get_layer('dense_b')
+
+    # Without an input shape, the model is not a graph network.
+    model = sequential.Sequential()
+    model.add(dense_b)
+    self.assertIs(model.get_layer('dense_b'), dense_b)
+
   @combinations.generate(combinations.combine(mode=['graph', 'eager']))
   def testTopologicalAttributes(self):
     # test layer attributes / methods related to cross-layer connectivity.
@@ -2160,6 +2178,33 @@ class WeightAccessTest(keras_parameterized.TestCase):
     model = SubclassModel()
     self.assertEqual(len(model.weights), 1)
 
+  def test_set_weights_by_name(self):
+    inputs = input_layer_lib.Input((3,))
+    x = layers.Dense(2, name='first')(inputs)
+    outputs = layers.Dense(1, name='second')(x)
+    model = training_lib.Model(inputs, outputs)
+    names = [weight.name for weight in model.weights]
+
+    model.set_weights_by_name({
+        names[0]: np.ones((3, 2)),
+        names[3]: [5.],
+    })
+    self.assertAllEqual(backend.get_value(model.weights[0]), np.ones((3, 2)))
+    self.assertAllEqual(backend.get_value(model.weights[1]), np.zeros((2,)))
+    self.assertAllEqual(backend.get_value(model.weights[3]), [5.])
+
+    with self.assertRaisesRegex(ValueError, 'matches 0 weights'):
+      model.set_weights_by_name({'missing:0': np.ones((1,))})
+    with self.assertRaisesRegex(ValueError, 'expects shape'):
+      model.set_weights_by_name({names[1]: np.ones((3,))})
+
+    model.set_weights_by_name(
+        {'missing:0': np.ones((1,)), names[1]: np.ones((3,)),
+         names[2]: np.ones((2, 1))},
+        skip_mismatch=True)
+    self.assertAllEqual(backend.get_value(model.weights[1]), np.zeros((2,)))
+    self.assertAllEqual(backend.get_value(model.weights[2]), np.ones((2, 1)))
+
 
 @combinations.generate(combinations.combine(mode=['graph', 'eager']))
 class DTypeTest(keras_parameterized.TestCase):
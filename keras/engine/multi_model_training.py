@@ -0,0 +1,328 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Training of several models on a shared input pipeline."""
+
+import tensorflow.compat.v2 as tf
+
+import contextlib
+import copy
+
+from keras import callbacks as callbacks_module
+from keras.engine import data_adapter
+from keras.engine import training as training_module
+from keras.engine import training_utils
+from keras.utils import generic_utils
+from keras.utils import tf_utils
+from tensorflow.python.eager import context
+from tensorflow.python.util.tf_export import keras_export
+
+
+@keras_export('keras.utils.fit_many', v1=[])
+def fit_many(models,
+             x=None,
+             y=None,
+             batch_size=None,
+             epochs=1,
+             verbose='auto',
+             callbacks=None,
+             validation_data=None,
+             shuffle=True,
+             class_weight=None,
+             sample_weight=None,
+             initial_epoch=0,
+             steps_per_epoch=None,
+             max_queue_size=10,
+             workers=1,
+             use_multiprocessing=False,
+             fuse=False):
+  """Trains several compiled models on the same data, reading it only once.
+
+  This is equivalent to calling `fit` on every model with the same arguments,
+  except that the data is read and preprocessed once per step, by a single
+  input pipeline, and every batch is fed to all the models. This is useful for
+  ensembles and hyperparameter sweeps of small models, where the input
+  pipeline can cost as much as the training steps themselves.
+
+  ```python
+  models = [make_model(learning_rate=lr) for lr in (1e-2, 1e-3, 1e-4)]
+  histories = tf.keras.utils.fit_many(models, dataset, epochs=10)
+  ```
+
+  Every model runs its own `Model.train_step`. Overrides of
+  `Model.make_train_function` are not used. All models must use the same
+  distribution strategy and the same `steps_per_execution`.
+
+  Training stops for a model when its `stop_training` attribute is set, e.g.
+  by `tf.keras.callbacks.EarlyStopping`. The other models keep training.
+
+  Args:
+    models: List of compiled `tf.keras.Model`s.
+    x: Input data, as accepted by `Model.fit`.
+    y: Target data, as accepted by `Model.fit`.
+    batch_size: Integer or `None`. Number of samples per gradient update.
+    epochs: Integer. Number of epochs to train the models.
+    verbose: 'auto', 0, 1, or 2. Verbosity mode. 0 = silent, 1 = progress bar
+      of the steps and one line per model at the end of every epoch, 2 = one
+      line per model at the end of every epoch. 'auto' defaults to 1.
+    callbacks: Optional list with one list of `tf.keras.callbacks.Callback`
+      instances per model. Callbacks are bound to a single model, so they
+      cannot be shared between models.
+    validation_data: Optional data on which to evaluate every model at the end
+      of each epoch, as accepted by `Model.fit`. Each model reads the
+      validation data separately.
+    shuffle: Boolean, whether to shuffle the training data before each epoch.
+    class_weight: Optional dictionary mapping class indices to weights.
+    sample_weight: Optional NumPy array of weights for the training samples.
+    initial_epoch: Integer. Epoch at which to start training.
+    steps_per_epoch: Integer or `None`. Number of steps per epoch.
+    max_queue_size: Integer. Maximum size for the generator queue, for
+      generator or `keras.utils.Sequence` inputs only.
+    workers: Integer. Maximum number of processes to spin up, for generator or
+      `keras.utils.Sequence` inputs only.
+    use_multiprocessing: Boolean, whether to use process-based threading, for
+      generator or `keras.utils.Sequence` inputs only.
+    fuse: Boolean. If `True`, the training steps of all the models run in a
+      single `tf.function`, which reduces the per-step dispatch overhead. If
+      `False`, each model runs its own `tf.function` on every batch.
+
+  Returns:
+    A list with the `History` object of every model.
+
+  Raises:
+    ValueError: If `models` is empty, if a model is not compiled, if the models
+      use different distribution strategies or `steps_per_execution`, or if
+      `callbacks` does not have one entry per model.
+  """
+  models = list(models)
+  if not models:
+    raise ValueError('`fit_many` requires at least one model.')
+  if verbose == 'auto':
+    verbose = 1
+  strategy = models[0].distribute_strategy
+  steps_per_execution = _get_steps_per_execution(models[0])
+  for model in models:
+    model._assert_compile_was_called()  # pylint: disable=protected-access
+    if model.distribute_strategy is not strategy:
+      raise ValueError('All models passed to `fit_many` must be created under '
+                       'the same distribution strategy.')
+    if _get_steps_per_execution(model) != steps_per_execution:
+      raise ValueError('All models passed to `fit_many` must be compiled with '
+                       'the same `steps_per_execution`.')
+    if strategy._should_use_with_coordinator:  # pylint: disable=protected-access
+      raise ValueError('`fit_many` does not support `ParameterServerStrategy`.')
+  if callbacks is None:
+    callbacks = [None] * len(models)
+  if len(callbacks) != len(models):
+    raise ValueError('`callbacks` must have one list of callbacks per model. '
+                     f'Received {len(callbacks)} lists for {len(models)} '
+                     'models.')
+
+  if validation_data:
+    val_x, val_y, val_sample_weight = (
+        data_adapter.unpack_x_y_sample_weight(validation_data))
+
+  with contextlib.ExitStack() as stack:
+    stack.enter_context(strategy.scope())
+    for model in models:
+      stack.enter_context(training_utils.RespectCompiledTrainableState(model))
+
+    # A single dataset and iterator feed all the models.
+    data_handler = data_adapter.get_data_handler(
+        x=x,
+        y=y,
+        sample_weight=sample_weight,
+        batch_size=batch_size,
+        steps_per_epoch=steps_per_epoch,
+        initial_epoch=initial_epoch,
+        epochs=epochs,
+        shuffle=shuffle,
+        class_weight=class_weight,
+        max_queue_size=max_queue_size,
+        workers=workers,
+        use_multiprocessing=use_multiprocessing,
+        model=models[0],
+        steps_per_execution=models[0]._steps_per_execution)  # pylint: disable=protected-access
+
+    callback_lists = []
+    for model, model_callbacks in zip(models, callbacks):
+      callback_lists.append(
+          callbacks_module.CallbackList(
+              model_callbacks,
+              add_history=True,
+              add_progbar=False,
+              model=model,
+              verbose=verbose,
+              epochs=epochs,
+              steps=data_handler.inferred_steps))
+
+    train_function = _make_train_function(models, fuse)
+    for model, callback_list in zip(models, callback_lists):
+      model.stop_training = False
+      model._train_counter.assign(0)  # pylint: disable=protected-access
+      callback_list.on_train_begin()
+
+    # Indices of the models that are still training.
+    active = list(range(len(models)))
+    training_logs = [None] * len(models)
+    for epoch, iterator in data_handler.enumerate_epochs():
+      if verbose == 1:
+        progbar = generic_utils.Progbar(
+            target=data_handler.inferred_steps, unit_name='step')
+      epoch_models = active
+      for i in epoch_models:
+        models[i].reset_metrics()
+        callback_lists[i].on_epoch_begin(epoch)
+      logs = {}
+      with data_handler.catch_stop_iteration():
+        for step in data_handler.steps():
+          for i in active:
+            callback_lists[i].on_train_batch_begin(step)
+          step_logs = train_function(iterator, active)
+          if data_handler.should_sync:
+            context.async_wait()
+          logs.update(step_logs)  # No error, now safe to assign to logs.
+          end_step = step + data_handler.step_increment
+          for i in active:
+            callback_lists[i].on_train_batch_end(end_step, step_logs[i])
+          if verbose == 1:
+            progbar.update(end_step + 1)
+          active = [i for i in active if not models[i].stop_training]
+          if not active:
+            break
+
+      for i in epoch_models:
+        if i not in logs:
+          continue
+        epoch_logs = copy.copy(tf_utils.sync_to_numpy_or_python_type(logs[i]))
+        if validation_data:
+          val_logs = models[i].evaluate(
+              x=val_x,
+              y=val_y,
+              sample_weight=val_sample_weight,
+              batch_size=batch_size,
+              callbacks=callback_lists[i],
+              return_dict=True,
+              verbose=0)
+          epoch_logs.update(
+              {'val_' + name: val for name, val in val_logs.items()})
+        if verbose:
+          _print_epoch_logs(models[i], epoch, epochs, epoch_logs)
+        callback_lists[i].on_epoch_end(epoch, epoch_logs)
+        training_logs[i] = epoch_logs
+      active = [i for i in active if not models[i].stop_training]
+      if not active:
+        break
+
+    for callback_list, model_logs in zip(callback_lists, training_logs):
+      callback_list.on_train_end(logs=model_logs)
+    return [model.history for model in models]
+
+
+def _get_steps_per_execution(model):
+  if model._steps_per_execution is None:  # pylint: disable=protected-access
+    return 1
+  return model._steps_per_execution.numpy().item()  # pylint: disable=protected-access
+
+
+def _make_step_function(model):
+  """Returns a function running one `train_step` of `model` on a batch."""
+
+  def run_step(data):
+    outputs = model.train_step(data)
+    # Ensure counter is updated only if `train_step` succeeds.
+    with tf.control_dependencies(training_module._minimum_control_deps(outputs)):  # pylint: disable=protected-access
+      model._train_counter.assign_add(1)  # pylint: disable=protected-access
+    return outputs
+
+  def step_function(data):
+    outputs = model.distribute_strategy.run(run_step, args=(data,))
+    outputs = training_module.reduce_per_replica(
+        outputs, model.distribute_strategy, reduction='first')
+    training_module.write_scalar_summaries(outputs, step=model._train_counter)  # pylint: disable=protected-access
+    return outputs
+
+  return step_function
+
+
+def _make_train_function(models, fuse):
+  """Returns a function running training steps of the active models.
+
+  The returned function takes the shared iterator and the list of the indices
+  of the models to train, and returns a dict mapping these indices to the
+  logs of the models.
+
+  The number of batches read per call is the value of the `steps_per_execution`
+  variable of the first model when the function is called. It is the variable
+  passed to the `DataHandler`, which lowers it for the last execution of an
+  epoch when the number of steps is not a multiple of it.
+
+  Args:
+    models: List of models.
+    fuse: Whether to run the steps of all the models in a single
+      `tf.function`.
+
+  Returns:
+    A function.
+  """
+  step_functions = [_make_step_function(model) for model in models]
+  run_eagerly = any(model.run_eagerly for model in models)
+  steps_per_execution = models[0]._steps_per_execution  # pylint: disable=protected-access
+
+  if fuse:
+
+    def fused_step(iterator, indices):
+      data = next(iterator)
+      return {i: step_functions[i](data) for i in indices}
+
+    if _get_steps_per_execution(models[0]) == 1:
+      fused_function = fused_step
+    else:
+
+      def fused_function(iterator, indices):
+        for _ in tf.range(steps_per_execution):
+          outputs = fused_step(iterator, indices)
+        return outputs
+
+    if not run_eagerly:
+      fused_function = tf.function(
+          fused_function, experimental_relax_shapes=True)
+
+    def train_function(iterator, indices):
+      # The indices are a tuple so that a new trace is only created when the
+      # set of active models changes.
+      return fused_function(iterator, tuple(indices))
+
+    return train_function
+
+  if not run_eagerly:
+    step_functions = [
+        step_function if model.run_eagerly else tf.function(
+            step_function, experimental_relax_shapes=True)
+        for model, step_function in zip(models, step_functions)
+    ]
+
+  def train_function(iterator, indices):
+    for _ in range(steps_per_execution.numpy().item()):
+      data = next(iterator)
+      outputs = {i: step_functions[i](data) for i in indices}
+    return outputs
+
+  return train_function
+
+
+def _print_epoch_logs(model, epoch, epochs, logs):
+  metrics = ' - '.join(
+      '{}: {:.4g}'.format(name, value) for name, value in logs.items())
+  print('Epoch {}/{} - {}: {}'.format(epoch + 1, epochs, model.name, metrics))
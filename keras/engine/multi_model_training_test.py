@@ -0,0 +1,137 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for multi_model_training."""
+
+import tensorflow.compat.v2 as tf
+
+from absl.testing import parameterized
+import numpy as np
+from keras import callbacks
+from keras import keras_parameterized
+from keras import layers
+from keras import testing_utils
+from keras.engine import multi_model_training
+from keras.engine import sequential
+
+
+def _get_model(seed, steps_per_execution=1):
+  tf.random.set_seed(seed)
+  model = sequential.Sequential([
+      layers.Dense(4, activation='relu', input_shape=(3,)),
+      layers.Dense(1),
+  ])
+  model.compile(
+      'sgd', 'mse', metrics=['mae'],
+      steps_per_execution=steps_per_execution,
+      run_eagerly=testing_utils.should_run_eagerly())
+  return model
+
+
+class _StopAfterEpoch(callbacks.Callback):
+
+  def __init__(self, epoch):
+    super(_StopAfterEpoch, self).__init__()
+    self._epoch = epoch
+
+  def on_epoch_end(self, epoch, logs=None):
+    if epoch == self._epoch:
+      self.model.stop_training = True
+
+
+@keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+class FitManyTest(keras_parameterized.TestCase):
+
+  @parameterized.named_parameters(('unfused', False), ('fused', True))
+  def test_matches_fit(self, fuse):
+    x = np.random.random((20, 3))
+    y = np.random.random((20, 1))
+    models = [_get_model(seed) for seed in range(3)]
+    reference_models = [_get_model(seed) for seed in range(3)]
+
+    histories = multi_model_training.fit_many(
+        models, x, y, batch_size=5, epochs=2, shuffle=False, verbose=0,
+        fuse=fuse)
+    self.assertLen(histories, 3)
+    for model, reference_model, history in zip(models, reference_models,
+                                                histories):
+      reference_history = reference_model.fit(
+          x, y, batch_size=5, epochs=2, shuffle=False, verbose=0)
+      self.assertAllClose(history.history, reference_history.history)
+      self.assertAllClose(model.get_weights(), reference_model.get_weights())
+      self.assertEqual(model._train_counter.numpy(), 8)
+
+  @parameterized.named_parameters(('unfused', False), ('fused', True))
+  def test_steps_per_execution(self, fuse):
+    # 4 steps per epoch, so the last execution of every epoch runs 1 step.
+    x = np.random.random((20, 3))
+    y = np.random.random((20, 1))
+    models = [_get_model(seed, steps_per_execution=3) for seed in range(2)]
+    reference_models = [
+        _get_model(seed, steps_per_execution=3) for seed in range(2)]
+
+    histories = multi_model_training.fit_many(
+        models, x, y, batch_size=5, epochs=2, shuffle=False, verbose=0,
+        fuse=fuse)
+    for model, reference_model, history in zip(models, reference_models,
+                                                histories):
+      reference_history = reference_model.fit(
+          x, y, batch_size=5, epochs=2, shuffle=False, verbose=0)
+      self.assertAllClose(history.history, reference_history.history)
+      self.assertAllClose(model.get_weights(), reference_model.get_weights())
+      self.assertEqual(model._train_counter.numpy(), 8)
+      self.assertEqual(model._steps_per_execution.numpy(), 3)
+
+  def test_data_is_read_once(self):
+    num_reads = [0]
+
+    def generator():
+      for _ in range(4):
+        num_reads[0] += 1
+        yield np.ones((5, 3)), np.ones((5, 1))
+
+    dataset = tf.data.Dataset.from_generator(
+        generator,
+        output_signature=(tf.TensorSpec((None, 3), tf.float64),
+                          tf.TensorSpec((None, 1), tf.float64)))
+    models = [_get_model(seed) for seed in range(3)]
+    multi_model_training.fit_many(models, dataset, epochs=2, verbose=0)
+    self.assertEqual(num_reads[0], 8)
+
+  def test_models_stop_independently(self):
+    x = np.random.random((20, 3))
+    y = np.random.random((20, 1))
+    models = [_get_model(seed) for seed in range(2)]
+    histories = multi_model_training.fit_many(
+        models, x, y, batch_size=5, epochs=3, verbose=0,
+        validation_data=(x, y),
+        callbacks=[[_StopAfterEpoch(0)], []])
+    self.assertLen(histories[0].history['loss'], 1)
+    self.assertLen(histories[1].history['loss'], 3)
+    self.assertLen(histories[1].history['val_mae'], 3)
+
+  def test_invalid_arguments(self):
+    models = [_get_model(seed) for seed in range(2)]
+    x, y = np.ones((4, 3)), np.ones((4, 1))
+    with self.assertRaisesRegex(ValueError, 'one list of callbacks per model'):
+      multi_model_training.fit_many(models, x, y, callbacks=[[]])
+    with self.assertRaisesRegex(ValueError, 'at least one model'):
+      multi_model_training.fit_many([], x, y)
+    models[1].compile('sgd', 'mse', steps_per_execution=2)
+    with self.assertRaisesRegex(ValueError, 'same `steps_per_execution`'):
+      multi_model_training.fit_many(models, x, y)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -229,6 +229,8 @@ class Sequential(functional.Functional):
     else:
       self._self_tracked_trackables.append(layer)
       self._handle_deferred_layer_dependencies([layer])
+      # The graph built for an inferred input shape, if any, is now stale.
+      self._structural_index_cache = None
 
     self._layer_call_argspecs[layer] = tf_inspect.getfullargspec(layer.call)
 
@@ -245,6 +247,7 @@ class Sequential(functional.Functional):
 
     layer = self._self_tracked_trackables.pop()
     self._layer_call_argspecs.pop(layer)
+    self._structural_index_cache = None
     if not self.layers:
       self.outputs = None
       self.inputs = None
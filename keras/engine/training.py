@@ -16,12 +16,15 @@
 
 import tensorflow.compat.v2 as tf
 
+import contextlib
 import copy
 import itertools
 import json
 import os
 import warnings
 import weakref
+
+import numpy as np
 from tensorflow.python.eager import context
 from keras import backend
 from keras import callbacks as callbacks_module
@@ -61,6 +64,10 @@ except ImportError:
   h5py = None
 # pylint: enable=g-import-not-at-top
 
+# Upper bound of the number of batches per execution picked with
+# `steps_per_execution='auto'`.
+_MAX_AUTO_STEPS_PER_EXECUTION = 100
+
 
 @keras_export('keras.Model', 'keras.models.Model')
 class Model(base_layer.Layer, version_utils.ModelVersionSelector):
@@ -277,6 +284,10 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
     self._trackable_saver = saver_with_op_caching(self)
 
     self._steps_per_execution = None
+    self._auto_steps_per_execution = False
+    # Untracked Variable accumulating the seconds spent waiting for input in
+    # `train_function`. Set by `StepTimeProfiler`.
+    self._input_wait_time = None
 
     self._init_batch_counters()
     self._base_model_initialized = True
@@ -291,6 +302,17 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
     self._predict_counter = tf.Variable(
         0, dtype='int64', aggregation=agg)
 
+  @tf.__internal__.tracking.no_automatic_dependency_tracking
+  def _set_input_wait_time(self, variable):
+    """Sets the untracked Variable `train_function` adds input waits to.
+
+    The train function needs to be recreated for the change to take effect.
+
+    Args:
+      variable: A float64 `tf.Variable`, or `None` to stop timing.
+    """
+    self._input_wait_time = variable
+
   def __setattr__(self, name, value):
     if not getattr(self, '_self_setattr_tracking', True):
       super(Model, self).__setattr__(name, value)
@@ -554,10 +576,10 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           this as `None` unless your `Model` cannot be run inside a
           `tf.function`. `run_eagerly=True` is not supported when using
           `tf.distribute.experimental.ParameterServerStrategy`.
-        steps_per_execution: Int. Defaults to 1. The number of batches to
-          run during each `tf.function` call. Running multiple batches
-          inside a single `tf.function` call can greatly improve performance
-          on TPUs or small models with a large Python overhead.
+        steps_per_execution: Int or `'auto'`. Defaults to 1. The number of
+          batches to run during each `tf.function` call. Running multiple
+          batches inside a single `tf.function` call can greatly improve
+          performance on TPUs or small models with a large Python overhead.
           At most, one full epoch will be run each
           execution. If a number larger than the size of the epoch is passed,
           the execution will be truncated to the size of the epoch.
@@ -565,6 +587,11 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           `Callback.on_batch_begin` and `Callback.on_batch_end` methods
           will only be called every `N` batches
           (i.e. before/after each `tf.function` execution).
+          With `'auto'`, `fit`, `evaluate` and `predict` run as many batches
+          per execution as their callbacks allow: the largest number with
+          which the batch hooks of every callback are still called as often
+          as its `Callback.batch_hook_freq` requires (up to 100 batches, and
+          1 batch when the size of the data is unknown).
         **kwargs: Arguments supported for backwards compatibility only.
     """
     base_layer.keras_api_gauge.get_cell('compile').set(True)
@@ -639,11 +666,48 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
 
   @tf.__internal__.tracking.no_automatic_dependency_tracking
   def _configure_steps_per_execution(self, steps_per_execution):
+    # With 'auto', the value is set by `_auto_steps_per_execution_scope` while
+    # running `fit`, `evaluate` and `predict`, and is 1 otherwise.
+    self._auto_steps_per_execution = steps_per_execution == 'auto'
+    if self._auto_steps_per_execution:
+      steps_per_execution = 1
     self._steps_per_execution = tf.Variable(
         steps_per_execution,
         dtype='int64',
         aggregation=tf.VariableAggregation.ONLY_FIRST_REPLICA)
 
+  @contextlib.contextmanager
+  def _auto_steps_per_execution_scope(self, callbacks, mode, steps):
+    """Sets `steps_per_execution` from the callbacks, if compiled with 'auto'.
+
+    The value is the largest number of batches per execution with which every
+    batch hook of `callbacks` is called when due, see
+    `Callback.batch_hook_freq`. The previous value is restored on exit.
+
+    Args:
+      callbacks: The `CallbackList` of the loop.
+      mode: One of `ModeKeys.TRAIN`, `ModeKeys.TEST` or `ModeKeys.PREDICT`.
+      steps: Number of steps of the epoch, or `None` if unknown.
+
+    Yields:
+      Nothing.
+    """
+    if not self._auto_steps_per_execution:
+      yield
+      return
+    # `steps_per_execution > 1` requires the number of steps to be known.
+    steps_per_execution = 1
+    if steps is not None:
+      interval = callbacks._get_batch_hook_interval(mode)  # pylint: disable=protected-access
+      steps_per_execution = max(
+          1, min(interval or _MAX_AUTO_STEPS_PER_EXECUTION, steps))
+    previous_value = self._steps_per_execution.numpy().item()
+    self._steps_per_execution.assign(steps_per_execution)
+    try:
+      yield
+    finally:
+      self._steps_per_execution.assign(previous_value)
+
   @property
   def _should_compute_mask(self):
     return False
@@ -893,7 +957,10 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           model._train_counter.assign_add(1)  # pylint: disable=protected-access
         return outputs
 
-      data = next(iterator)
+      if model._input_wait_time is None:  # pylint: disable=protected-access
+        data = next(iterator)
+      else:
+        data = _timed_next(iterator, model._input_wait_time)  # pylint: disable=protected-access
       outputs = model.distribute_strategy.run(run_step, args=(data,))
       outputs = reduce_per_replica(
           outputs, self.distribute_strategy, reduction='first')
@@ -902,7 +969,8 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
 
     # Special case if steps_per_execution is one.
     if (self._steps_per_execution is None or
-        self._steps_per_execution.numpy().item() == 1):
+        (self._steps_per_execution.numpy().item() == 1 and
+         not self._auto_steps_per_execution)):
 
       def train_function(iterator):
         """Runs a training execution with a single step."""
@@ -1260,7 +1328,9 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       for epoch, iterator in data_handler.enumerate_epochs():
         self.reset_metrics()
         callbacks.on_epoch_begin(epoch)
-        with data_handler.catch_stop_iteration():
+        with data_handler.catch_stop_iteration(), \
+             self._auto_steps_per_execution_scope(
+                 callbacks, ModeKeys.TRAIN, data_handler.inferred_steps):
           for step in data_handler.steps():
             with tf.profiler.experimental.Trace(
                 'train',
@@ -1416,7 +1486,8 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
 
     # Special case if steps_per_execution is one.
     if (self._steps_per_execution is None or
-        self._steps_per_execution.numpy().item() == 1):
+        (self._steps_per_execution.numpy().item() == 1 and
+         not self._auto_steps_per_execution)):
 
       def test_function(iterator):
         """Runs a test execution with a single step."""
@@ -1610,7 +1681,9 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       callbacks.on_test_begin()
       for _, iterator in data_handler.enumerate_epochs():  # Single epoch.
         self.reset_metrics()
-        with data_handler.catch_stop_iteration():
+        with data_handler.catch_stop_iteration(), \
+             self._auto_steps_per_execution_scope(
+                 callbacks, ModeKeys.TEST, data_handler.inferred_steps):
           for step in data_handler.steps():
             with tf.profiler.experimental.Trace('test', step_num=step, _r=1):
               callbacks.on_test_batch_begin(step)
@@ -1695,7 +1768,8 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
 
     # Special case if steps_per_execution is one.
     if (self._steps_per_execution is None or
-        self._steps_per_execution.numpy().item() == 1):
+        (self._steps_per_execution.numpy().item() == 1 and
+         not self._auto_steps_per_execution)):
 
       def predict_function(iterator):
         """Runs an evaluation execution with a single step."""
@@ -1874,7 +1948,9 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       callbacks.on_predict_begin()
       batch_outputs = None
       for _, iterator in data_handler.enumerate_epochs():  # Single epoch.
-        with data_handler.catch_stop_iteration():
+        with data_handler.catch_stop_iteration(), \
+             self._auto_steps_per_execution_scope(
+                 callbacks, ModeKeys.PREDICT, data_handler.inferred_steps):
           for step in data_handler.steps():
             callbacks.on_predict_batch_begin(step)
             tmp_batch_outputs = self.predict_function(iterator)
@@ -2705,29 +2781,94 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
     Returns:
         A layer instance.
     """
-    # TODO(fchollet): We could build a dictionary based on layer names
-    # since they are constant, but we have not done that yet.
     if index is not None and name is not None:
       raise ValueError('Provide only a layer name or a layer index. Received: '
                        f'index={index}, name={name}.')
 
     if index is not None:
-      if len(self.layers) <= index:
+      layers = self.layers
+      if len(layers) <= index:
         raise ValueError(f'Was asked to retrieve layer at index {str(index)}'
-                         f' but model only has {str(len(self.layers))}'
+                         f' but model only has {str(len(layers))}'
                          ' layers.')
       else:
-        return self.layers[index]
+        return layers[index]
 
     if name is not None:
-      for layer in self.layers:
-        if layer.name == name:
-          return layer
+      layers = self._get_layers_by_name().get(name)
+      if layers:
+        return layers[0]
       raise ValueError(f'No such layer: {name}. Existing layers are '
                        f'{self.layers}.')
     raise ValueError('Provide either a layer name or layer index at '
                      '`get_layer`.')
 
+  def _get_layers_by_name(self):
+    """Returns a dict mapping layer names to the list of layers with that name.
+
+    Graph networks cache the dict until their graph changes. For other models,
+    it is built from `self.layers` on every call.
+    """
+    if self._is_graph_network:
+      return self._structural_index.layers_by_name
+    layers_by_name = {}
+    for layer in self.layers:
+      layers_by_name.setdefault(layer.name, []).append(layer)
+    return layers_by_name
+
+  def set_weights_by_name(self, weights, skip_mismatch=False):
+    """Sets the values of weights of the model, looked up by name.
+
+    Unlike `set_weights`, only the given weights are assigned, and their order
+    does not matter. All values are assigned in a single batched call.
+
+    ```python
+    model.set_weights_by_name({
+        'dense/kernel:0': np.ones((3, 4)),
+        'dense/bias:0': np.zeros((4,)),
+    })
+    ```
+
+    Args:
+        weights: Dict mapping weight names, as given by `weight.name` for the
+          weights in `Model.weights`, to NumPy arrays with the shapes of these
+          weights.
+        skip_mismatch: Boolean, whether to skip, with a warning, the names
+          that do not match exactly one weight of the model and the values
+          whose shape does not match the shape of their weight, instead of
+          raising an error.
+
+    Raises:
+        ValueError: If a name does not match exactly one weight of the model,
+          or if a value does not have the shape of its weight, and
+          `skip_mismatch` is False.
+    """
+    weights_by_name = {}
+    for weight in self.weights:
+      weights_by_name.setdefault(weight.name, []).append(weight)
+
+    weight_value_tuples = []
+    for name, value in weights.items():
+      matches = weights_by_name.get(name, [])
+      if len(matches) != 1:
+        message = (f'Weight name "{name}" matches {len(matches)} weights of '
+                   f'model {self.name}. Names must match exactly one weight.')
+        if skip_mismatch:
+          logging.warning('Skipping weight: ' + message)
+          continue
+        raise ValueError(message)
+      weight = matches[0]
+      value = np.asarray(value)
+      if not weight.shape.is_compatible_with(value.shape):
+        message = (f'Weight {name} expects shape {weight.shape}. Received '
+                   f'value with shape {value.shape}.')
+        if skip_mismatch:
+          logging.warning('Skipping weight: ' + message)
+          continue
+        raise ValueError(message)
+      weight_value_tuples.append((weight, value))
+    backend.batch_set_value(weight_value_tuples)
+
   @tf.__internal__.tracking.no_automatic_dependency_tracking
   def _set_save_spec(self, inputs, args=None, kwargs=None):
     """Defines the save spec so that serialization is able to trace model call.
@@ -3146,6 +3287,16 @@ def write_scalar_summaries(logs, step):
       tf.summary.scalar('batch_' + name, value, step=step)
 
 
+def _timed_next(iterator, input_wait_time):
+  """Gets the next element of `iterator`, adding the wait to `input_wait_time`."""
+  start = tf.timestamp()
+  with tf.control_dependencies([start]):
+    data = next(iterator)
+  with tf.control_dependencies(tf.nest.flatten(data, expand_composites=True)):
+    input_wait_time.assign_add(tf.timestamp() - start)
+  return data
+
+
 def _minimum_control_deps(outputs):
   """Returns the minimum control dependencies to ensure step succeeded."""
   if tf.executing_eagerly():
@@ -24,10 +24,64 @@ from __future__ import print_function
 import tensorflow.compat.v2 as tf
 
 import collections
+import contextlib
 import re
+import threading
 from keras.engine.base_layer import Layer
 from keras.utils import generic_utils
 
+_shared_transformation_caches = threading.local()
+
+
+@contextlib.contextmanager
+def shared_transformation_cache_scope():
+  """Shares feature transformations between the feature layers in the scope.
+
+  Feature layers called in this scope on the same features, e.g. the
+  `DenseFeatures` layers of the towers of a `WideDeepModel`, use a single
+  `FeatureTransformationCache`. Transformations of columns shared between the
+  layers, such as hashed or crossed categorical columns, then only run once.
+  The scope should only cover a single batch of features.
+
+  Yields:
+    Nothing.
+  """
+  caches = getattr(_shared_transformation_caches, 'caches', None)
+  if caches is not None:
+    # Nested scopes share the caches of the outermost scope.
+    yield
+    return
+  _shared_transformation_caches.caches = {}
+  try:
+    yield
+  finally:
+    _shared_transformation_caches.caches = None
+
+
+def get_transformation_cache(features):
+  """Returns a `FeatureTransformationCache` for a dict of features.
+
+  In a `shared_transformation_cache_scope`, the same cache is returned for
+  dicts with the same keys and tensors.
+
+  Args:
+    features: A mapping from key to tensors.
+
+  Returns:
+    A `FeatureTransformationCache`.
+  """
+  caches = getattr(_shared_transformation_caches, 'caches', None)
+  if caches is None:
+    return tf.__internal__.feature_column.FeatureTransformationCache(features)
+  # Feature layers receive copies of the features dict, but the same tensors.
+  key = frozenset((name, id(value)) for name, value in features.items())
+  if key not in caches:
+    # The features are kept alive so that the ids in the key stay valid.
+    caches[key] = (
+        features,
+        tf.__internal__.feature_column.FeatureTransformationCache(features))
+  return caches[key][1]
+
 
 class _BaseFeaturesLayer(Layer):
   """Base class for DenseFeatures and SequenceFeatures.
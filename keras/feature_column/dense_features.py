@@ -157,7 +157,7 @@ class DenseFeatures(kfc._BaseFeaturesLayer):  # pylint: disable=protected-access
     if not isinstance(features, dict):
       raise ValueError('We expected a dictionary here. Instead we got: ',
                        features)
-    transformation_cache = tf.__internal__.feature_column.FeatureTransformationCache(features)
+    transformation_cache = kfc.get_transformation_cache(features)
     output_tensors = []
     for column in self._feature_columns:
       with backend.name_scope(column.name):
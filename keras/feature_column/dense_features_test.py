@@ -26,6 +26,7 @@ from tensorflow.python.eager import backprop
 from tensorflow.python.framework import test_util
 from keras import combinations
 from keras import keras_parameterized
+from keras.feature_column import base_feature_layer as kfc
 from keras.feature_column import dense_features as df
 
 
@@ -327,6 +328,39 @@ class DenseFeaturesTest(keras_parameterized.TestCase):
       self.assertAllClose([[3.], [4.]], self.evaluate(cols_dict[price2]))
       self.assertAllClose([[1., 2., 3.], [5., 6., 4.]], self.evaluate(net))
 
+  def test_shared_transformation_cache_scope(self):
+    hashed = tf.feature_column.categorical_column_with_hash_bucket(
+        'keywords', 10)
+    price = tf.feature_column.numeric_column('price')
+
+    def count_hash_ops(graph):
+      return len([
+          op for op in graph.get_operations()
+          if op.type == 'StringToHashBucketFast'
+      ])
+
+    for shared in (False, True):
+      with tf.Graph().as_default() as g:
+        features = {
+            'keywords': tf.constant([['a'], ['b']]),
+            'price': tf.constant([[1.], [2.]]),
+        }
+        tower_1 = df.DenseFeatures(
+            [tf.feature_column.indicator_column(hashed), price])
+        tower_2 = df.DenseFeatures(
+            [tf.feature_column.embedding_column(hashed, 2)])
+        if shared:
+          with kfc.shared_transformation_cache_scope():
+            net_1, net_2 = tower_1(features), tower_2(features)
+          self.assertEqual(1, count_hash_ops(g))
+        else:
+          net_1, net_2 = tower_1(features), tower_2(features)
+          self.assertEqual(2, count_hash_ops(g))
+
+        self.evaluate(tf.compat.v1.global_variables_initializer())
+        self.assertAllEqual([2, 11], self.evaluate(net_1).shape)
+        self.assertAllEqual([2, 2], self.evaluate(net_2).shape)
+
   def test_column_order(self):
     price_a = tf.feature_column.numeric_column('price_a')
     price_b = tf.feature_column.numeric_column('price_b')
@@ -143,7 +143,7 @@ class SequenceFeatures(kfc._BaseFeaturesLayer):
                        features)
     if training is None:
       training = backend.learning_phase()
-    transformation_cache = tf.__internal__.feature_column.FeatureTransformationCache(features)
+    transformation_cache = kfc.get_transformation_cache(features)
     output_tensors = []
     sequence_lengths = []
 
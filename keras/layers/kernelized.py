@@ -100,6 +100,26 @@ class RandomFourierFeatures(base_layer.Layer):
   )
   ```
 
+  With a large `output_dim`, the random features can be computed in blocks of
+  columns, from a kernel generated on the fly from a seed instead of stored in
+  a variable, and multiplied with the downstream linear layer block by block,
+  so that the full `[batch_size, output_dim]` features are never
+  materialized:
+
+  ```python
+  model = keras.Sequential([
+    keras.Input(shape=(784,)),
+    RandomFourierFeatures(
+        output_dim=100000,
+        scale=10.,
+        kernel_initializer='gaussian',
+        seed=1337,
+        block_size=4096,
+        units=10),
+    layers.Activation('softmax'),
+  ])
+  ```
+
   To use another kernel, just replace the layer creation line with:
 
   ```python
@@ -132,9 +152,32 @@ class RandomFourierFeatures(base_layer.Layer):
         by making `scale` trainable, the resulting optimization problem is
         no longer convex (even if the loss function used by the linear model
         is convex).
-    trainable: Whether the scaling parameter of the layer should be trainable.
-      Defaults to `False`.
+    trainable: Whether the scaling parameter of the layer should be
+      trainable. Defaults to `False`. If `units` is set and `scale_trainable`
+      is not, this only applies to the scaling parameter, and the layer is
+      trainable so that the projection kernel is trained.
     name: String, name to use for this layer.
+    seed: Optional integer. If provided, the kernel of the random features map
+      is not stored in a variable, but generated deterministically from the
+      seed every time the layer is called, one block of columns at a time.
+      This requires `kernel_initializer` to be 'gaussian' or 'laplacian'. The
+      generated kernel depends on both `seed` and `block_size`.
+    block_size: Optional positive integer. If provided, the random features
+      are computed in blocks of `block_size` columns, which bounds the size of
+      the intermediate tensors, and of the generated kernel if `seed` is set.
+      Defaults to a single block of `output_dim` columns.
+    units: Optional positive integer. If provided, the random features are
+      multiplied with a `[output_dim, units]` kernel, initialized like the
+      kernel of `Dense`, and the layer outputs `[batch_size, units]`. This is
+      equivalent to a `Dense(units, use_bias=False)` layer on top of the
+      random features, except that the features are computed and multiplied
+      one block at a time, and recomputed during backpropagation instead of
+      being stored. The projection kernel is trained like the kernel of
+      `Dense`, whenever the layer is trainable.
+    scale_trainable: Optional boolean, only used if `units` is set. Whether
+      the scaling parameter should be trainable, in which case `trainable` is
+      the usual flag of the layer, which also freezes the projection kernel
+      when `False`. Defaults to `trainable`.
   """
 
   def __init__(self,
@@ -143,6 +186,10 @@ class RandomFourierFeatures(base_layer.Layer):
                scale=None,
                trainable=False,
                name=None,
+               seed=None,
+               block_size=None,
+               units=None,
+               scale_trainable=None,
                **kwargs):
     if output_dim <= 0:
       raise ValueError(
@@ -155,11 +202,31 @@ class RandomFourierFeatures(base_layer.Layer):
     if scale is not None and scale <= 0.0:
       raise ValueError('When provided, `scale` should be a positive float. '
                        f'Received: {scale}')
+    if seed is not None and not isinstance(kernel_initializer, str):
+      raise ValueError(
+          'When `seed` is provided, `kernel_initializer` should be one of '
+          f'{_SUPPORTED_RBF_KERNEL_TYPES}. Received: {kernel_initializer}')
+    if block_size is not None and block_size <= 0:
+      raise ValueError('When provided, `block_size` should be a positive '
+                       f'integer. Received: {block_size}')
+    if units is not None and units <= 0:
+      raise ValueError('When provided, `units` should be a positive integer. '
+                       f'Received: {units}')
+    if scale_trainable is None:
+      scale_trainable = trainable
+      # The layer is trainable so that its projection kernel is trained, and
+      # `trainable` only determines whether the scale is trained.
+      if units is not None:
+        trainable = True
     super(RandomFourierFeatures, self).__init__(
         trainable=trainable, name=name, **kwargs)
+    self.scale_trainable = scale_trainable
     self.output_dim = output_dim
     self.kernel_initializer = kernel_initializer
     self.scale = scale
+    self.seed = seed
+    self.block_size = block_size
+    self.units = units
 
   def build(self, input_shape):
     input_shape = tf.TensorShape(input_shape)
@@ -178,15 +245,18 @@ class RandomFourierFeatures(base_layer.Layer):
         ndim=2, axes={1: input_shape.dims[1].value})
     input_dim = input_shape.dims[1].value
 
-    kernel_initializer = _get_random_features_initializer(
-        self.kernel_initializer, shape=(input_dim, self.output_dim))
+    if self.seed is None:
+      kernel_initializer = _get_random_features_initializer(
+          self.kernel_initializer, shape=(input_dim, self.output_dim))
 
-    self.unscaled_kernel = self.add_weight(
-        name='unscaled_kernel',
-        shape=(input_dim, self.output_dim),
-        dtype=tf.float32,
-        initializer=kernel_initializer,
-        trainable=False)
+      self.unscaled_kernel = self.add_weight(
+          name='unscaled_kernel',
+          shape=(input_dim, self.output_dim),
+          dtype=tf.float32,
+          initializer=kernel_initializer,
+          trainable=False)
+    else:
+      self.unscaled_kernel = None
 
     self.bias = self.add_weight(
         name='bias',
@@ -202,18 +272,74 @@ class RandomFourierFeatures(base_layer.Layer):
         shape=(1,),
         dtype=tf.float32,
         initializer=tf.compat.v1.constant_initializer(self.scale),
-        trainable=True,
+        trainable=self.units is None or self.scale_trainable,
         constraint='NonNeg')
+
+    if self.units is not None:
+      self.projection_kernel = self.add_weight(
+          name='projection_kernel',
+          shape=(self.output_dim, self.units),
+          dtype=tf.float32,
+          initializer='glorot_uniform',
+          trainable=True)
     super(RandomFourierFeatures, self).build(input_shape)
 
   def call(self, inputs):
     inputs = tf.convert_to_tensor(inputs, dtype=self.dtype)
     inputs = tf.cast(inputs, tf.float32)
-    kernel = (1.0 / self.kernel_scale) * self.unscaled_kernel
+    block_size = self.block_size or self.output_dim
+    blocks = [(start, min(start + block_size, self.output_dim))
+              for start in range(0, self.output_dim, block_size)]
+    if self.units is None:
+      outputs = [self._random_features(inputs, start, end)
+                 for start, end in blocks]
+      if len(outputs) == 1:
+        return outputs[0]
+      return tf.concat(outputs, axis=1)
+
+    outputs = []
+    for start, end in blocks:
+
+      def project(inputs, kernel_scale, projection_kernel, start=start,
+                  end=end):
+        features = self._random_features(inputs, start, end, kernel_scale)
+        return tf.matmul(features, projection_kernel)
+
+      # The features are recomputed during backpropagation, so that only one
+      # block of features is alive at a time.
+      outputs.append(
+          tf.recompute_grad(project)(
+              inputs, tf.convert_to_tensor(self.kernel_scale),
+              self.projection_kernel[start:end]))
+    return tf.add_n(outputs)
+
+  def _random_features(self, inputs, start, end, kernel_scale=None):
+    """Returns the random features of the columns `start` to `end`."""
+    if kernel_scale is None:
+      kernel_scale = self.kernel_scale
+    if start == 0 and end == self.output_dim:
+      bias = self.bias
+    else:
+      bias = self.bias[start:end]
+    kernel = (1.0 / kernel_scale) * self._get_unscaled_kernel(
+        inputs.shape[-1], start, end)
     outputs = tf.matmul(a=inputs, b=kernel)
-    outputs = tf.nn.bias_add(outputs, self.bias)
+    outputs = tf.nn.bias_add(outputs, bias)
     return tf.cos(outputs)
 
+  def _get_unscaled_kernel(self, input_dim, start, end):
+    """Returns the columns `start` to `end` of the unscaled kernel."""
+    if self.unscaled_kernel is not None:
+      if start == 0 and end == self.output_dim:
+        return self.unscaled_kernel
+      return self.unscaled_kernel[:, start:end]
+    # Every block of columns is generated from its own seed.
+    block_index = start // (self.block_size or self.output_dim)
+    return _get_stateless_random_features(
+        self.kernel_initializer,
+        shape=(input_dim, end - start),
+        seed=(self.seed, block_index))
+
   def compute_output_shape(self, input_shape):
     input_shape = tf.TensorShape(input_shape)
     input_shape = input_shape.with_rank(2)
@@ -221,6 +347,8 @@ class RandomFourierFeatures(base_layer.Layer):
       raise ValueError(
           'The last dimension of the input tensor should be defined. '
           f'Found `None`. Full input shape received: {input_shape}')
+    if self.units is not None:
+      return input_shape[:-1].concatenate(self.units)
     return input_shape[:-1].concatenate(self.output_dim)
 
   def get_config(self):
@@ -231,6 +359,10 @@ class RandomFourierFeatures(base_layer.Layer):
         'output_dim': self.output_dim,
         'kernel_initializer': kernel_initializer,
         'scale': self.scale,
+        'seed': self.seed,
+        'block_size': self.block_size,
+        'units': self.units,
+        'scale_trainable': self.scale_trainable,
     }
     base_config = super(RandomFourierFeatures, self).get_config()
     return dict(list(base_config.items()) + list(config.items()))
@@ -258,6 +390,16 @@ def _get_random_features_initializer(initializer, shape):
   return random_features_initializer
 
 
+def _get_stateless_random_features(initializer, shape, seed):
+  """Returns random features parameters generated deterministically."""
+  if initializer.lower() == 'gaussian':
+    return tf.random.stateless_normal(shape, seed=seed, dtype=tf.float32)
+  # Samples of the standard Cauchy distribution, as in
+  # `_get_random_features_initializer`.
+  probs = tf.random.stateless_uniform(shape, seed=seed, dtype=tf.float32)
+  return tf.tan(np.pi * (probs - 0.5))
+
+
 def _get_default_scale(initializer, input_dim):
   if (isinstance(initializer, str) and
       initializer.lower() == 'gaussian'):
@@ -226,6 +226,10 @@ class RandomFourierFeaturesTest(tf.test.TestCase, parameterized.TestCase):
         'name': 'random_fourier_features',
         'trainable': trainable,
         'dtype': expected_dtype,
+        'seed': None,
+        'block_size': None,
+        'units': None,
+        'scale_trainable': trainable,
     }
     self.assertLen(expected_config, len(rff_layer.get_config()))
     self.assertSameElements(
@@ -381,5 +385,115 @@ class RandomFourierFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     self._assert_all_close(approx_kernel_matrix, exact_kernel_matrix, atol=0.05)
 
 
+@combinations.generate(combinations.combine(mode=['eager']))
+class BlockRandomFourierFeaturesTest(tf.test.TestCase, parameterized.TestCase):
+
+  def test_invalid_arguments(self):
+    with self.assertRaisesRegex(ValueError, 'When `seed` is provided'):
+      _ = kernel_layers.RandomFourierFeatures(
+          10, tf.compat.v1.ones_initializer(), seed=1)
+    with self.assertRaisesRegex(ValueError, '`block_size` should be'):
+      _ = kernel_layers.RandomFourierFeatures(10, block_size=0)
+    with self.assertRaisesRegex(ValueError, '`units` should be'):
+      _ = kernel_layers.RandomFourierFeatures(10, units=-1)
+
+  def test_blocks_match_single_block(self):
+    inputs = tf.random.uniform((3, 4), seed=1)
+    rff_layer = kernel_layers.RandomFourierFeatures(output_dim=10)
+    block_rff_layer = kernel_layers.RandomFourierFeatures(
+        output_dim=10, block_size=3)
+    rff_layer.build(inputs.shape)
+    block_rff_layer.build(inputs.shape)
+    block_rff_layer.set_weights(rff_layer.get_weights())
+    self.assertAllClose(rff_layer(inputs), block_rff_layer(inputs))
+
+  @parameterized.named_parameters(('gaussian', 'gaussian'),
+                                  ('laplacian', 'laplacian'))
+  def test_seeded_kernel(self, initializer):
+    inputs = tf.random.uniform((3, 4), seed=1)
+    rff_layer = kernel_layers.RandomFourierFeatures(
+        output_dim=10, kernel_initializer=initializer, seed=7, block_size=4)
+    outputs = rff_layer(inputs)
+    self.assertListEqual([3, 10], outputs.shape.as_list())
+    # Only the bias and the scale are stored.
+    self.assertLen(rff_layer.weights, 2)
+    self.assertAllClose(outputs, tf.function(rff_layer)(inputs))
+
+    # The kernel only depends on the seed.
+    other_rff_layer = kernel_layers.RandomFourierFeatures.from_config(
+        rff_layer.get_config())
+    other_rff_layer.build(inputs.shape)
+    other_rff_layer.set_weights(rff_layer.get_weights())
+    self.assertAllClose(outputs, other_rff_layer(inputs))
+
+  def test_units(self):
+    inputs = tf.random.uniform((3, 4), seed=1)
+    rff_layer = kernel_layers.RandomFourierFeatures(
+        output_dim=10, seed=7, block_size=4, trainable=True)
+    projected_rff_layer = kernel_layers.RandomFourierFeatures(
+        output_dim=10, seed=7, block_size=4, units=2, trainable=True)
+    self.assertEqual([None, 2],
+                     projected_rff_layer.compute_output_shape(
+                         (None, 4)).as_list())
+    rff_layer.build(inputs.shape)
+    projected_rff_layer.build(inputs.shape)
+    rff_layer.set_weights(
+        [projected_rff_layer.kernel_scale, projected_rff_layer.bias])
+    projection_kernel = projected_rff_layer.projection_kernel
+
+    with tf.GradientTape(persistent=True) as tape:
+      expected = tf.matmul(rff_layer(inputs), projection_kernel)
+      outputs = projected_rff_layer(inputs)
+    self.assertAllClose(expected, outputs)
+    self.assertAllClose(
+        tape.gradient(expected, [rff_layer.kernel_scale, projection_kernel]),
+        tape.gradient(outputs, projected_rff_layer.trainable_weights))
+
+    @tf.function
+    def call_in_function(inputs):
+      return projected_rff_layer(inputs)
+
+    self.assertAllClose(outputs, call_in_function(inputs))
+
+  def test_units_projection_is_trainable(self):
+    rff_layer = kernel_layers.RandomFourierFeatures(
+        output_dim=10, seed=7, block_size=4, units=2)
+    rff_layer.build((None, 4))
+    # The scale is not trainable by default, but the projection kernel is.
+    self.assertLen(rff_layer.trainable_weights, 1)
+    self.assertIs(rff_layer.projection_kernel, rff_layer.trainable_weights[0])
+    rff_layer = kernel_layers.RandomFourierFeatures.from_config(
+        rff_layer.get_config())
+    rff_layer.build((None, 4))
+    self.assertLen(rff_layer.trainable_weights, 1)
+    self.assertIs(rff_layer.projection_kernel, rff_layer.trainable_weights[0])
+
+    rff_layer = kernel_layers.RandomFourierFeatures(
+        output_dim=10, seed=7, block_size=4, units=2, trainable=True)
+    rff_layer.build((None, 4))
+    self.assertLen(rff_layer.trainable_weights, 2)
+
+    # Freezing the layer freezes the projection kernel as well, and is kept
+    # by the config.
+    rff_layer.trainable = False
+    self.assertEmpty(rff_layer.trainable_weights)
+    rff_layer = kernel_layers.RandomFourierFeatures.from_config(
+        rff_layer.get_config())
+    rff_layer.build((None, 4))
+    self.assertFalse(rff_layer.trainable)
+    self.assertEmpty(rff_layer.trainable_weights)
+    rff_layer.trainable = True
+    self.assertLen(rff_layer.trainable_weights, 2)
+
+    # The scale and the layer trainability can be set separately.
+    rff_layer = kernel_layers.RandomFourierFeatures(
+        output_dim=10, seed=7, block_size=4, units=2, trainable=False,
+        scale_trainable=True)
+    rff_layer.build((None, 4))
+    self.assertFalse(rff_layer.trainable)
+    rff_layer.trainable = True
+    self.assertLen(rff_layer.trainable_weights, 2)
+
+
 if __name__ == '__main__':
   tf.test.main()
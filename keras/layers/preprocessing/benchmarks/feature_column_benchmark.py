@@ -15,6 +15,7 @@
 """Benchmark suite for KPL and feature column implementations."""
 
 import tensorflow.compat.v2 as tf
+import contextlib
 import itertools
 import math
 import random
@@ -24,6 +25,7 @@ import time
 import numpy as np
 
 import keras
+from keras.feature_column import base_feature_layer
 
 # This is required as of 3/2021 because otherwise we drop into graph mode.
 tf.compat.v1.enable_v2_behavior()
@@ -145,3 +147,40 @@ def run_fc(data, fc_fn, batch_size, num_runs, steps_per_repeat=100):
                        np.array(fc_starts)) / steps_per_repeat
   avg_time = np.mean(avg_per_step_time)
   return avg_time
+
+
+def run_multi_tower_fc(data, towers, batch_size, num_runs,
+                       steps_per_repeat=100):
+  """Benchmark feature layers called on the same features.
+
+  Args:
+    data: Dict of features.
+    towers: List of feature layers, e.g. `DenseFeatures`, called on every batch
+      of `data`.
+    batch_size: Integer, batch size.
+    num_runs: Integer, number of timed runs.
+    steps_per_repeat: Integer, number of steps per timed run.
+
+  Returns:
+    The average step times when the towers share their feature
+    transformations, and when they do not.
+  """
+
+  def make_fn(shared):
+
+    @tf.function
+    def fn(features):
+      if shared:
+        scope = base_feature_layer.shared_transformation_cache_scope()
+      else:
+        scope = contextlib.nullcontext()
+      with scope:
+        return [tower(features) for tower in towers]
+
+    return fn
+
+  shared_time = run_fc(data, make_fn(True), batch_size, num_runs,
+                       steps_per_repeat)
+  unshared_time = run_fc(data, make_fn(False), batch_size, num_runs,
+                         steps_per_repeat)
+  return shared_time, unshared_time
@@ -144,6 +144,56 @@ class BenchmarkLayer(tf.test.Benchmark):
     for batch in [32, 64, 256]:
       self.bm_layer_implementation(batch_size=batch)
 
+  def _images_per_sec(self, fn, images, num_repeats=5):
+    fn = tf.function(fn)
+    _ = fn(images)
+    starts = []
+    ends = []
+    for _ in range(num_repeats):
+      starts.append(time.time())
+      # Benchmarked code begins here.
+      _ = fn(images).numpy()
+      # Benchmarked code ends here.
+      ends.append(time.time())
+    avg_time = np.mean(np.array(ends) - np.array(starts))
+    return images.shape[0] / avg_time
+
+  def bm_per_sample_implementation(self, layer_cls, kwargs, batch_size):
+    """Compares per-sample parameters against per-batch and per-image loops."""
+    images = tf.constant(
+        np.random.random((batch_size, 256, 256, 3)), dtype=tf.float32)
+    per_batch_layer = layer_cls(**kwargs)
+    per_sample_layer = layer_cls(per_sample=True, **kwargs)
+    per_image_layer = layer_cls(**kwargs)
+
+    def per_image_loop(inputs):
+      return tf.map_fn(
+          lambda img: per_image_layer(img, training=True), inputs)
+
+    per_batch = self._images_per_sec(
+        lambda x: per_batch_layer(x, training=True), images)
+    per_sample = self._images_per_sec(
+        lambda x: per_sample_layer(x, training=True), images)
+    per_image = self._images_per_sec(per_image_loop, images)
+    name = "%s_per_sample|batch_%s" % (layer_cls.__name__, batch_size)
+    extras = {
+        "per-batch images/sec": per_batch,
+        "per-sample images/sec": per_sample,
+        "map_fn per-image images/sec": per_image,
+        "speedup over map_fn": per_sample / per_image,
+    }
+    self.report_benchmark(
+        iters=5, wall_time=batch_size / per_sample, extras=extras, name=name)
+
+  def benchmark_per_sample_by_batch(self):
+    for batch in [32, 64, 256]:
+      self.bm_per_sample_implementation(
+          image_preprocessing.RandomCrop, {"height": 224, "width": 224},
+          batch_size=batch)
+      self.bm_per_sample_implementation(
+          image_preprocessing.RandomContrast, {"factor": .2},
+          batch_size=batch)
+
 
 if __name__ == "__main__":
   tf.test.main()
@@ -0,0 +1,83 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark for feature columns shared by the towers of a multi-tower model."""
+
+import tensorflow.compat.v2 as tf
+
+import keras
+from keras.layers.preprocessing.benchmarks import feature_column_benchmark as fc_bm
+
+# This is required as of 3/2021 because otherwise we drop into graph mode.
+tf.compat.v1.enable_v2_behavior()
+
+NUM_REPEATS = 10
+BATCH_SIZES = [32, 256]
+
+
+def multi_tower(batch_size, max_length):
+  """Benchmark wide and deep towers sharing hashed and crossed columns."""
+  # Data and constants.
+  num_buckets = 10000
+  vocab = fc_bm.create_vocabulary(32768)
+  data_a = fc_bm.create_string_data(
+      max_length, batch_size * NUM_REPEATS, vocab, pct_oov=0.0)
+  data_b = fc_bm.create_string_data(
+      max_length, batch_size * NUM_REPEATS, vocab, pct_oov=0.0)
+
+  # Both towers use the same categorical columns.
+  hashed_a = tf.feature_column.categorical_column_with_hash_bucket(
+      "data_a", num_buckets)
+  hashed_b = tf.feature_column.categorical_column_with_hash_bucket(
+      "data_b", num_buckets)
+  crossed = tf.feature_column.crossed_column(["data_a", "data_b"], num_buckets)
+  categorical_columns = [hashed_a, hashed_b, crossed]
+  wide_tower = keras.layers.DenseFeatures([
+      tf.feature_column.indicator_column(column)
+      for column in categorical_columns
+  ])
+  deep_tower = keras.layers.DenseFeatures([
+      tf.feature_column.embedding_column(column, dimension=16)
+      for column in categorical_columns
+  ])
+
+  data = {
+      "data_a":
+          data_a.to_tensor(default_value="", shape=(batch_size, max_length)),
+      "data_b":
+          data_b.to_tensor(default_value="", shape=(batch_size, max_length)),
+  }
+  return fc_bm.run_multi_tower_fc(data, [wide_tower, deep_tower], batch_size,
+                                  NUM_REPEATS)
+
+
+class BenchmarkLayer(tf.test.Benchmark):
+  """Benchmark the towers forward pass."""
+
+  def benchmark_layer(self):
+    for batch in BATCH_SIZES:
+      name = "multi_tower|dense|batch_%s" % batch
+      shared_time, unshared_time = multi_tower(batch_size=batch, max_length=16)
+      self.report_benchmark(
+          iters=NUM_REPEATS,
+          wall_time=shared_time,
+          extras={
+              "unshared_avg_time": unshared_time,
+              "shared_faster_ratio": unshared_time / shared_time,
+          },
+          name=name)
+
+
+if __name__ == "__main__":
+  tf.test.main()
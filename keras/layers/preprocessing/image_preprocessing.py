@@ -195,8 +195,9 @@ class RandomCrop(base_layer.BaseRandomLayer):
   """A preprocessing layer which randomly crops images during training.
 
   During training, this layer will randomly choose a location to crop images
-  down to a target size. The layer will crop all the images in the same batch to
-  the same cropping location.
+  down to a target size. By default, the layer will crop all the images in the
+  same batch to the same cropping location. Set `per_sample=True` to draw an
+  independent cropping location for every image of the batch.
 
   At inference time, and during training if an input image is smaller than the
   target size, the input will be resized and cropped so as to return the largest
@@ -219,15 +220,18 @@ class RandomCrop(base_layer.BaseRandomLayer):
     height: Integer, the height of the output shape.
     width: Integer, the width of the output shape.
     seed: Integer. Used to create a random seed.
+    per_sample: Boolean. If `True`, every image of a batch is cropped at its own
+      random location, gathered in a single batched op. Defaults to `False`.
   """
 
-  def __init__(self, height, width, seed=None, **kwargs):
+  def __init__(self, height, width, seed=None, per_sample=False, **kwargs):
     base_preprocessing_layer.keras_kpl_gauge.get_cell('RandomCrop').set(True)
     super(RandomCrop, self).__init__(**kwargs, autocast=False, seed=seed,
                                      force_generator=True)
     self.height = height
     self.width = width
     self.seed = seed
+    self.per_sample = per_sample
 
   def call(self, inputs, training=True):
     if training is None:
@@ -245,8 +249,24 @@ class RandomCrop(base_layer.BaseRandomLayer):
       return tf.image.crop_to_bounding_box(inputs, h_start, w_start,
                                            self.height, self.width)
 
+    def random_crop_per_sample():
+      dtype = input_shape.dtype
+      rands = self._random_generator.random_uniform(
+          tf.stack([input_shape[0], 2]), 0, dtype.max, dtype)
+      h_starts = rands[:, 0] % (h_diff + 1)
+      w_starts = rands[:, 1] % (w_diff + 1)
+      # Gather the rows, then the columns, of every crop window at once.
+      rows = tf.expand_dims(h_starts, -1) + tf.range(self.height, dtype=dtype)
+      cols = tf.expand_dims(w_starts, -1) + tf.range(self.width, dtype=dtype)
+      outputs = tf.gather(inputs, rows, axis=1, batch_dims=1)
+      return tf.gather(outputs, cols, axis=2, batch_dims=1)
+
+    if self.per_sample and inputs.shape.rank == 4:
+      crop_fn = random_crop_per_sample
+    else:
+      crop_fn = random_crop
     outputs = tf.cond(
-        tf.reduce_all((training, h_diff >= 0, w_diff >= 0)), random_crop,
+        tf.reduce_all((training, h_diff >= 0, w_diff >= 0)), crop_fn,
         lambda: smart_resize(inputs, [self.height, self.width]))
     return tf.cast(outputs, inputs.dtype)
 
@@ -261,6 +281,7 @@ class RandomCrop(base_layer.BaseRandomLayer):
         'height': self.height,
         'width': self.width,
         'seed': self.seed,
+        'per_sample': self.per_sample,
     }
     base_config = super(RandomCrop, self).get_config()
     return dict(list(base_config.items()) + list(config.items()))
@@ -1085,7 +1106,9 @@ class RandomContrast(base_layer.BaseRandomLayer):
 
   This layer will randomly adjust the contrast of an image or images by a random
   factor. Contrast is adjusted independently for each channel of each image
-  during training.
+  during training. By default, the same random factor is used for all the
+  images of a batch. Set `per_sample=True` to draw an independent factor for
+  every image.
 
   For each channel, this layer computes the mean of the image pixels in the
   channel and then adjusts each component `x` of each pixel to
@@ -1108,9 +1131,11 @@ class RandomContrast(base_layer.BaseRandomLayer):
       float, lower = upper. The contrast factor will be randomly picked between
       `[1.0 - lower, 1.0 + upper]`.
     seed: Integer. Used to create a random seed.
+    per_sample: Boolean. If `True`, every image of a batch gets its own random
+      contrast factor, applied in a single batched op. Defaults to `False`.
   """
 
-  def __init__(self, factor, seed=None, **kwargs):
+  def __init__(self, factor, seed=None, per_sample=False, **kwargs):
     base_preprocessing_layer.keras_kpl_gauge.get_cell('RandomContrast').set(
         True)
     super(RandomContrast, self).__init__(seed=seed, force_generator=True,
@@ -1125,12 +1150,20 @@ class RandomContrast(base_layer.BaseRandomLayer):
       raise ValueError('Factor cannot have negative values or greater than 1.0,'
                        ' got {}'.format(factor))
     self.seed = seed
+    self.per_sample = per_sample
 
   def call(self, inputs, training=True):
     if training is None:
       training = backend.learning_phase()
 
     def random_contrasted_inputs():
+      if self.per_sample and inputs.shape.rank == 4:
+        factor_shape = tf.stack([tf.shape(inputs)[0], 1, 1, 1])
+        contrast_factor = self._random_generator.random_uniform(
+            shape=factor_shape,
+            minval=1. - self.lower,
+            maxval=1. + self.upper)
+        return adjust_contrast_per_sample(inputs, contrast_factor)
       seed = self._random_generator.make_seed_for_stateless_op()
       if seed is not None:
         return tf.image.stateless_random_contrast(
@@ -1152,11 +1185,36 @@ class RandomContrast(base_layer.BaseRandomLayer):
     config = {
         'factor': self.factor,
         'seed': self.seed,
+        'per_sample': self.per_sample,
     }
     base_config = super(RandomContrast, self).get_config()
     return dict(list(base_config.items()) + list(config.items()))
 
 
+def adjust_contrast_per_sample(images, contrast_factors):
+  """Adjusts the contrast of a batch of images with one factor per image.
+
+  This is the batched equivalent of calling `tf.image.adjust_contrast` on every
+  image with its own factor.
+
+  Args:
+    images: 4D tensor of shape `(batch, height, width, channels)`.
+    contrast_factors: float tensor broadcastable to `(batch, 1, 1, 1)`.
+
+  Returns:
+    The contrast-adjusted images, with the same dtype as `images`.
+  """
+  orig_dtype = images.dtype
+  if orig_dtype in (tf.float16, tf.float32):
+    flt_images = images
+  else:
+    flt_images = tf.image.convert_image_dtype(images, tf.float32)
+  contrast_factors = tf.cast(contrast_factors, flt_images.dtype)
+  means = tf.reduce_mean(flt_images, axis=[H_AXIS, W_AXIS], keepdims=True)
+  adjusted = (flt_images - means) * contrast_factors + means
+  return tf.image.convert_image_dtype(adjusted, orig_dtype, saturate=True)
+
+
 @keras_export('keras.layers.RandomHeight',
               'keras.layers.experimental.preprocessing.RandomHeight')
 class RandomHeight(base_layer.BaseRandomLayer):
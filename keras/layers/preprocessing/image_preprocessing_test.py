@@ -332,6 +332,29 @@ class RandomCropTest(keras_parameterized.TestCase):
   def test_random_crop_full_width(self):
     self._run_test(3, 8)
 
+  def test_training_per_sample_with_mock(self):
+    np.random.seed(1337)
+    height, width = 3, 4
+    offsets = np.stack([np.random.randint(low=0, high=3, size=12),
+                        np.random.randint(low=0, high=5, size=12)],
+                       axis=1).astype('int32')
+    with testing_utils.use_gpu():
+      layer = image_preprocessing.RandomCrop(height, width, per_sample=True)
+      with tf.compat.v1.test.mock.patch.object(
+          layer._random_generator, 'random_uniform', return_value=offsets):
+        inp = np.random.random((12, 5, 8, 3))
+        actual_output = layer(inp, training=True)
+        expected_output = np.stack([
+            img[h:(h + height), w:(w + width), :]
+            for img, (h, w) in zip(inp, offsets)
+        ])
+        self.assertAllClose(expected_output, actual_output)
+
+  def test_per_sample_config(self):
+    layer = image_preprocessing.RandomCrop(5, 5, per_sample=True)
+    layer_1 = image_preprocessing.RandomCrop.from_config(layer.get_config())
+    self.assertTrue(layer_1.per_sample)
+
   def test_random_crop_full(self):
     np.random.seed(1337)
     height, width = 8, 16
@@ -579,6 +602,27 @@ class RandomContrastTest(keras_parameterized.TestCase):
       layer = image_preprocessing.RandomContrast((0.1, 0.2))
       layer(input_images)
 
+  def test_random_contrast_per_sample(self):
+    np.random.seed(1337)
+    inp = np.random.random((3, 5, 8, 3)).astype(np.float32)
+    mock_random = np.array([0.2, 0.5, 1.3], dtype=np.float32).reshape(
+        (3, 1, 1, 1))
+    inp_mean = np.mean(inp, axis=(1, 2), keepdims=True)
+    expected_output = (inp - inp_mean) * mock_random + inp_mean
+    with testing_utils.use_gpu():
+      layer = image_preprocessing.RandomContrast((0.9, 0.5), per_sample=True)
+      with tf.compat.v1.test.mock.patch.object(
+          layer._random_generator, 'random_uniform', return_value=mock_random):
+        actual_output = layer(inp, training=True)
+        self.assertAllClose(expected_output, actual_output)
+
+  def test_random_contrast_per_sample_int_dtype(self):
+    input_images = np.random.randint(low=0, high=255, size=(2, 5, 8, 3))
+    with testing_utils.use_gpu():
+      layer = image_preprocessing.RandomContrast((0.1, 0.2), per_sample=True)
+      output = layer(input_images)
+      self.assertEqual(output.shape, (2, 5, 8, 3))
+
   def test_random_contrast_invalid_bounds(self):
     with self.assertRaises(ValueError):
       image_preprocessing.RandomContrast((-0.1, .5))
@@ -172,11 +172,9 @@ class FunctionalPreprocessingStage(functional.Functional,
         raise ValueError(
             '`adapt()` requires a batched Dataset, a list of EagerTensors '
             'or Numpy arrays as input, got {}'.format(type(data)))
-      ds_input = [
-          tf.data.Dataset.from_tensor_slices(x).batch(1) for x in data
-      ]
-
-    if isinstance(data, tf.data.Dataset):
+      flat_data = tf.data.Dataset.zip(
+          tuple(tf.data.Dataset.from_tensor_slices(x).batch(32) for x in data))
+    else:
       # Validate the datasets to try and ensure we haven't been passed one with
       # infinite size. That would cause an infinite loop here.
       if tf_utils.dataset_is_infinite(data):
@@ -184,84 +182,120 @@ class FunctionalPreprocessingStage(functional.Functional,
             'The dataset passed to `adapt()` has an infinite number of '
             'elements. Please use dataset.take(...) to make the number '
             'of elements finite.')
-      # Unzip dataset object to a list of single input dataset.
-      ds_input = _unzip_dataset(data)
-
-    # Dictionary mapping reference tensors to datasets
-    ds_dict = {}
-    tensor_usage_count = self._tensor_usage_count
-    for x, y in zip(self.inputs, ds_input):
-      x_id = str(id(x))
-      ds_dict[x_id] = [y] * tensor_usage_count[x_id]
-
-    nodes_by_depth = self._nodes_by_depth
-    depth_keys = sorted(nodes_by_depth.keys(), reverse=True)
-
-    def build_map_fn(node, args, kwargs):
-      if not isinstance(args.element_spec, tuple):
-
-        def map_fn(*x):
-          return tf.nest.flatten(node.layer(*x, **kwargs))
-      else:
-
-        def map_fn(*x):
-          return tf.nest.flatten(node.layer(x, **kwargs))
-
-      return map_fn
-
-    for depth in depth_keys:
-      for node in nodes_by_depth[depth]:
-        # Input node
+      # Flatten dataset elements to match `self.inputs`.
+      flat_data = data.map(lambda *x: tuple(tf.nest.flatten(x)))
+
+    # Every pass adapts all the layers whose inputs only depend on layers
+    # adapted in previous passes. Layers implementing `update_state` are fed
+    # jointly from a single sweep over the data; other layers get their own
+    # `adapt` call.
+    for nodes in self._get_adapt_passes():
+      joint_nodes = [node for node in nodes if self._can_adapt_jointly(node)]
+      for node in nodes:
+        if node not in joint_nodes:
+          node_inputs_fn = self._make_node_inputs_fn([node])
+          node_data = flat_data.map(lambda *x: node_inputs_fn(*x)[0])  # pylint: disable=cell-var-from-loop
+          node.layer.adapt(node_data, reset_state=reset_state)
+      if joint_nodes:
+        self._adapt_jointly(joint_nodes, flat_data, reset_state)
+
+  def _get_adapt_passes(self):
+    """Groups the nodes of adaptable layers into passes.
+
+    The pass of a node is the largest number of adaptable layers on a path from
+    the stage inputs to the node, so the number of passes is the dependency
+    depth of the adaptable layers.
+
+    Returns:
+      A list of lists of nodes, one list per pass.
+    """
+    levels = {}
+    passes = {}
+    for depth in sorted(self._nodes_by_depth.keys(), reverse=True):
+      for node in self._nodes_by_depth[depth]:
         if node.is_input:
+          levels[node] = 0
           continue
+        level = 0
+        for parent in node.parent_nodes:
+          parent_level = levels[parent]
+          if not parent.is_input and _is_adaptable(parent.layer):
+            parent_level += 1
+          level = max(level, parent_level)
+        levels[node] = level
+        if _is_adaptable(node.layer):
+          passes.setdefault(level, []).append(node)
+    return [passes[level] for level in sorted(passes)]
+
+  def _can_adapt_jointly(self, node):
+    """Whether `node.layer` can be adapted with `update_state` in a sweep."""
+    layer = node.layer
+    return (isinstance(layer, base_preprocessing_layer.PreprocessingLayer) and
+            type(layer).update_state is not
+            base_preprocessing_layer.PreprocessingLayer.update_state and
+            len(node.call_args) == 1 and not node.call_kwargs and
+            len(layer.inbound_nodes) == 1)
+
+  def _make_node_inputs_fn(self, target_nodes):
+    """Returns a function mapping flat stage inputs to `target_nodes` inputs.
+
+    Only the layers upstream of `target_nodes` are applied.
+    """
+    needed = set()
+    to_visit = list(target_nodes)
+    while to_visit:
+      for parent in to_visit.pop().parent_nodes:
+        if parent not in needed and not parent.is_input:
+          needed.add(parent)
+          to_visit.append(parent)
 
-        # Node with input not computed yet
-        if any(t_id not in ds_dict for t_id in node.flat_input_ids):
-          continue
-
-        args, kwargs = node.map_arguments(ds_dict)
-        args = tf.data.Dataset.zip(tf.__internal__.nest.list_to_tuple(*args))
-
-        if node.layer.stateful and hasattr(node.layer, 'adapt'):
-          node.layer.adapt(args, reset_state=reset_state)
-
-        map_fn = build_map_fn(node, args, kwargs)
-        outputs = args.map(map_fn)
-        outputs = _unzip_dataset(outputs)
-
-        # Update ds_dict.
-        for x_id, y in zip(node.flat_output_ids, outputs):
-          ds_dict[x_id] = [y] * tensor_usage_count[x_id]
-
-
-def _unzip_dataset(ds):
-  """Unzip dataset into a list of single element datasets.
-
-  Args:
-    ds: A Dataset object.
-
-  Returns:
-    A list of Dataset object, each correspond to one of the `element_spec` of
-    the input Dataset object.
-
-  Example:
-
-  >>> ds1 = tf.data.Dataset.from_tensor_slices([1, 2, 3])
-  >>> ds2 = tf.data.Dataset.from_tensor_slices([4, 5, 6])
-  >>> ds_zipped_tuple = tf.data.Dataset.zip((ds1, ds2))
-  >>> ds_unzipped_tuple = _unzip_dataset(ds_zipped_tuple)
-  >>> ds_zipped_dict = tf.data.Dataset.zip({'ds1': ds1, 'ds2': ds2})
-  >>> ds_unzipped_dict = _unzip_dataset(ds_zipped_dict)
-
-  Then the two elements of `ds_unzipped_tuple` and `ds_unzipped_dict` are both
-  the same as `ds1` and `ds2`.
-  """
-  element_count = len(tf.nest.flatten(ds.element_spec))
-  ds_unzipped = []
-  for i in range(element_count):
-
-    def map_fn(*x, j=i):
-      return tf.nest.flatten(x)[j]
+    nodes_by_depth = self._nodes_by_depth
+    depth_keys = sorted(nodes_by_depth.keys(), reverse=True)
+    tensor_usage_count = self._tensor_usage_count
 
-    ds_unzipped.append(ds.map(map_fn))
-  return ds_unzipped
+    def node_inputs_fn(*flat_inputs):
+      tensor_dict = {}
+      for x, y in zip(self.inputs, flat_inputs):
+        x_id = str(id(x))
+        tensor_dict[x_id] = [y] * tensor_usage_count[x_id]
+      for depth in depth_keys:
+        for node in nodes_by_depth[depth]:
+          if node not in needed:
+            continue
+          args, kwargs = node.map_arguments(tensor_dict)
+          outputs = node.layer(*args, **kwargs)
+          for x_id, y in zip(node.flat_output_ids, tf.nest.flatten(outputs)):
+            tensor_dict[x_id] = [y] * tensor_usage_count[x_id]
+      node_inputs = []
+      for node in target_nodes:
+        args, _ = node.map_arguments(tensor_dict)
+        node_inputs.append(tf.__internal__.nest.list_to_tuple(args[0]))
+      return tuple(node_inputs)
+
+    return node_inputs_fn
+
+  def _adapt_jointly(self, nodes, flat_data, reset_state):
+    """Adapts the layers of `nodes` with a single sweep over `flat_data`."""
+    layers = [node.layer for node in nodes]
+    node_data = flat_data.map(self._make_node_inputs_fn(nodes))
+    for layer, spec in zip(layers, node_data.element_spec):
+      if reset_state and layer.built:
+        layer.reset_state()
+      # Build eagerly, so that the adapt step does not create variables.
+      layer._adapt_maybe_build(spec)  # pylint: disable=protected-access
+
+    def adapt_step(node_inputs):
+      for layer, x in zip(layers, node_inputs):
+        layer.update_state(x)
+
+    if not self.run_eagerly:
+      adapt_step = tf.function(adapt_step)
+    for node_inputs in node_data:
+      adapt_step(node_inputs)
+    for layer in layers:
+      layer.finalize_state()
+      layer._is_adapted = True  # pylint: disable=protected-access
+
+
+def _is_adaptable(layer):
+  return layer.stateful and hasattr(layer, 'adapt')
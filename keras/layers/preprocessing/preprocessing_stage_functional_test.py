@@ -434,6 +434,45 @@ class PreprocessingStageTest(keras_parameterized.TestCase,
     _ = stage.evaluate(data, np.ones((12, 8, 8, 4)))
     _ = stage.predict(data)
 
+  def test_independent_layers_are_adapted_in_a_single_pass(self):
+    x0 = Input(shape=(2,))
+    x1 = Input(shape=(2,))
+    norm0 = normalization.Normalization()
+    norm1 = normalization.Normalization()
+    norm2 = normalization.Normalization()
+    y0 = norm0(x0)
+    y1 = norm1(x1)
+    # `norm2` depends on `norm0`, so it needs a second pass.
+    z = norm2(merge.Add()([y0, x1]))
+    stage = preprocessing_stage.FunctionalPreprocessingStage(
+        [x0, x1], [y0, y1, z])
+
+    rng = np.random.RandomState(0)
+    data0 = rng.normal(loc=3., scale=2., size=(64, 2)).astype('float32')
+    data1 = rng.normal(loc=-1., scale=5., size=(64, 2)).astype('float32')
+    num_reads = [0]
+
+    def generator():
+      num_reads[0] += 1
+      for i in range(0, 64, 16):
+        yield data0[i:i + 16], data1[i:i + 16]
+
+    spec = tf.TensorSpec((None, 2), tf.float32)
+    ds = tf.data.Dataset.from_generator(
+        generator, output_signature=(spec, spec))
+    stage.adapt(ds)
+    self.assertEqual(num_reads[0], 2)
+
+    self.assertAllClose(norm0.mean, data0.mean(axis=0, keepdims=True))
+    self.assertAllClose(norm0.variance, data0.var(axis=0, keepdims=True))
+    self.assertAllClose(norm1.mean, data1.mean(axis=0, keepdims=True))
+    self.assertAllClose(norm1.variance, data1.var(axis=0, keepdims=True))
+    merged = (data0 - data0.mean(axis=0)) / data0.std(axis=0) + data1
+    self.assertAllClose(norm2.mean, merged.mean(axis=0, keepdims=True),
+                        atol=1e-4)
+    self.assertAllClose(norm2.variance, merged.var(axis=0, keepdims=True),
+                        atol=1e-4)
+
 
 if __name__ == '__main__':
   tf.test.main()
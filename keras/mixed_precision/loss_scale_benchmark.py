@@ -147,6 +147,54 @@ class LossScaleBenchmark(tf.test.Benchmark):
         for loss_scaling in None, 'fixed', 'dynamic':
           self._benchmark('gradient_tape', num_gpus, mode, loss_scaling)
 
+  def _benchmark_unscale_and_check(self, mode, fused, num_grads=1000):
+    """Benchmarks unscaling gradients and checking them for NaNs.
+
+    This measures the per-step overhead of `get_unscaled_gradients` and of the
+    finiteness check of a dynamic loss scale on many small gradients, with or
+    without concatenating gradients of the same dtype into a single buffer.
+
+    Args:
+      mode: "eager" or "tf_function".
+      fused: Whether gradients are concatenated before being unscaled and
+        checked.
+      num_grads: The number of gradients.
+    """
+    name = 'unscale_and_check_%d_grads_%s_%s' % (
+        num_grads, mode, 'fused' if fused else 'unfused')
+    original_min_gradients_to_fuse = loss_scale_optimizer._MIN_GRADIENTS_TO_FUSE
+    loss_scale_optimizer._MIN_GRADIENTS_TO_FUSE = (
+        2 if fused else num_grads + 1)
+    try:
+      with tf.__internal__.eager_context.eager_mode():
+        opt = loss_scale_optimizer.LossScaleOptimizer(adam.Adam())
+        grads = [tf.fill([i % 64 + 1], 2.) for i in range(num_grads)]
+
+        def run_fn():
+          unscaled_grads = opt.get_unscaled_gradients(grads)
+          return loss_scale_optimizer._is_all_finite(unscaled_grads)
+        if mode == 'tf_function':
+          run_fn = tf.function(run_fn)
+
+        num_warmup_iters = 1
+        num_iters = 20
+        for _ in range(num_warmup_iters):
+          run_fn().numpy()
+        start = time.time()
+        for _ in range(num_iters):
+          run_fn().numpy()
+        end = time.time()
+    finally:
+      loss_scale_optimizer._MIN_GRADIENTS_TO_FUSE = (
+          original_min_gradients_to_fuse)
+    self.report_benchmark(iters=num_iters,
+                          wall_time=(end - start) / num_iters, name=name)
+
+  def benchmark_unscale_and_check(self):
+    for mode in 'eager', 'tf_function':
+      for fused in False, True:
+        self._benchmark_unscale_and_check(mode, fused)
+
 
 if __name__ == '__main__':
   tf.test.main()
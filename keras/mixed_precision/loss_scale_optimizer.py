@@ -45,14 +45,84 @@ class _UnwrapPreventer:
     self.value = value
 
 
+# Dense gradients of the same dtype are concatenated into a single flat buffer
+# once there are at least this many of them, so that checking their finiteness
+# and unscaling them runs a constant number of kernels instead of a few kernels
+# per gradient. With few gradients, the extra copy is not worth it.
+_MIN_GRADIENTS_TO_FUSE = 8
+
+
+def _group_by_dtype(tensors):
+  """Returns a dict mapping dtypes to the indices of `tensors` of that dtype."""
+  groups = {}
+  for i, t in enumerate(tensors):
+    groups.setdefault(t.dtype, []).append(i)
+  return groups
+
+
+def _flat_concat(tensors):
+  """Concatenates the flattened `tensors` into a single 1-D tensor."""
+  return tf.concat([tf.reshape(t, [-1]) for t in tensors], axis=0)
+
+
 def _is_all_finite(grads):
   """Returns a scalar boolean tensor indicating if all gradients are finite."""
-  is_finite_per_grad = [
-      tf.reduce_all(tf.math.is_finite(g)) for g in grads if g is not None
+  grads = [
+      g.values if isinstance(g, tf.IndexedSlices) else g
+      for g in grads
+      if g is not None
   ]
+  is_finite_per_grad = []
+  for indices in _group_by_dtype(grads).values():
+    dtype_grads = [grads[i] for i in indices]
+    if len(dtype_grads) >= _MIN_GRADIENTS_TO_FUSE:
+      dtype_grads = [_flat_concat(dtype_grads)]
+    is_finite_per_grad.extend(
+        tf.reduce_all(tf.math.is_finite(g)) for g in dtype_grads)
   return tf.reduce_all(is_finite_per_grad)
 
 
+def _unscale_gradients(grads, loss_scale_reciprocal):
+  """Multiplies the non-None `grads` by `loss_scale_reciprocal`.
+
+  Dense gradients of the same dtype are multiplied in a single op on their
+  concatenation (see `_MIN_GRADIENTS_TO_FUSE`), then split back to their
+  original shapes.
+
+  Args:
+    grads: A list of tensors, `tf.IndexedSlices` or None values.
+    loss_scale_reciprocal: A scalar tensor.
+
+  Returns:
+    A list the same size as `grads` of the unscaled gradients.
+  """
+  unscaled = [None] * len(grads)
+  dense_indices = []
+  for i, g in enumerate(grads):
+    if isinstance(g, tf.IndexedSlices):
+      unscaled[i] = _multiply_gradient(g, loss_scale_reciprocal)
+    elif g is not None:
+      dense_indices.append(i)
+  dense_grads = [grads[i] for i in dense_indices]
+  for indices in _group_by_dtype(dense_grads).values():
+    dtype_grads = [dense_grads[i] for i in indices]
+    if len(dtype_grads) < _MIN_GRADIENTS_TO_FUSE:
+      for i, g in zip(indices, dtype_grads):
+        unscaled[dense_indices[i]] = _multiply_gradient(
+            g, loss_scale_reciprocal)
+      continue
+    flat = _multiply_gradient(_flat_concat(dtype_grads), loss_scale_reciprocal)
+    if all(g.shape.is_fully_defined() for g in dtype_grads):
+      sizes = [g.shape.num_elements() for g in dtype_grads]
+      shapes = [g.shape for g in dtype_grads]
+    else:
+      sizes = tf.stack([tf.size(g) for g in dtype_grads])
+      shapes = [tf.shape(g) for g in dtype_grads]
+    for i, piece, shape in zip(indices, tf.split(flat, sizes), shapes):
+      unscaled[dense_indices[i]] = tf.reshape(piece, shape)
+  return unscaled
+
+
 def _op_in_graph_mode(tensor):
   """Returns the tensor's op in graph mode, or the tensor in eager mode.
 
@@ -549,10 +619,7 @@ class LossScaleOptimizer(tf.__internal__.tracking.DelegatingTrackableMixin,
       is divided by `LossScaleOptimizer.loss_scale`.
     """
     loss_scale_reciprocal = 1. / self.loss_scale
-    return [
-        _multiply_gradient(g, loss_scale_reciprocal) if g is not None else None
-        for g in grads
-    ]
+    return _unscale_gradients(list(grads), loss_scale_reciprocal)
 
   def _compute_gradients(self, loss, var_list, grad_loss=None, tape=None):
     tape = tf.GradientTape() if tape is None else tape
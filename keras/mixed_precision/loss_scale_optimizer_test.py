@@ -160,6 +160,50 @@ class LossScaleOptimizerTest(tf.test.TestCase, parameterized.TestCase):
     self.assertAllEqual([[2., 1.], [4., 2.5]],
                         self.evaluate(sparse_grad.values))
 
+  def testGetUnscaledGradientsFused(self):
+    opt = gradient_descent.SGD(2.0)
+    opt = loss_scale_optimizer.LossScaleOptimizer(opt, dynamic=False,
+                                                  initial_scale=4)
+    num_grads = loss_scale_optimizer._MIN_GRADIENTS_TO_FUSE
+    scaled_grads = [None]
+    for i in range(num_grads):
+      scaled_grads.append(tf.fill([i + 1, 2], 4. * i))
+      scaled_grads.append(tf.fill([i + 1], tf.cast(8. * i, 'float16')))
+    scaled_grads.append(tf.IndexedSlices(
+        tf.convert_to_tensor([[4., 8.]]), tf.convert_to_tensor([1]),
+        dense_shape=tf.convert_to_tensor([3, 2])))
+
+    @tf.function
+    def unscale(grads):
+      return opt.get_unscaled_gradients(grads)
+
+    for fn in (opt.get_unscaled_gradients, unscale):
+      grads = fn(scaled_grads)
+      self.assertLen(grads, len(scaled_grads))
+      self.assertIsNone(grads[0])
+      for i in range(num_grads):
+        grad = grads[2 * i + 1]
+        self.assertEqual(grad.dtype, tf.float32)
+        self.assertAllEqual(self.evaluate(grad), np.full([i + 1, 2], i))
+        grad = grads[2 * i + 2]
+        self.assertEqual(grad.dtype, tf.float16)
+        self.assertAllEqual(self.evaluate(grad), np.full([i + 1], 2 * i))
+      self.assertIsInstance(grads[-1], tf.IndexedSlices)
+      self.assertAllEqual(self.evaluate(grads[-1].values), [[1., 2.]])
+
+  def testIsAllFiniteFused(self):
+    num_grads = loss_scale_optimizer._MIN_GRADIENTS_TO_FUSE
+    grads = [tf.ones([i + 1]) for i in range(num_grads)] + [
+        None, tf.ones([2], dtype='float16')
+    ]
+    self.assertTrue(
+        self.evaluate(loss_scale_optimizer._is_all_finite(grads)))
+    for i, value in ((3, np.inf), (num_grads + 1, np.nan)):
+      non_finite_grads = list(grads)
+      non_finite_grads[i] = tf.constant([1., value], non_finite_grads[i].dtype)
+      self.assertFalse(
+          self.evaluate(loss_scale_optimizer._is_all_finite(non_finite_grads)))
+
   @parameterized.named_parameters(*TESTCASES)
   def testDynamicLossScale(self, strategy_fn):
     strategy = strategy_fn()
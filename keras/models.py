@@ -20,6 +20,8 @@ from keras import backend
 from keras import metrics as metrics_module
 from keras import optimizer_v1
 from keras.engine import functional
+from keras.engine import keras_tensor
+from keras.engine import node as node_module
 from keras.engine import sequential
 from keras.engine import training
 from keras.engine import training_v1
@@ -125,7 +127,8 @@ def _make_new_nodes(nodes_by_depth, layer_fn, layer_map, tensor_map):
   return new_nodes
 
 
-def _clone_functional_model(model, input_tensors=None, layer_fn=_clone_layer):
+def _clone_functional_model(model, input_tensors=None, layer_fn=_clone_layer,
+                            reuse_topology=False):
   """Clone a functional `Model` instance.
 
   Model cloning is similar to calling a model on new inputs,
@@ -145,6 +148,8 @@ def _clone_functional_model(model, input_tensors=None, layer_fn=_clone_layer):
           copy of the model with distribution strategy; we want the weights to
           be shared but still feed inputs separately so we create new input
           layers.
+      reuse_topology: Whether to copy the nodes of `model` instead of calling
+          the new layers. See `clone_model`.
 
   Returns:
       An instance of `Model` reproducing the behavior
@@ -153,7 +158,8 @@ def _clone_functional_model(model, input_tensors=None, layer_fn=_clone_layer):
 
   Raises:
       ValueError: in case of invalid `model` argument value or `layer_fn`
-      argument value.
+      argument value, or if both `input_tensors` and `reuse_topology` are
+      passed.
   """
   if not isinstance(model, Model):
     raise ValueError('Expected `model` argument '
@@ -190,6 +196,14 @@ def _clone_functional_model(model, input_tensors=None, layer_fn=_clone_layer):
     raise ValueError('Expected `layer_fn` argument to be a callable. '
                      f'Received: layer_fn={layer_fn}')
 
+  if reuse_topology:
+    if input_tensors is not None:
+      raise ValueError('`reuse_topology` is not supported with '
+                       '`input_tensors`, since the new inputs may not match '
+                       'the shapes recorded in the model.')
+    if _can_reuse_topology(model):
+      return _clone_functional_model_topology(model, layer_fn)
+
   model_configs, created_layers = _clone_layers_and_model_config(
       model, new_input_layers, layer_fn)
   # Reconstruct model from the config, using the cloned layers.
@@ -215,6 +229,99 @@ def _clone_functional_model(model, input_tensors=None, layer_fn=_clone_layer):
   return model
 
 
+def _can_reuse_topology(model):
+  """Returns whether the nodes of `model` can be copied without layer calls."""
+  if not tf.compat.v1.executing_eagerly_outside_functions():
+    # The nodes of the model hold graph tensors rather than `KerasTensor`s.
+    return False
+  # Ancillary layers, e.g. from `add_loss` and `add_metric`, are not part of
+  # the outputs of the model and have negative depths.
+  return all(depth >= 0 for depth in model._nodes_by_depth)
+
+
+def _clone_functional_model_topology(model, layer_fn):
+  """Clones a functional model by copying its nodes.
+
+  Instead of calling every new layer on new `KerasTensor`s, which traces each
+  layer in a scratch graph to infer its outputs, the new layers are built with
+  the input shapes recorded in the nodes of `model`, and new nodes are created
+  with `KerasTensor`s matching the recorded outputs.
+
+  Layers that do not create all their weights in `build`, and layers with an
+  activity regularizer, are still called on the new inputs.
+
+  Args:
+    model: A Functional model without ancillary layers.
+    layer_fn: Function used to clone all non-input layers. The new layers must
+      produce outputs with the same specs as the original layers.
+
+  Returns:
+    A new Functional model.
+  """
+  layer_map = {}
+  # Maps the ids of the `KerasTensor`s in `model` to the new `KerasTensor`s.
+  tensor_map = {}
+  for input_layer in model._input_layers:
+    new_input_layer = InputLayer(**input_layer.get_config())
+    layer_map[input_layer] = new_input_layer
+    for x, y in zip(
+        tf.nest.flatten(input_layer._inbound_nodes[0].outputs),
+        tf.nest.flatten(new_input_layer._inbound_nodes[0].outputs)):
+      tensor_map[str(id(x))] = y
+
+  def map_tensor(t):
+    if isinstance(t, keras_tensor.KerasTensor):
+      return tensor_map.get(str(id(t)), t)
+    return t
+
+  depth_keys = sorted(model._nodes_by_depth.keys(), reverse=True)
+  for depth in depth_keys:
+    for node in model._nodes_by_depth[depth]:
+      layer = node.layer
+      if node.is_input:
+        continue
+      if layer not in layer_map:
+        layer_map[layer] = layer_fn(layer)
+      new_layer = layer_map[layer]
+
+      args = tf.nest.map_structure(map_tensor, node.call_args)
+      kwargs = tf.nest.map_structure(map_tensor, node.call_kwargs)
+      # The inputs are always the first positional argument of a node.
+      inputs = args[0]
+      with backend.name_scope(new_layer._name_scope()):  # pylint: disable=not-callable
+        new_layer._maybe_build(inputs)
+
+      if (len(new_layer.weights) < len(layer.weights) or
+          getattr(new_layer, 'activity_regularizer', None) is not None):
+        # The layer creates weights in `call`, or adds losses on its outputs.
+        outputs = new_layer(*args, **kwargs)
+      else:
+        new_layer._set_save_spec(inputs, args[1:], kwargs)
+        outputs = tf.nest.map_structure(_copy_keras_tensor, node.outputs)
+        node_module.Node(
+            new_layer, call_args=args, call_kwargs=kwargs, outputs=outputs)
+
+      for x, y in zip(
+          tf.nest.flatten(node.outputs), tf.nest.flatten(outputs)):
+        tensor_map[str(id(x))] = y
+
+  input_tensors = tf.nest.map_structure(map_tensor, model._nested_inputs)
+  output_tensors = tf.nest.map_structure(map_tensor, model._nested_outputs)
+  return Model(input_tensors, output_tensors, name=model.name)
+
+
+def _copy_keras_tensor(tensor):
+  """Returns a new `KerasTensor` with the spec and mask of `tensor`."""
+  new_tensor = keras_tensor.keras_tensor_from_type_spec(
+      tensor.type_spec, name=tensor.name)
+  new_tensor._inferred_value = tensor._inferred_value
+  mask = getattr(tensor, '_keras_mask', None)
+  if mask is not None:
+    new_tensor._keras_mask = keras_tensor.keras_tensor_from_type_spec(
+        mask.type_spec, name=mask.name)
+  return new_tensor
+
+
 def _clone_layers_and_model_config(model, input_layers, layer_fn):
   """Clones all layers, and returns the model config without serializing layers.
 
@@ -386,7 +493,8 @@ def _clone_sequential_model(model, input_tensors=None, layer_fn=_clone_layer):
 
 
 @keras_export('keras.models.clone_model')
-def clone_model(model, input_tensors=None, clone_function=None):
+def clone_model(model, input_tensors=None, clone_function=None,
+                reuse_topology=False):
   """Clone a Functional or Sequential `Model` instance.
 
   Model cloning is similar to calling a model on new inputs,
@@ -414,6 +522,14 @@ def clone_model(model, input_tensors=None, clone_function=None):
           model, e.g. by wrapping certain layers of interest (you might want to
           replace all `LSTM` instances with equivalent
           `Bidirectional(LSTM(...))` instances, for example).
+      reuse_topology: Boolean. If `True`, a Functional model is cloned by
+          copying its recorded graph of layer calls and their output shapes,
+          instead of calling every new layer on new inputs. The new layers are
+          built with the recorded input shapes, which is much faster for deep
+          models. `clone_function` must then return layers with the same
+          outputs as the original layers. Cannot be used with `input_tensors`.
+          Sequential models, and Functional models with layers added by
+          `add_loss` or `add_metric`, are cloned by calling their layers.
 
   Returns:
     An instance of `Model` reproducing the behavior
@@ -454,7 +570,8 @@ def clone_model(model, input_tensors=None, clone_function=None):
           model, input_tensors=input_tensors, layer_fn=clone_function)
     else:
       return _clone_functional_model(
-          model, input_tensors=input_tensors, layer_fn=clone_function)
+          model, input_tensors=input_tensors, layer_fn=clone_function,
+          reuse_topology=reuse_topology)
 
 
 # "Clone" a subclassed model by resetting all of the attributes.
@@ -265,6 +265,71 @@ class TestModelCloning(keras_parameterized.TestCase):
         metrics=['accuracy'])
     keras.models.clone_model(model)
 
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  @parameterized.named_parameters([
+      {'testcase_name': 'clone_weights', 'share_weights': False},
+      {'testcase_name': 'share_weights', 'share_weights': True},
+  ])
+  def test_clone_functional_model_reusing_topology(self, share_weights):
+    if share_weights:
+      clone_fn = functools.partial(
+          keras.models.clone_model,
+          clone_function=models.share_weights,
+          reuse_topology=True)
+    else:
+      clone_fn = functools.partial(
+          keras.models.clone_model, reuse_topology=True)
+
+    num_calls = [0]
+
+    class CountingLayer(keras.layers.Layer):
+
+      def call(self, inputs):
+        num_calls[0] += 1
+        return inputs
+
+    input_a = keras.Input(shape=(4,))
+    input_b = keras.Input(shape=(3, 2))
+    # A layer shared at different depths.
+    shared = keras.layers.Dense(4)
+    x = CountingLayer()(shared(shared(input_a)))
+    # Masks are propagated to the LSTM.
+    y = keras.layers.LSTM(4)(keras.layers.Masking()(input_b))
+    inner_input = keras.Input(shape=(4,))
+    inner_model = keras.Model(
+        inner_input,
+        keras.layers.Dense(4, activity_regularizer='l2')(inner_input))
+    y = inner_model(y)
+    # `MultiHeadAttention` creates its weights in `call`.
+    z = keras.layers.MultiHeadAttention(num_heads=2, key_dim=2)(input_b,
+                                                                 input_b)
+    z = keras.layers.GlobalAveragePooling1D()(z)
+    outputs = keras.layers.concatenate([x, y, z]) * 2.
+    model = keras.Model([input_a, input_b], outputs)
+
+    num_calls_before_cloning = num_calls[0]
+    clone = clone_fn(model)
+    self.assertEqual(num_calls_before_cloning, num_calls[0])
+    self.assertEqual(model.output_shape, clone.output_shape)
+    self.assertLen(clone.weights, len(model.weights))
+    if share_weights:
+      self.assertIs(clone.get_layer(shared.name), shared)
+    else:
+      self.assertIsNot(clone.get_layer(shared.name), shared)
+      clone.set_weights(model.get_weights())
+
+    inputs = [np.random.random((2, 4)), np.random.random((2, 3, 2))]
+    self.assertAllClose(model.predict(inputs), clone.predict(inputs))
+    clone.compile(
+        loss='mse',
+        optimizer=testing_utils.get_v2_optimizer('sgd'),
+        run_eagerly=testing_utils.should_run_eagerly())
+    clone.train_on_batch(inputs, np.random.random((2, 10)))
+
+    with self.assertRaisesRegex(ValueError, '`reuse_topology` is not'):
+      keras.models.clone_model(
+          model, input_tensors=[input_a, input_b], reuse_topology=True)
+
   def test_model_cloning_invalid_use_cases(self):
     seq_model = keras.models.Sequential()
     seq_model.add(keras.layers.Dense(4, input_shape=(4,)))
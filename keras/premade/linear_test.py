@@ -16,6 +16,8 @@
 
 import tensorflow.compat.v2 as tf
 
+import os
+
 import numpy as np
 from keras import backend
 from keras import keras_parameterized
@@ -136,6 +138,45 @@ class LinearModelTest(keras_parameterized.TestCase):
       grads_and_vars = zip(grads, model.trainable_variables)
       opt.apply_gradients(grads_and_vars)
 
+  def test_linear_model_packs_inputs(self):
+    model = linear.LinearModel(
+        units=2, kernel_initializer='uniform', pack_inputs=True)
+    dense_a = np.random.uniform(size=(4, 3)).astype(np.float32)
+    dense_b = np.random.uniform(size=(4, 2)).astype(np.float32)
+    sparse_c = tf.SparseTensor(
+        indices=[[0, 0], [2, 3]], values=[1., 2.], dense_shape=[4, 4])
+    sparse_d = tf.SparseTensor(
+        indices=[[1, 1], [3, 0]], values=[3., 4.], dense_shape=[4, 2])
+    inputs = {'a': dense_a, 'b': dense_b, 'c': sparse_c, 'd': sparse_d}
+    output = model(inputs)
+
+    # The kernels are the variables of the per-input layers.
+    self.assertEqual(['a', 'b', 'c', 'd'],
+                     [layer.name for layer in model.dense_layers])
+    expected = sum(
+        self.evaluate(layer(inputs[layer.name]))
+        for layer in model.dense_layers)
+    self.assertAllClose(expected, self.evaluate(output))
+
+  def test_linear_model_packed_loads_unpacked_checkpoint(self):
+    dense_a = np.random.uniform(size=(4, 3)).astype(np.float32)
+    dense_b = np.random.uniform(size=(4, 2)).astype(np.float32)
+    sparse_c = tf.SparseTensor(
+        indices=[[0, 0], [2, 3]], values=[1., 2.], dense_shape=[4, 4])
+    inputs = [dense_a, dense_b, sparse_c]
+    model = linear.LinearModel(
+        units=2, kernel_initializer='uniform', bias_initializer='uniform')
+    output = model(inputs)
+    checkpoint_prefix = os.path.join(self.get_temp_dir(), 'ckpt')
+    model.save_weights(checkpoint_prefix)
+
+    packed_model = linear.LinearModel(units=2, pack_inputs=True)
+    packed_model(inputs)
+    packed_model.load_weights(
+        checkpoint_prefix).assert_existing_objects_matched()
+    self.assertAllClose(
+        self.evaluate(output), self.evaluate(packed_model(inputs)))
+
   # This test is an example for a regression on categorical inputs, i.e.,
   # the output is 0.4, 0.6, 0.9 when input is 'alpha', 'beta', 'gamma'
   # separately.
@@ -167,6 +208,12 @@ class LinearModelTest(keras_parameterized.TestCase):
     config = linear_model.get_config()
     cloned_linear_model = linear.LinearModel.from_config(config)
     self.assertEqual(linear_model.units, cloned_linear_model.units)
+    self.assertFalse(cloned_linear_model.pack_inputs)
+
+    linear_model = linear.LinearModel(units=3, pack_inputs=True)
+    cloned_linear_model = linear.LinearModel.from_config(
+        linear_model.get_config())
+    self.assertTrue(cloned_linear_model.pack_inputs)
 
 
 if __name__ == '__main__':
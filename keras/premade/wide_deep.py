@@ -15,12 +15,16 @@
 """Built-in WideNDeep model classes."""
 
 import tensorflow.compat.v2 as tf
+
+import contextlib
+
 from keras import activations
 from keras import backend
 from keras import layers as layer_module
 from keras.engine import base_layer
 from keras.engine import data_adapter
 from keras.engine import training as keras_training
+from keras.feature_column import base_feature_layer
 from keras.utils import generic_utils
 from tensorflow.python.util import deprecation  # pylint: disable=g-direct-tensorflow-import
 from tensorflow.python.util.tf_export import keras_export
@@ -70,7 +74,12 @@ class WideDeepModel(keras_training.Model):
 
   """
 
-  def __init__(self, linear_model, dnn_model, activation=None, **kwargs):
+  def __init__(self,
+               linear_model,
+               dnn_model,
+               activation=None,
+               dnn_jit_compile=False,
+               **kwargs):
     """Create a Wide & Deep Model.
 
     Args:
@@ -80,6 +89,10 @@ class WideDeepModel(keras_training.Model):
         linear model.
       activation: Activation function. Set it to None to maintain a linear
         activation.
+      dnn_jit_compile: Whether to compile the dnn model with XLA when the model
+        runs in a `tf.function`. Unlike `compile(jit_compile=True)`, this
+        leaves the linear model, whose sparse inputs are often not supported
+        by XLA, uncompiled.
       **kwargs: The keyword arguments that are passed on to BaseLayer.__init__.
         Allowed keyword arguments include `name`.
     """
@@ -88,20 +101,30 @@ class WideDeepModel(keras_training.Model):
     self.linear_model = linear_model
     self.dnn_model = dnn_model
     self.activation = activations.get(activation)
+    self.dnn_jit_compile = dnn_jit_compile
 
   def call(self, inputs, training=None):
     if not isinstance(inputs, (tuple, list)) or len(inputs) != 2:
       linear_inputs = dnn_inputs = inputs
     else:
       linear_inputs, dnn_inputs = inputs
-    linear_output = self.linear_model(linear_inputs)
-    # pylint: disable=protected-access
-    if self.dnn_model._expects_training_arg:
-      if training is None:
-        training = backend.learning_phase()
-      dnn_output = self.dnn_model(dnn_inputs, training=training)
-    else:
-      dnn_output = self.dnn_model(dnn_inputs)
+    # Feature columns shared by the feature layers of both models are only
+    # transformed once.
+    with base_feature_layer.shared_transformation_cache_scope():
+      linear_output = self.linear_model(linear_inputs)
+      # `jit_scope` also compiles the gradients of the ops created in it.
+      if self.dnn_jit_compile and tf.inside_function():
+        dnn_scope = tf.xla.experimental.jit_scope()
+      else:
+        dnn_scope = contextlib.nullcontext()
+      with dnn_scope:
+        # pylint: disable=protected-access
+        if self.dnn_model._expects_training_arg:
+          if training is None:
+            training = backend.learning_phase()
+          dnn_output = self.dnn_model(dnn_inputs, training=training)
+        else:
+          dnn_output = self.dnn_model(dnn_inputs)
     output = tf.nest.map_structure(
         lambda x, y: (x + y), linear_output, dnn_output)
     if self.activation:
@@ -109,6 +132,11 @@ class WideDeepModel(keras_training.Model):
     return output
 
   # This does not support gradient scaling and LossScaleOptimizer.
+  # The gradients of both models are computed in a single backward pass. The
+  # gradients of the linear model with respect to kernels multiplied by sparse
+  # inputs are `IndexedSlices`, which optimizers such as FTRL and Adagrad
+  # apply as row-sparse updates. The updates of both models do not depend on
+  # each other, so they can run concurrently in the train function.
   def train_step(self, data):
     x, y, sample_weight = data_adapter.unpack_x_y_sample_weight(data)
     with tf.GradientTape() as tape:
@@ -159,16 +187,21 @@ class WideDeepModel(keras_training.Model):
 
       with backend.get_graph().as_default():
         with backend.name_scope('training'):
-          # Training updates
-          updates = []
-          linear_updates = linear_optimizer.get_updates(
-              params=self.linear_model.trainable_weights,  # pylint: disable=protected-access
-              loss=self.total_loss)
-          updates += linear_updates
-          dnn_updates = dnn_optimizer.get_updates(
-              params=self.dnn_model.trainable_weights,  # pylint: disable=protected-access
-              loss=self.total_loss)
-          updates += dnn_updates
+          # Training updates, from a single gradient computation. The
+          # gradients are not computed by either optimizer, so that each
+          # optimizer only transforms (e.g. clips) its own gradients in
+          # `apply_gradients`.
+          linear_weights = self.linear_model.trainable_weights
+          dnn_weights = self.dnn_model.trainable_weights
+          grads = backend.gradients(self.total_loss,
+                                    linear_weights + dnn_weights)
+          linear_grads = grads[:len(linear_weights)]
+          dnn_grads = grads[len(linear_weights):]
+          updates = [
+              linear_optimizer.apply_gradients(
+                  zip(linear_grads, linear_weights)),
+              dnn_optimizer.apply_gradients(zip(dnn_grads, dnn_weights)),
+          ]
           # Unconditional updates
           updates += self.get_updates_for(None)
           # Conditional updates relevant to this model
@@ -198,6 +231,7 @@ class WideDeepModel(keras_training.Model):
         'linear_model': linear_config,
         'dnn_model': dnn_config,
         'activation': activations.serialize(self.activation),
+        'dnn_jit_compile': self.dnn_jit_compile,
     }
     base_config = base_layer.Layer.get_config(self)
     return dict(list(base_config.items()) + list(config.items()))
@@ -74,6 +74,28 @@ class WideDeepModelTest(keras_parameterized.TestCase):
                           self.evaluate(
                               wide_deep_model.dnn_model.layers[0].kernel))
 
+  def test_wide_deep_model_clips_gradients_per_optimizer(self):
+    linear_model = linear.LinearModel(units=1, kernel_initializer='zeros')
+    dnn_model = sequential.Sequential(
+        [core.Dense(units=1, kernel_initializer='zeros')])
+    wide_deep_model = wide_deep.WideDeepModel(linear_model, dnn_model)
+    inputs = [np.array([[1.]]), np.array([[1.]])]
+    output = np.array([[3.]])
+    # Only the gradients of the linear model are clipped.
+    linear_opt = gradient_descent.SGD(learning_rate=.1, clipnorm=.1)
+    dnn_opt = gradient_descent.SGD(learning_rate=.3)
+    wide_deep_model.compile(
+        optimizer=[linear_opt, dnn_opt],
+        loss='mse',
+        metrics=[],
+        run_eagerly=testing_utils.should_run_eagerly())
+    wide_deep_model.fit(inputs, output, epochs=1)
+    self.assertAllClose(
+        [[0.01]],
+        self.evaluate(wide_deep_model.linear_model.dense_layers[0].kernel))
+    self.assertAllClose(
+        [[1.8]], self.evaluate(wide_deep_model.dnn_model.layers[0].kernel))
+
   def test_wide_deep_model_with_single_input(self):
     linear_model = linear.LinearModel(units=1)
     dnn_model = sequential.Sequential([core.Dense(units=1, input_dim=3)])
@@ -127,6 +149,38 @@ class WideDeepModelTest(keras_parameterized.TestCase):
     wide_deep_model.fit(inputs, output, epochs=5)
     self.assertTrue(wide_deep_model.built)
 
+  def test_wide_deep_model_with_sparse_linear_inputs(self):
+    linear_model = linear.LinearModel(units=1)
+    dnn_model = sequential.Sequential([core.Dense(units=1, input_dim=3)])
+    wide_deep_model = wide_deep.WideDeepModel(
+        linear_model, dnn_model, dnn_jit_compile=True)
+    sparse_a = tf.SparseTensor(
+        indices=[[0, 0], [1, 3], [3, 2]],
+        values=[1., 2., 3.],
+        dense_shape=[4, 4])
+    sparse_b = tf.SparseTensor(
+        indices=[[1, 1], [2, 0]], values=[4., 5.], dense_shape=[4, 2])
+    dnn_inp = np.random.uniform(size=(4, 3)).astype(np.float32)
+    inputs = ((sparse_a, sparse_b), dnn_inp)
+    output = np.random.uniform(size=(4, 1)).astype(np.float32)
+
+    # The gradients of the linear kernels are row-sparse.
+    with tf.GradientTape() as tape:
+      loss = tf.reduce_sum(wide_deep_model(inputs))
+    kernels = [layer.kernel for layer in linear_model.dense_layers]
+    for grad in tape.gradient(loss, kernels):
+      self.assertIsInstance(grad, tf.IndexedSlices)
+
+    wide_deep_model.compile(
+        optimizer=['ftrl', 'adagrad'],
+        loss='mse',
+        metrics=[],
+        run_eagerly=testing_utils.should_run_eagerly())
+    dataset = tf.data.Dataset.from_tensor_slices((inputs, output)).batch(2)
+    history = wide_deep_model.fit(dataset, epochs=2)
+    self.assertLen(history.history['loss'], 2)
+    self.assertTrue(wide_deep_model.get_config()['dnn_jit_compile'])
+
   def test_wide_deep_model_as_layer(self):
     linear_model = linear.LinearModel(units=1)
     dnn_model = sequential.Sequential([core.Dense(units=1)])
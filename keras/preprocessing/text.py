@@ -15,13 +15,17 @@
 """Utilities for text input preprocessing."""
 # pylint: disable=invalid-name
 
+import collections
+import functools
+import itertools
+import multiprocessing
+
 from keras_preprocessing import text
 
 from keras.preprocessing.text_dataset import text_dataset_from_directory  # pylint: disable=unused-import
 from tensorflow.python.util.tf_export import keras_export
 
 hashing_trick = text.hashing_trick
-Tokenizer = text.Tokenizer
 
 
 @keras_export('keras.preprocessing.text.text_to_word_sequence')
@@ -84,6 +88,231 @@ def one_hot(input_text,
   return text.one_hot(input_text, n, filters=filters, lower=lower, split=split)
 
 
+def _tokenize_chunk(texts, filters, lower, split, char_level):
+  """Splits a chunk of texts into lists of tokens, like `Tokenizer` does."""
+  translate_map = str.maketrans({c: split for c in filters})
+  sequences = []
+  for doc in texts:
+    if char_level or isinstance(doc, list):
+      if lower:
+        if isinstance(doc, list):
+          doc = [token.lower() for token in doc]
+        else:
+          doc = doc.lower()
+      sequences.append(doc)
+    else:
+      if lower:
+        doc = doc.lower()
+      sequences.append(
+          [w for w in doc.translate(translate_map).split(split) if w])
+  return sequences
+
+
+def _count_chunk(texts, tokenize_config):
+  """Returns the document count, word counts and document counts of a chunk.
+
+  The counters preserve the order in which words first appear in the chunk, so
+  that merging the counts of consecutive chunks in order gives the same word
+  order as counting the whole corpus at once.
+  """
+  sequences = _tokenize_chunk(texts, **tokenize_config)
+  word_counts = collections.Counter(itertools.chain.from_iterable(sequences))
+  word_docs = collections.Counter(
+      itertools.chain.from_iterable(map(set, sequences)))
+  return len(sequences), word_counts, word_docs
+
+
+def _texts_to_sequences_chunk(texts, state):
+  """Converts a chunk of texts to lists of word indices."""
+  tokenize_config, word_index, num_words, oov_token_index = state
+  sequences = []
+  for seq in _tokenize_chunk(texts, **tokenize_config):
+    # `dict.get` over the whole sequence runs the lookups in C; unknown words
+    # map to the OOV index, or to `None` and are dropped.
+    vect = list(
+        map(word_index.get, seq, itertools.repeat(oov_token_index, len(seq))))
+    if num_words:
+      vect = [i if i < num_words else oov_token_index
+              for i in vect if i is not None]
+    if oov_token_index is None:
+      vect = [i for i in vect if i is not None]
+    sequences.append(vect)
+  return sequences
+
+
+_worker_state = None
+
+
+def _init_worker(state):
+  global _worker_state
+  _worker_state = state
+
+
+def _worker_texts_to_sequences(texts):
+  return _texts_to_sequences_chunk(texts, _worker_state)
+
+
+class Tokenizer(text.Tokenizer):
+  """Text tokenization utility class.
+
+  This class allows to vectorize a text corpus, by turning each
+  text into either a sequence of integers (each integer being the index
+  of a token in a dictionary) or into a vector where the coefficient
+  for each token could be binary, based on word count, based on tf-idf...
+
+  Texts are processed in chunks of `chunk_size` documents: each chunk is
+  tokenized with a single translation table and counted with
+  `collections.Counter`, and the chunk counts are merged into the vocabulary.
+  With `workers > 1`, `fit_on_texts` and `texts_to_sequences` process the
+  chunks in a pool of worker processes. The results are identical to
+  processing the texts one at a time.
+
+  Args:
+      num_words: the maximum number of words to keep, based
+          on word frequency. Only the most common `num_words-1` words will
+          be kept.
+      filters: a string where each element is a character that will be
+          filtered from the texts. The default is all punctuation, plus
+          tabs and line breaks, minus the `'` character.
+      lower: boolean. Whether to convert the texts to lowercase.
+      split: str. Separator for word splitting.
+      char_level: if True, every character will be treated as a token.
+      oov_token: if given, it will be added to word_index and used to
+          replace out-of-vocabulary words during text_to_sequence calls
+      document_count: int. Number of documents the tokenizer was fitted on.
+      chunk_size: int. Number of documents processed per chunk.
+      workers: int. Number of worker processes used to process chunks. With
+          the default of 1, chunks are processed in the calling process.
+
+  By default, all punctuation is removed, turning the texts into
+  space-separated sequences of words
+  (words maybe include the `'` character). These sequences are then
+  split into lists of tokens. They will then be indexed or vectorized.
+
+  `0` is a reserved index that won't be assigned to any word.
+  """
+
+  def __init__(self,
+               num_words=None,
+               filters='!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n',
+               lower=True,
+               split=' ',
+               char_level=False,
+               oov_token=None,
+               document_count=0,
+               chunk_size=10000,
+               workers=1,
+               **kwargs):
+    super(Tokenizer, self).__init__(
+        num_words=num_words,
+        filters=filters,
+        lower=lower,
+        split=split,
+        char_level=char_level,
+        oov_token=oov_token,
+        document_count=document_count,
+        **kwargs)
+    if chunk_size < 1:
+      raise ValueError(
+          f'`chunk_size` must be a positive integer. Received: {chunk_size}')
+    self.chunk_size = chunk_size
+    self.workers = workers
+
+  def _tokenize_config(self):
+    return {
+        'filters': self.filters,
+        'lower': self.lower,
+        'split': self.split,
+        'char_level': self.char_level,
+    }
+
+  def _iter_chunks(self, texts):
+    iterator = iter(texts)
+    while True:
+      chunk = list(itertools.islice(iterator, self.chunk_size))
+      if not chunk:
+        return
+      yield chunk
+
+  def fit_on_texts(self, texts):
+    """Updates internal vocabulary based on a list of texts.
+
+    In the case where texts contains lists,
+    we assume each entry of the lists to be a token.
+
+    Required before using `texts_to_sequences` or `texts_to_matrix`.
+
+    Args:
+        texts: can be a list of strings,
+            a generator of strings (for memory-efficiency),
+            or a list of list of strings.
+    """
+    count_fn = functools.partial(
+        _count_chunk, tokenize_config=self._tokenize_config())
+    chunks = self._iter_chunks(texts)
+    if self.workers > 1:
+      with multiprocessing.Pool(self.workers) as pool:
+        for counts in pool.imap(count_fn, chunks):
+          self._merge_counts(*counts)
+    else:
+      for counts in map(count_fn, chunks):
+        self._merge_counts(*counts)
+    self._build_index()
+
+  def _merge_counts(self, document_count, word_counts, word_docs):
+    self.document_count += document_count
+    for w, c in word_counts.items():
+      self.word_counts[w] = self.word_counts.get(w, 0) + c
+    for w, c in word_docs.items():
+      self.word_docs[w] += c
+
+  def _build_index(self):
+    wcounts = list(self.word_counts.items())
+    wcounts.sort(key=lambda x: x[1], reverse=True)
+    # forcing the oov_token to index 1 if it exists
+    if self.oov_token is None:
+      sorted_voc = []
+    else:
+      sorted_voc = [self.oov_token]
+    sorted_voc.extend(wc[0] for wc in wcounts)
+
+    # note that index 0 is reserved, never assigned to an existing word
+    self.word_index = dict(
+        zip(sorted_voc, list(range(1, len(sorted_voc) + 1))))
+
+    self.index_word = {c: w for w, c in self.word_index.items()}
+
+    for w, c in list(self.word_docs.items()):
+      self.index_docs[self.word_index[w]] = c
+
+  def texts_to_sequences_generator(self, texts):
+    """Transforms each text in `texts` to a sequence of integers.
+
+    Each item in texts can also be a list,
+    in which case we assume each item of that list to be a token.
+
+    Only top `num_words-1` most frequent words will be taken into account.
+    Only words known by the tokenizer will be taken into account.
+
+    Args:
+        texts: A list of texts (strings).
+
+    Yields:
+        Yields individual sequences.
+    """
+    state = (self._tokenize_config(), self.word_index, self.num_words,
+             self.word_index.get(self.oov_token))
+    chunks = self._iter_chunks(texts)
+    if self.workers > 1:
+      with multiprocessing.Pool(
+          self.workers, initializer=_init_worker, initargs=(state,)) as pool:
+        for sequences in pool.imap(_worker_texts_to_sequences, chunks):
+          yield from sequences
+    else:
+      for chunk in chunks:
+        yield from _texts_to_sequences_chunk(chunk, state)
+
+
 # text.tokenizer_from_json is only available if keras_preprocessing >= 1.1.0
 try:
   tokenizer_from_json = text.tokenizer_from_json
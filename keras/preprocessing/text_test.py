@@ -20,6 +20,7 @@ import tensorflow.compat.v2 as tf
 import numpy as np
 
 from keras.preprocessing import text as preprocessing_text
+from keras_preprocessing import text as keras_preprocessing_text
 
 
 class TestText(tf.test.TestCase):
@@ -106,6 +107,30 @@ class TestText(tf.test.TestCase):
     tokenizer.texts_to_matrix(texts)
     tokenizer.texts_to_matrix(word_sequences)
 
+  def test_tokenizer_chunked_matches_unchunked(self):
+    texts = [
+        'The cat sat on the mat.', 'The dog sat on the log.',
+        'Dogs and cats living together.', ['The', 'cat', 'is', 'sitting'],
+        'The end.'
+    ] * 7
+    # Reference implementation, processing one text at a time.
+    reference = keras_preprocessing_text.Tokenizer(
+        num_words=6, oov_token='<unk>')
+    reference.fit_on_texts(texts)
+    for workers in (1, 2):
+      tokenizer = preprocessing_text.Tokenizer(
+          num_words=6, oov_token='<unk>', chunk_size=3, workers=workers)
+      tokenizer.fit_on_texts(iter(texts))
+      self.assertEqual(tokenizer.document_count, len(texts))
+      self.assertEqual(
+          list(tokenizer.word_counts.items()),
+          list(reference.word_counts.items()))
+      self.assertEqual(dict(tokenizer.word_docs), dict(reference.word_docs))
+      self.assertEqual(tokenizer.word_index, reference.word_index)
+      self.assertEqual(
+          tokenizer.texts_to_sequences(texts),
+          reference.texts_to_sequences(texts))
+
   def test_text_to_word_sequence(self):
     text = 'hello! ? world!'
     seq = preprocessing_text.text_to_word_sequence(text)
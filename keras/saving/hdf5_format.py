@@ -796,10 +796,7 @@ def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
   layer_names = load_attributes_from_hdf5_group(f, 'layer_names')
 
   # Reverse index of layer name to list of layers with name.
-  index = {}
-  for layer in model.layers:
-    if layer.name:
-      index.setdefault(layer.name, []).append(layer)
+  index = model._get_layers_by_name()
 
   # We batch weight value assignments in a single backend call
   # which provides a speedup in TensorFlow.
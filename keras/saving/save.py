@@ -154,7 +154,8 @@ def save_model(model,
 
 @keras_export('keras.models.load_model')
 @traceback_utils.filter_traceback
-def load_model(filepath, custom_objects=None, compile=True, options=None):  # pylint: disable=redefined-builtin
+def load_model(filepath, custom_objects=None, compile=True, options=None,  # pylint: disable=redefined-builtin
+               config_only=False):
   """Loads a model saved via `model.save()`.
 
   Usage:
@@ -183,6 +184,13 @@ def load_model(filepath, custom_objects=None, compile=True, options=None):  # py
           after loading.
       options: Optional `tf.saved_model.LoadOptions` object that specifies
         options for loading from SavedModel.
+      config_only: Boolean, only used when loading from SavedModel. If `True`,
+        and the saved model is a Functional or Sequential model whose layers
+        can all be rebuilt from their config (e.g. built-in layers, or custom
+        layers passed in `custom_objects`), the model is rebuilt from its
+        config and its weights are restored from the checkpoint, without
+        loading the functions traced when saving. This is much faster for
+        large models. The model is loaded as usual otherwise.
 
   Returns:
       A Keras model instance. If the original model was compiled, and saved with
@@ -204,7 +212,8 @@ def load_model(filepath, custom_objects=None, compile=True, options=None):  # py
             raise IOError(f'No file or directory found at {filepath_str}')
 
           if tf.io.gfile.isdir(filepath_str):
-            return saved_model_load.load(filepath_str, compile, options)
+            return saved_model_load.load(filepath_str, compile, options,
+                                         config_only=config_only)
           else:
             if h5py is None:
               raise ImportError(
@@ -76,7 +76,7 @@ PUBLIC_ATTRIBUTES = CommonEndpoints.all_functions.union(
 PUBLIC_ATTRIBUTES.add(constants.KERAS_ATTR)
 
 
-def load(path, compile=True, options=None):  # pylint: disable=redefined-builtin
+def load(path, compile=True, options=None, config_only=False):  # pylint: disable=redefined-builtin
   """Loads Keras objects from a SavedModel.
 
   Any Keras layer or model saved to the SavedModel will be loaded back
@@ -95,7 +95,11 @@ def load(path, compile=True, options=None):  # pylint: disable=redefined-builtin
     compile: If true, compile the model after loading it.
     options: Optional `tf.saved_model.LoadOptions` object that specifies
       options for loading from SavedModel.
-
+    config_only: If true, and the root object is a Functional or Sequential
+      model whose layers can all be rebuilt from their config, rebuild the
+      model from the Keras metadata and restore its variables from the
+      checkpoint, without loading the traced functions. Otherwise, the model
+      is loaded as usual.
 
   Returns:
     Object loaded from SavedModel.
@@ -131,6 +135,11 @@ def load(path, compile=True, options=None):  # pylint: disable=redefined-builtin
     return tf.saved_model.load(path, options=options)
 
   metadata = _update_to_current_version(metadata)
+  if config_only:
+    model = _load_from_config(path, metadata, compile, options)
+    if model is not None:
+      return model
+
   # Recreate layers and metrics using the info stored in the metadata.
   keras_loader = KerasObjectLoader(metadata, object_graph_def)
   keras_loader.load_layers(compile=compile)
@@ -148,26 +157,12 @@ def load(path, compile=True, options=None):  # pylint: disable=redefined-builtin
 
   model = loaded['root']
 
-  # pylint: disable=protected-access
   if isinstance(model, training_lib.Model) and compile:
     # TODO(kathywu): Use compiled objects from SavedModel, instead of
     # creating new objects from the training config.
-    training_config = model._serialized_attributes['metadata'].get(
-        'training_config', None)
-    if training_config is not None:
-      model.compile(**saving_utils.compile_args_from_training_config(
-          training_config), from_serialized=True)
-      saving_utils.try_build_compiled_arguments(model)
-      if isinstance(model.optimizer, optimizer_v2.OptimizerV2):
-        if model.optimizer.get_slot_names():
-          logging.warning('Your optimizer uses slots. '
-                          'Slots cannot be restored from saved_model, '
-                          'as a result, your model is starting with  '
-                          'a new initialized optimizer.')
-    else:
-      logging.warning('No training configuration found in save file, so the '
-                      'model was *not* compiled. Compile it manually.')
-  # pylint: enable=protected-access
+    _compile_from_training_config(
+        model, model._serialized_attributes['metadata'].get(  # pylint: disable=protected-access
+            'training_config', None))
 
   # Force variables and resources to initialize.
   if not tf.executing_eagerly():
@@ -178,6 +173,101 @@ def load(path, compile=True, options=None):  # pylint: disable=redefined-builtin
   return model
 
 
+def _compile_from_training_config(model, training_config):
+  """Compiles a loaded model with its saved training config, if any."""
+  if training_config is not None:
+    model.compile(**saving_utils.compile_args_from_training_config(
+        training_config), from_serialized=True)
+    saving_utils.try_build_compiled_arguments(model)
+    if isinstance(model.optimizer, optimizer_v2.OptimizerV2):
+      if model.optimizer.get_slot_names():
+        logging.warning('Your optimizer uses slots. '
+                        'Slots cannot be restored from saved_model, '
+                        'as a result, your model is starting with  '
+                        'a new initialized optimizer.')
+  else:
+    logging.warning('No training configuration found in save file, so the '
+                    'model was *not* compiled. Compile it manually.')
+
+
+def _load_from_config(path, metadata, compile, options):  # pylint: disable=redefined-builtin
+  """Rebuilds the root model from the Keras metadata only.
+
+  The traced functions of the SavedModel are not loaded. The variables of the
+  rebuilt model are restored from the checkpoint of the SavedModel.
+
+  Args:
+    path: Path to SavedModel.
+    metadata: `SavedMetadata` proto of the SavedModel.
+    compile: If true, compile the model after loading it.
+    options: Optional `tf.saved_model.LoadOptions` object.
+
+  Returns:
+    The rebuilt model, or `None` if the root object is not a Functional or
+    Sequential model, or if one of its layers cannot be rebuilt from its
+    config.
+  """
+  if not tf.executing_eagerly():
+    return None
+  root_metadata = None
+  for node in metadata.nodes:
+    node_metadata = json_utils.decode(node.metadata)
+    if node.node_path == 'root':
+      root_metadata = node_metadata
+    if (node.identifier != constants.METRIC_IDENTIFIER and
+        not generic_utils.validate_config(node_metadata.get('config'))):
+      return None
+  if root_metadata is None or root_metadata.get('class_name') is None:
+    return None
+
+  class_name = tf.compat.as_str(root_metadata['class_name'])
+  if (class_name not in ('Sequential', 'Functional') and
+      not root_metadata.get('is_graph_network', False)):
+    return None
+  if generic_utils.get_registered_object(class_name) is not None:
+    return None
+  if class_name != 'Sequential':
+    class_name = 'Functional'
+
+  try:
+    model = models_lib.model_from_config(
+        generic_utils.serialize_keras_class_and_config(
+            class_name, root_metadata['config']))
+  except (TypeError, ValueError, KeyError) as e:
+    logging.info('Unable to rebuild the model from its config, loading the '
+                 f'SavedModel functions instead. Received error: {e}')
+    return None
+  if not model.built:
+    return None
+
+  checkpoint_prefix = os.path.join(path, tf.saved_model.VARIABLES_DIRECTORY,
+                                   tf.saved_model.VARIABLES_FILENAME)
+  try:
+    # The SavedModel checkpoint also holds objects that the rebuilt model does
+    # not create, e.g. the optimizer slots and the saved functions, so their
+    # values are expected to stay unused.
+    model.load_weights(checkpoint_prefix, options=_get_checkpoint_options(
+        options)).assert_existing_objects_matched().expect_partial()
+  except AssertionError as e:
+    logging.info('The variables of the model rebuilt from its config do not '
+                 'match the SavedModel, loading the SavedModel functions '
+                 f'instead. Received error: {e}')
+    return None
+
+  if compile:
+    _compile_from_training_config(model,
+                                  root_metadata.get('training_config', None))
+  return model
+
+
+def _get_checkpoint_options(options):
+  """Converts `tf.saved_model.LoadOptions` to `tf.train.CheckpointOptions`."""
+  if options is None:
+    return None
+  return tf.train.CheckpointOptions(
+      experimental_io_device=options.experimental_io_device)
+
+
 def _update_to_current_version(metadata):
   """Applies version updates to the metadata proto for backwards compat."""
   for node in metadata.nodes:
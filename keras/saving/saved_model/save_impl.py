@@ -19,6 +19,7 @@ go to model_serialization.py.
 """
 
 import functools
+import json
 import threading
 import weakref
 
@@ -28,6 +29,7 @@ from keras.engine import input_spec
 from keras.mixed_precision import autocast_variable
 from keras.saving import saving_utils
 from keras.saving.saved_model import constants
+from keras.saving.saved_model import json_utils
 from keras.saving.saved_model import load as keras_load
 from keras.saving.saved_model import serialized_attributes
 from keras.saving.saved_model import utils
@@ -62,6 +64,12 @@ sequential_lib = LazyLoader(
     "keras.engine.sequential")
 # pylint:enable=g-inconsistent-quotes
 
+# Whether built-in layers without state, and with the same class, config and
+# input specs share their traced functions.
+_SHARE_STATELESS_LAYER_FUNCTIONS = True
+# Serialization cache key of the functions shared between layers.
+_SHARED_FUNCTIONS_KEY = 'keras_shared_layer_functions'
+
 
 def should_skip_serialization(layer):
   """Skip serializing extra objects and functions if layer inputs aren't set."""
@@ -144,6 +152,13 @@ def wrap_layer_functions(layer, serialization_cache):
     return {fn_name: getattr(layer.keras_api, fn_name, None)
             for fn_name in serialized_attributes.LayerAttributes.all_functions}
 
+  # Identical stateless layers compute the same functions, which are only
+  # traced for the first of them.
+  shared_fns_key = _get_shared_functions_key(layer)
+  shared_fns = serialization_cache.setdefault(_SHARED_FUNCTIONS_KEY, {})
+  if shared_fns_key in shared_fns:
+    return dict(shared_fns[shared_fns_key])
+
   # Reset the losses of the layer and its children. The call function in each
   # child layer is replaced with tf.functions.
   original_fns = _replace_child_layer_functions(layer, serialization_cache)
@@ -190,6 +205,10 @@ def wrap_layer_functions(layer, serialization_cache):
   # functions (e.g. add_loss) behave as though running in graph mode.
   with tracing_scope():
     call_collection.trace_with_input_signature()
+    if shared_fns_key is not None:
+      # Layers without an input signature are otherwise only traced when their
+      # parent is, which is too late to share their functions.
+      call_collection.trace_with_save_spec()
     with base_layer_utils.call_context().enter(
         layer, inputs=None, build_graph=True, training=None, saving=True):
       for fn in fns.values():
@@ -200,9 +219,72 @@ def wrap_layer_functions(layer, serialization_cache):
   _restore_child_layer_functions(original_fns)
   _restore_layer_losses(original_losses)
 
+  if shared_fns_key is not None and _are_pure_functions(fns):
+    shared_fns[shared_fns_key] = fns
   return fns
 
 
+def _get_shared_functions_key(layer):
+  """Returns a key identifying the layers that can share traced functions.
+
+  Built-in layers without variables, sublayers, losses and metrics compute the
+  same functions of their inputs when they have the same class, config and
+  input specs, so their functions only need to be traced once. Custom layers
+  are excluded, since their config may not describe them completely, as well
+  as layers that were never called, which cannot be traced up front.
+
+  Args:
+    layer: Keras Layer object.
+
+  Returns:
+    A hashable key, or `None` if the functions of the layer are not shared.
+  """
+  # pylint: disable=protected-access
+  if (not _SHARE_STATELESS_LAYER_FUNCTIONS or
+      not type(layer).__module__.startswith('keras.') or
+      isinstance(layer, (training_lib.Model, metrics.Metric)) or
+      layer.weights or layer._callable_losses or layer._metrics or
+      layer._activity_regularizer is not None or
+      any(layer._flatten_layers(include_self=False, recursive=False))):
+    return None
+  try:
+    config = layer.get_config()
+    config.pop('name', None)
+    config = json.dumps(
+        config, default=json_utils.get_json_type, sort_keys=True)
+  except (NotImplementedError, TypeError, ValueError):
+    return None
+  # V1 layers do not record a save spec.
+  if getattr(layer, '_saved_model_inputs_spec', None) is None:
+    return None
+  save_spec = layer._get_save_spec(dynamic_batch=True, inputs_only=False)
+  return (type(layer), config, str(layer.input_spec),
+          str(layer._build_input_shape), str(save_spec))
+  # pylint: enable=protected-access
+
+
+def _are_pure_functions(fns):
+  """Whether the traced functions in `fns` capture no tensors or resources.
+
+  Functions that were not traced yet cannot be checked, and are not pure.
+
+  Args:
+    fns: Dictionary of functions returned by `wrap_layer_functions`.
+
+  Returns:
+    A boolean.
+  """
+  concrete_fns = []
+  for fn in fns.values():
+    if isinstance(fn, LayerCall):
+      fn = fn.wrapped_call
+    if fn is not None:
+      concrete_fns.extend(
+          fn._list_all_concrete_functions_for_serialization())  # pylint: disable=protected-access
+  return bool(concrete_fns) and not any(
+      concrete_fn.captured_inputs for concrete_fn in concrete_fns)
+
+
 def default_save_signature(layer):
   original_losses = _reset_layer_losses(layer)
   fn = saving_utils.trace_model_call(layer)
@@ -544,6 +626,13 @@ class LayerCallCollection:
       args, kwargs = self._layer_inputs
       self.add_trace(*args, **kwargs)
 
+  def trace_with_save_spec(self):
+    """Trace with the save spec if there is no inferred input signature."""
+    save_spec = self.layer._get_save_spec(dynamic_batch=True, inputs_only=False)  # pylint: disable=protected-access
+    if None in tf.nest.flatten(self._layer_inputs) and save_spec is not None:
+      args, kwargs = save_spec
+      self.add_trace(*args, **kwargs)
+
 
 def _filtered_inputs(inputs):
   return list(filter(tf_utils.is_tensor_or_variable, tf.nest.flatten(inputs)))
@@ -1049,6 +1049,45 @@ class TestSavedModelFormat(tf.test.TestCase):
     with self.assertRaisesRegex(ValueError, 'I said do not trace'):
       loaded.attached_layer(tf.constant([1.]))
 
+  def test_load_config_only(self):
+    inputs = keras.Input(shape=(3,))
+    x = keras.layers.Dense(4)(inputs)
+    outputs = keras.layers.BatchNormalization()(x)
+    model = keras.Model(inputs, outputs)
+    model.compile('rmsprop', 'mse')
+    model.fit(np.random.random((8, 3)), np.random.random((8, 4)), verbose=0)
+    saved_model_dir = self._save_model_dir()
+    model.save(saved_model_dir, save_format='tf')
+
+    loaded = keras_load.load(saved_model_dir, config_only=True)
+    # The model was rebuilt from its config, so the SavedModel attributes
+    # were not loaded.
+    self.assertFalse(hasattr(loaded, '_serialized_attributes'))
+    self.assertIsInstance(loaded, keras.Model)
+    self.assertIsNotNone(loaded.optimizer)
+    self.assertAllClose(model.get_weights(), loaded.get_weights())
+    x = np.random.random((2, 3))
+    self.assertAllClose(model.predict(x), loaded.predict(x))
+
+  def test_load_config_only_falls_back_to_saved_functions(self):
+
+    class CustomLayer(keras.layers.Layer):
+
+      def call(self, inputs):
+        return inputs * 2.
+
+    inputs = keras.Input(shape=(3,))
+    outputs = CustomLayer()(keras.layers.Dense(4)(inputs))
+    model = keras.Model(inputs, outputs)
+    saved_model_dir = self._save_model_dir()
+    model.save(saved_model_dir, save_format='tf')
+
+    # The custom layer is not registered, so it is revived from the SavedModel.
+    loaded = keras_load.load(saved_model_dir, config_only=True)
+    self.assertTrue(hasattr(loaded, '_serialized_attributes'))
+    x = np.random.random((2, 3))
+    self.assertAllClose(model.predict(x), loaded.predict(x))
+
   def test_load_non_keras_saved_model(self):
     model = testing_utils.get_small_functional_mlp(1, 4, input_dim=3)
     saved_model_dir = self._save_model_dir()
@@ -1141,6 +1180,34 @@ class TestLayerCallTracing(tf.test.TestCase, parameterized.TestCase):
 
     assert_num_traces(LayerWithChildLayer, training_keyword=False)
 
+  @combinations.generate(combinations.combine(mode=['eager']))
+  def test_identical_stateless_layers_share_functions(self):
+    inputs = keras.Input(shape=(3,))
+    x = keras.layers.Activation('relu', name='relu_1')(inputs)
+    x = keras.layers.Activation('relu', name='relu_2')(x)
+    x = keras.layers.Activation('tanh', name='tanh')(x)
+    x = keras.layers.Dense(3, name='dense_1')(x)
+    outputs = keras.layers.Dense(3, name='dense_2')(x)
+    model = keras.Model(inputs, outputs)
+
+    serialization_cache = {}
+    with keras_save.tracing_scope():
+      fns = {
+          layer.name: keras_save.wrap_layer_functions(layer,
+                                                      serialization_cache)
+          for layer in model.layers[1:]
+      }
+    fn_name = 'call_and_return_conditional_losses'
+    self.assertIs(fns['relu_1'][fn_name], fns['relu_2'][fn_name])
+    self.assertIsNot(fns['relu_1'][fn_name], fns['tanh'][fn_name])
+    self.assertIsNot(fns['dense_1'][fn_name], fns['dense_2'][fn_name])
+
+    saved_model_dir = os.path.join(self.get_temp_dir(), 'saved_model')
+    model.save(saved_model_dir, save_format='tf')
+    loaded = keras_load.load(saved_model_dir)
+    x = np.random.uniform(-1, 1, size=(2, 3))
+    self.assertAllClose(model(x), loaded(x))
+
   @combinations.generate(combinations.combine(mode=['graph', 'eager']))
   def test_maintains_losses(self):
     layer = LayerWithLoss()
@@ -0,0 +1,271 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Length-bucketed batching of variable-length sequences."""
+
+import tensorflow.compat.v2 as tf
+
+import numpy as np
+from tensorflow.python.util.tf_export import keras_export
+
+
+@keras_export('keras.utils.experimental.BucketedSequences', v1=[])
+class BucketedSequences:
+  """Batches variable-length sequences by length, padding per batch.
+
+  `tf.keras.utils.experimental.BucketedSequences` is a supported type for `x`,
+  or the input, in `tf.keras.Model.fit`, `evaluate` and `predict`. Instead of
+  padding every sequence to a global `maxlen` (see
+  `tf.keras.preprocessing.sequence.pad_sequences`), sequences are grouped into
+  a small number of length buckets. Every batch only contains sequences from a
+  single bucket and is padded to that bucket's boundary, so little compute is
+  spent on padding when sequence lengths follow a long-tail distribution, while
+  the number of distinct batch shapes stays bounded by the number of buckets.
+
+  ```python
+  sequences = [[1, 2], [3, 4, 5, 6, 7], [8], ...]
+  labels = np.array([0, 1, 0, ...])
+  data = tf.keras.utils.experimental.BucketedSequences(
+      sequences, labels, batch_size=64, num_buckets=8)
+  model.fit(data, epochs=10)
+
+  # Batches are produced bucket by bucket, so predictions need to be put back
+  # in the order of the input sequences.
+  predictions = data.restore_order(model.predict(data))
+  ```
+
+  During `fit`, the order of the sequences within each bucket and the order of
+  the batches are reshuffled every epoch when `shuffle=True` (the default).
+  `evaluate` and `predict` iterate over the buckets in order of increasing
+  length; use `restore_order` to map their outputs back to the input order.
+
+  Args:
+    sequences: List of sequences (each sequence being a list or array whose
+      first dimension is the time dimension), or a `tf.RaggedTensor` with one
+      ragged dimension.
+    y: Optional targets, a NumPy array or list with one entry per sequence, or
+      a nested structure of arrays for several outputs.
+    sample_weight: Optional NumPy array of weights with one entry per sequence.
+    batch_size: Integer, maximum number of sequences per batch. Defaults to 32.
+    bucket_boundaries: Optional sorted list of integers, the padded lengths of
+      the buckets. A sequence goes to the first bucket whose boundary is greater
+      or equal to its length. The longest sequence length is appended as the
+      last boundary if needed. If `None`, boundaries are chosen at the
+      quantiles of the sequence lengths so that buckets hold about the same
+      number of sequences.
+    num_buckets: Integer, number of buckets to use when `bucket_boundaries` is
+      `None`. Defaults to 8.
+    padding: String, `"pre"` or `"post"`: pad either before or after each
+      sequence. Defaults to `"post"`.
+    value: Padding value. Defaults to 0.
+    dtype: Type of the padded sequences. Defaults to `"int32"`.
+    seed: Optional integer, seed used to shuffle the data every epoch.
+  """
+
+  def __init__(self,
+               sequences,
+               y=None,
+               sample_weight=None,
+               batch_size=32,
+               bucket_boundaries=None,
+               num_buckets=8,
+               padding='post',
+               value=0,
+               dtype='int32',
+               seed=None):
+    if padding not in ('pre', 'post'):
+      raise ValueError(
+          f'`padding` must be "pre" or "post". Received: padding={padding}')
+    if batch_size is None or batch_size < 1:
+      raise ValueError(
+          f'`batch_size` must be a positive integer. Received: {batch_size}')
+    self.batch_size = batch_size
+    self.padding = padding
+    self.value = value
+    self.dtype = tf.as_dtype(dtype)
+    self._rng = np.random.default_rng(seed)
+
+    self._values, self._lengths = _flatten_sequences(sequences)
+    self._values = self._values.astype(self.dtype.as_numpy_dtype)
+    self._offsets = np.cumsum(self._lengths) - self._lengths
+    num_samples = len(self._lengths)
+    if not num_samples:
+      raise ValueError('`BucketedSequences` requires at least one sequence.')
+
+    if isinstance(y, list) and not any(
+        isinstance(entry, np.ndarray) for entry in y):
+      # A plain list of targets (e.g. `[0, 1, 1]`), rather than a list of
+      # arrays for several outputs.
+      y = np.asarray(y)
+    self.y = None if y is None else tf.nest.map_structure(np.asarray, y)
+    self.sample_weight = (None if sample_weight is None else
+                          np.asarray(sample_weight))
+    for name, data in (('y', self.y), ('sample_weight', self.sample_weight)):
+      for array in tf.nest.flatten(data):
+        if len(array) != num_samples:
+          raise ValueError(
+              f'`{name}` must have one entry per sequence. Received '
+              f'{len(array)} entries for {num_samples} sequences.')
+
+    self.bucket_boundaries = _get_bucket_boundaries(
+        self._lengths, bucket_boundaries, num_buckets)
+    bucket_ids = np.searchsorted(
+        self.bucket_boundaries, self._lengths, side='left')
+    # Indices of the sequences of every non-empty bucket, in increasing order.
+    self._buckets = []
+    for bucket_id, boundary in enumerate(self.bucket_boundaries):
+      indices = np.flatnonzero(bucket_ids == bucket_id)
+      if indices.size:
+        self._buckets.append((boundary, indices))
+    self._order = np.concatenate([indices for _, indices in self._buckets])
+
+  @property
+  def num_samples(self):
+    """Total number of sequences."""
+    return len(self._lengths)
+
+  @property
+  def num_batches(self):
+    """Number of batches per epoch."""
+    return sum(-(-len(indices) // self.batch_size)
+               for _, indices in self._buckets)
+
+  def restore_order(self, outputs):
+    """Reorders unshuffled outputs (e.g. of `predict`) to the input order.
+
+    Args:
+      outputs: NumPy array or nested structure of arrays, as produced by
+        `Model.predict` on this object.
+
+    Returns:
+      The outputs, with their first dimension sorted back in the order of the
+      input sequences.
+    """
+
+    def _restore(array):
+      restored = np.empty_like(array)
+      restored[self._order] = array
+      return restored
+
+    return tf.nest.map_structure(_restore, outputs)
+
+  def _pad(self, indices, maxlen):
+    """Pads the sequences at `indices` to `maxlen` in one vectorized copy."""
+    lengths = self._lengths[indices]
+    feature_shape = self._values.shape[1:]
+    padded = np.full((len(indices), maxlen) + feature_shape, self.value,
+                     dtype=self.dtype.as_numpy_dtype)
+    total = lengths.sum()
+    if not total:
+      return padded
+    rows = np.repeat(np.arange(len(indices)), lengths)
+    positions = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths,
+                                             lengths)
+    sources = np.repeat(self._offsets[indices], lengths) + positions
+    if self.padding == 'pre':
+      positions += np.repeat(maxlen - lengths, lengths)
+    padded[rows, positions] = self._values[sources]
+    return padded
+
+  def _batches(self, shuffle):
+    """Yields the `(boundary, indices)` of every batch of one epoch."""
+    batches = []
+    for boundary, indices in self._buckets:
+      if shuffle:
+        indices = self._rng.permutation(indices)
+      for start in range(0, len(indices), self.batch_size):
+        batches.append((boundary, indices[start:start + self.batch_size]))
+    if shuffle:
+      batches = [batches[i] for i in self._rng.permutation(len(batches))]
+    return batches
+
+  def _make_batch(self, boundary, indices):
+    x = self._pad(indices, boundary)
+    if self.y is None:
+      return (x,)
+    y = tf.nest.map_structure(lambda array: array[indices], self.y)
+    if self.sample_weight is None:
+      return (x, y)
+    return (x, y, self.sample_weight[indices])
+
+  def get_dataset(self, shuffle=True):
+    """Returns a `tf.data.Dataset` of padded `(x, y, sample_weight)` batches.
+
+    Args:
+      shuffle: Whether to reshuffle sequences and batches every time the
+        dataset is iterated over.
+
+    Returns:
+      A `tf.data.Dataset` with one element per batch.
+    """
+
+    def _spec(array, batch_shape):
+      return tf.TensorSpec(batch_shape + array.shape[1:],
+                           tf.as_dtype(array.dtype))
+
+    x_spec = tf.TensorSpec((None, None) + self._values.shape[1:], self.dtype)
+    output_signature = (x_spec,)
+    if self.y is not None:
+      y_spec = tf.nest.map_structure(lambda a: _spec(a, (None,)), self.y)
+      output_signature += (y_spec,)
+      if self.sample_weight is not None:
+        output_signature += (_spec(self.sample_weight, (None,)),)
+
+    def generator():
+      for boundary, indices in self._batches(shuffle):
+        yield self._make_batch(boundary, indices)
+
+    dataset = tf.data.Dataset.from_generator(
+        generator, output_signature=output_signature)
+    return dataset.apply(
+        tf.data.experimental.assert_cardinality(self.num_batches))
+
+
+def _flatten_sequences(sequences):
+  """Returns the concatenated values and the lengths of `sequences`."""
+  if isinstance(sequences, tf.RaggedTensor):
+    if sequences.ragged_rank != 1:
+      raise ValueError(
+          '`BucketedSequences` only supports `tf.RaggedTensor`s with a single '
+          f'ragged dimension. Received ragged_rank={sequences.ragged_rank}')
+    return (np.asarray(sequences.values),
+            np.asarray(sequences.row_lengths(), dtype='int64'))
+  sequences = [np.asarray(s) for s in sequences]
+  lengths = np.array([len(s) for s in sequences], dtype='int64')
+  non_empty = [s for s in sequences if len(s)]
+  if not non_empty:
+    return np.zeros((0,)), lengths
+  return np.concatenate(non_empty, axis=0), lengths
+
+
+def _get_bucket_boundaries(lengths, bucket_boundaries, num_buckets):
+  """Returns sorted bucket boundaries covering every sequence length."""
+  max_length = int(lengths.max())
+  if bucket_boundaries is None:
+    if num_buckets < 1:
+      raise ValueError(
+          f'`num_buckets` must be a positive integer. Received: {num_buckets}')
+    # Boundaries at the length quantiles, so buckets are about equally full.
+    sorted_lengths = np.sort(lengths)
+    quantiles = np.arange(1, num_buckets + 1) / num_buckets
+    positions = np.ceil(quantiles * len(lengths)).astype('int64') - 1
+    boundaries = sorted_lengths[np.clip(positions, 0, len(lengths) - 1)]
+  else:
+    boundaries = np.asarray(bucket_boundaries, dtype='int64')
+    if np.any(np.diff(boundaries) <= 0):
+      raise ValueError('`bucket_boundaries` must be strictly increasing. '
+                       f'Received: {bucket_boundaries}')
+    boundaries = boundaries[boundaries < max_length]
+  # A batch always has at least one timestep, even if all sequences are empty.
+  return np.unique(np.maximum(np.append(boundaries, max_length), 1))
@@ -0,0 +1,127 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for bucketed_sequences."""
+
+import tensorflow.compat.v2 as tf
+
+import numpy as np
+from keras.engine import data_adapter
+from keras.engine import sequential
+from keras.layers import core as core_layers
+from keras.layers import embeddings
+from keras.layers import pooling
+from keras.optimizer_v2 import gradient_descent
+from keras.preprocessing import sequence
+from keras.utils import bucketed_sequences
+
+
+def _get_sequences(num_samples=50, seed=0):
+  rng = np.random.RandomState(seed)
+  lengths = np.minimum(rng.zipf(1.5, size=num_samples), 40)
+  return [list(rng.randint(1, 10, size=length)) for length in lengths]
+
+
+class BucketedSequencesTest(tf.test.TestCase):
+
+  def test_batches_are_padded_to_bucket_boundary(self):
+    sequences = _get_sequences()
+    y = np.arange(len(sequences))
+    data = bucketed_sequences.BucketedSequences(
+        sequences, y, batch_size=8, num_buckets=4, padding='pre')
+    self.assertLessEqual(len(data.bucket_boundaries), 4)
+    self.assertEqual(data.bucket_boundaries[-1], max(map(len, sequences)))
+
+    seen = []
+    num_batches = 0
+    for x, y_batch in data.get_dataset(shuffle=True):
+      num_batches += 1
+      self.assertIn(x.shape[1], data.bucket_boundaries)
+      self.assertLessEqual(x.shape[0], 8)
+      for row, index in zip(x.numpy(), y_batch.numpy()):
+        expected = sequences[index]
+        self.assertAllEqual(row[x.shape[1] - len(expected):], expected)
+        self.assertAllEqual(row[:x.shape[1] - len(expected)],
+                            np.zeros(x.shape[1] - len(expected)))
+        seen.append(index)
+    self.assertEqual(num_batches, data.num_batches)
+    self.assertAllEqual(sorted(seen), y)
+
+  def test_bucket_boundaries(self):
+    sequences = [[1] * length for length in (1, 2, 3, 7, 9)]
+    data = bucketed_sequences.BucketedSequences(
+        sequences, bucket_boundaries=[2, 4, 20])
+    self.assertAllEqual(data.bucket_boundaries, [2, 4, 9])
+    batches = [x.shape for (x,) in data.get_dataset(shuffle=False)]
+    self.assertEqual(batches, [(2, 2), (1, 4), (2, 9)])
+
+    with self.assertRaisesRegex(ValueError, 'strictly increasing'):
+      bucketed_sequences.BucketedSequences(
+          sequences, bucket_boundaries=[4, 2])
+
+  def test_ragged_input(self):
+    sequences = _get_sequences()
+    ragged = tf.ragged.constant(sequences, dtype=tf.int32)
+    y = np.arange(len(sequences))
+    from_lists = bucketed_sequences.BucketedSequences(sequences, y)
+    from_ragged = bucketed_sequences.BucketedSequences(ragged, y)
+    for (x1, y1), (x2, y2) in zip(from_lists.get_dataset(shuffle=False),
+                                  from_ragged.get_dataset(shuffle=False)):
+      self.assertAllEqual(x1, x2)
+      self.assertAllEqual(y1, y2)
+
+  def test_list_targets(self):
+    sequences = _get_sequences()
+    y = list(range(len(sequences)))
+    from_list = bucketed_sequences.BucketedSequences(sequences, y)
+    from_array = bucketed_sequences.BucketedSequences(sequences, np.array(y))
+    for (x1, y1), (x2, y2) in zip(from_list.get_dataset(shuffle=False),
+                                  from_array.get_dataset(shuffle=False)):
+      self.assertAllEqual(x1, x2)
+      self.assertAllEqual(y1, y2)
+
+    # A list of arrays holds the targets of several outputs.
+    data = bucketed_sequences.BucketedSequences(
+        sequences, [np.array(y), np.array(y) * 2])
+    self.assertLen(data.y, 2)
+    self.assertAllEqual(data.y[0] * 2, data.y[1])
+
+  def test_model_fit_and_predict(self):
+    sequences = _get_sequences()
+    y = np.random.random((len(sequences), 1))
+    data = bucketed_sequences.BucketedSequences(
+        sequences, y, batch_size=8, num_buckets=3)
+    adapter_cls = data_adapter.select_data_adapter(data, None)
+    self.assertIs(adapter_cls, data_adapter.BucketedSequencesAdapter)
+
+    model = sequential.Sequential([
+        embeddings.Embedding(10, 4, mask_zero=True),
+        pooling.GlobalAveragePooling1D(),
+        core_layers.Dense(1)
+    ])
+    model.compile(gradient_descent.SGD(), loss='mse')
+    history = model.fit(data, epochs=2, verbose=0)
+    self.assertLen(history.history['loss'], 2)
+
+    predictions = data.restore_order(model.predict(data))
+    # Padding is masked, so predictions do not depend on the padded length.
+    expected = model.predict(sequence.pad_sequences(sequences, padding='post'))
+    self.assertAllClose(predictions, expected, atol=1e-6)
+
+    with self.assertRaisesRegex(ValueError, '`y` argument is not supported'):
+      model.fit(data, y, verbose=0)
+
+
+if __name__ == '__main__':
+  tf.test.main()
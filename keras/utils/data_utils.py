@@ -22,6 +22,7 @@ from abc import abstractmethod
 from contextlib import closing
 import functools
 import hashlib
+import json
 import multiprocessing.dummy
 import os
 import pathlib
@@ -29,6 +30,7 @@ import queue
 import random
 import shutil
 import tarfile
+import tempfile
 import threading
 import time
 import typing
@@ -97,7 +99,8 @@ def is_generator_or_sequence(x):
           isinstance(x, typing.Iterator))
 
 
-def _extract_archive(file_path, path='.', archive_format='auto'):
+def _extract_archive(file_path, path='.', archive_format='auto',
+                     extracted_names=None):
   """Extracts an archive if it matches tar, tar.gz, tar.bz, or zip formats.
 
   Args:
@@ -108,6 +111,8 @@ def _extract_archive(file_path, path='.', archive_format='auto'):
           'tar' includes tar, tar.gz, and tar.bz files.
           The default 'auto' is ['tar', 'zip'].
           None or an empty list will return no matches found.
+      extracted_names: Optional list, to which the names of the top-level
+          files and directories extracted from the archive are appended.
 
   Returns:
       True if a match was found and an archive extraction was completed,
@@ -127,9 +132,11 @@ def _extract_archive(file_path, path='.', archive_format='auto'):
     if archive_type == 'tar':
       open_fn = tarfile.open
       is_match_fn = tarfile.is_tarfile
+      names_fn = lambda archive: archive.getnames()
     if archive_type == 'zip':
       open_fn = zipfile.ZipFile
       is_match_fn = zipfile.is_zipfile
+      names_fn = lambda archive: archive.namelist()
 
     if is_match_fn(file_path):
       with open_fn(file_path) as archive:
@@ -142,6 +149,13 @@ def _extract_archive(file_path, path='.', archive_format='auto'):
             else:
               shutil.rmtree(path)
           raise
+        if extracted_names is not None:
+          extracted_names.extend(
+              sorted({
+                  pathlib.PurePosixPath(name).parts[0]
+                  for name in names_fn(archive)
+                  if pathlib.PurePosixPath(name).parts
+              }))
       return True
   return False
 
@@ -220,6 +234,7 @@ def get_file(fname=None,
     datadir_base = os.path.join('/tmp', '.keras')
   datadir = os.path.join(datadir_base, cache_subdir)
   _makedirs_exist_ok(datadir)
+  manifest_path = os.path.join(datadir_base, _MANIFEST_NAME)
 
   fname = path_to_string(fname)
   if not fname:
@@ -245,7 +260,8 @@ def get_file(fname=None,
   if os.path.exists(fpath):
     # File found; verify integrity if a hash was provided.
     if file_hash is not None:
-      if not validate_file(fpath, file_hash, algorithm=hash_algorithm):
+      if not _validate_file_with_manifest(fpath, file_hash, hash_algorithm,
+                                          manifest_path):
         print('A local file was found, but it seems to be '
               'incomplete or outdated because the ' + hash_algorithm +
               ' file hash does not match the original value of ' + file_hash +
@@ -285,12 +301,14 @@ def get_file(fname=None,
     ProgressTracker.progbar = None
 
   if untar:
-    if not os.path.exists(untar_fpath):
-      _extract_archive(fpath, datadir, archive_format='tar')
+    if download or _should_extract(fpath, datadir, manifest_path,
+                                   extracted_path=untar_fpath):
+      _extract_and_record(fpath, datadir, 'tar', manifest_path)
     return untar_fpath
 
   if extract:
-    _extract_archive(fpath, datadir, archive_format)
+    if download or _should_extract(fpath, datadir, manifest_path):
+      _extract_and_record(fpath, datadir, archive_format, manifest_path)
 
   return fpath
 
@@ -299,6 +317,122 @@ def _makedirs_exist_ok(datadir):
   os.makedirs(datadir, exist_ok=True)  # pylint: disable=unexpected-keyword-arg
 
 
+# Name of the manifest of the files verified and the archives extracted by
+# `get_file`, in the Keras cache dir. Files are identified by their absolute
+# path, size and modification time, so that unchanged files are not hashed or
+# extracted again.
+_MANIFEST_NAME = 'get_file_manifest.json'
+# Bytes read at a time when hashing files in `get_file`.
+_HASH_CHUNK_SIZE = 2**22
+_MANIFEST_LOCK = threading.Lock()
+
+
+def _get_file_signature(fpath):
+  stat = os.stat(fpath)
+  return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _read_manifest(manifest_path):
+  """Reads the manifest of `get_file`, or returns an empty one."""
+  try:
+    with open(manifest_path) as f:
+      manifest = json.load(f)
+  except (IOError, ValueError):
+    manifest = {}
+  if not isinstance(manifest, dict):
+    manifest = {}
+  manifest.setdefault('hashes', {})
+  manifest.setdefault('extractions', {})
+  return manifest
+
+
+def _update_manifest(manifest_path, section, fpath, entry):
+  """Records the entry of a file in the manifest of `get_file`.
+
+  The manifest is read again before being updated, and replaced atomically, so
+  that concurrent processes do not corrupt it. Errors are ignored, since the
+  manifest is only an optimization.
+
+  Args:
+    manifest_path: Path of the manifest.
+    section: `'hashes'` or `'extractions'`.
+    fpath: Absolute path of the file.
+    entry: JSON-serializable dict to record.
+  """
+  with _MANIFEST_LOCK:
+    manifest = _read_manifest(manifest_path)
+    manifest[section][fpath] = entry
+    tmp_path = None
+    try:
+      fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path))
+      with os.fdopen(fd, 'w') as f:
+        json.dump(manifest, f)
+      os.replace(tmp_path, manifest_path)
+    except OSError:
+      if tmp_path is not None and os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+
+def _validate_file_with_manifest(fpath, file_hash, algorithm, manifest_path):
+  """Validates a file, unless it was already verified since its last change."""
+  fpath = os.path.abspath(fpath)
+  signature = _get_file_signature(fpath)
+  entry = _read_manifest(manifest_path)['hashes'].get(fpath)
+  if entry is not None and entry.get('signature') == signature:
+    if str(file_hash) in entry.get('hashes', []):
+      return True
+    entry = {'signature': signature, 'hashes': entry.get('hashes', [])}
+  else:
+    entry = {'signature': signature, 'hashes': []}
+
+  if not validate_file(fpath, file_hash, algorithm,
+                       chunk_size=_HASH_CHUNK_SIZE):
+    return False
+  entry['hashes'].append(str(file_hash))
+  _update_manifest(manifest_path, 'hashes', fpath, entry)
+  return True
+
+
+def _should_extract(fpath, datadir, manifest_path, extracted_path=None):
+  """Returns whether the tree extracted from an archive is missing or stale.
+
+  Args:
+    fpath: Path of the archive.
+    datadir: Directory in which the archive is extracted.
+    manifest_path: Path of the manifest of `get_file`.
+    extracted_path: Optional path that extraction is known to create.
+
+  Returns:
+    Whether the archive must be extracted.
+  """
+  if extracted_path is not None and not os.path.exists(extracted_path):
+    return True
+  entry = _read_manifest(manifest_path)['extractions'].get(
+      os.path.abspath(fpath))
+  if entry is None:
+    # Archives extracted before the manifest was introduced are only known
+    # through `extracted_path`.
+    return extracted_path is None
+  if (entry.get('signature') != _get_file_signature(fpath) or
+      entry.get('path') != os.path.abspath(datadir)):
+    return True
+  return not all(
+      os.path.exists(os.path.join(datadir, name))
+      for name in entry.get('names', ()))
+
+
+def _extract_and_record(fpath, datadir, archive_format, manifest_path):
+  """Extracts an archive and records the extraction in the manifest."""
+  names = []
+  if _extract_archive(fpath, datadir, archive_format, extracted_names=names):
+    _update_manifest(
+        manifest_path, 'extractions', os.path.abspath(fpath), {
+            'signature': _get_file_signature(fpath),
+            'path': os.path.abspath(datadir),
+            'names': names,
+        })
+
+
 def _resolve_hasher(algorithm, file_hash=None):
   """Returns hash algorithm as hashlib function."""
   if algorithm == 'sha256':
@@ -335,13 +469,53 @@ def _hash_file(fpath, algorithm='sha256', chunk_size=65535):
   else:
     hasher = algorithm
 
-  with open(fpath, 'rb') as fpath_file:
-    for chunk in iter(lambda: fpath_file.read(chunk_size), b''):
+  if os.path.getsize(fpath) <= chunk_size:
+    with open(fpath, 'rb') as fpath_file:
+      hasher.update(fpath_file.read())
+  else:
+    for chunk in _read_ahead(fpath, chunk_size):
       hasher.update(chunk)
 
   return hasher.hexdigest()
 
 
+def _read_ahead(fpath, chunk_size):
+  """Yields the chunks of a file, reading the next chunk in a thread.
+
+  `hashlib` releases the GIL while hashing large chunks, so this overlaps
+  reading the file with hashing it.
+
+  Args:
+      fpath: path to the file to read.
+      chunk_size: Bytes to read at a time.
+
+  Yields:
+      The chunks of the file.
+  """
+  chunks = queue.Queue(maxsize=2)
+
+  def read():
+    try:
+      with open(fpath, 'rb') as fpath_file:
+        for chunk in iter(lambda: fpath_file.read(chunk_size), b''):
+          chunks.put(chunk)
+    except Exception as e:  # pylint: disable=broad-except
+      chunks.put(e)
+      return
+    chunks.put(None)
+
+  reader = threading.Thread(target=read, daemon=True)
+  reader.start()
+  while True:
+    chunk = chunks.get()
+    if chunk is None:
+      break
+    if isinstance(chunk, Exception):
+      raise chunk
+    yield chunk
+  reader.join()
+
+
 def validate_file(fpath, file_hash, algorithm='auto', chunk_size=65535):
   """Validates a file against a sha256 or md5 hash.
 
@@ -18,7 +18,9 @@ import tensorflow.compat.v2 as tf
 
 from itertools import cycle
 import os
+import shutil
 import tarfile
+from unittest import mock
 import urllib
 import zipfile
 
@@ -126,6 +128,58 @@ class TestGetFile(tf.test.TestCase):
     self.assertEndsWith(path, '.txt')
     self.assertTrue(os.path.exists(path))
 
+  def test_get_file_skips_verified_and_extracted_files(self):
+    cache_dir = self.get_temp_dir()
+    orig_dir = self.get_temp_dir()
+
+    text_file_path = os.path.join(orig_dir, 'test.txt')
+    tar_file_path = os.path.join(orig_dir, 'manifest_test.tar.gz')
+    with open(text_file_path, 'w') as text_file:
+      text_file.write('Float like a butterfly, sting like a bee.')
+    with tarfile.open(tar_file_path, 'w:gz') as tar_file:
+      tar_file.add(text_file_path, arcname='manifest_test/test.txt')
+    origin = urllib.parse.urljoin(
+        'file://', urllib.request.pathname2url(os.path.abspath(tar_file_path)))
+    hashval_sha256 = data_utils._hash_file(tar_file_path)
+
+    def get_file():
+      return data_utils.get_file(
+          origin=origin, file_hash=hashval_sha256, extract=True,
+          cache_dir=cache_dir)
+
+    path = get_file()
+    extracted_path = os.path.join(os.path.dirname(path), 'manifest_test')
+    self.assertTrue(os.path.exists(extracted_path))
+
+    with mock.patch.object(
+        data_utils, 'validate_file',
+        wraps=data_utils.validate_file) as validate_file, mock.patch.object(
+            data_utils, '_extract_archive',
+            wraps=data_utils._extract_archive) as extract_archive:
+      # The file is verified once, and was already extracted.
+      get_file()
+      get_file()
+      self.assertEqual(validate_file.call_count, 1)
+      self.assertEqual(extract_archive.call_count, 0)
+
+      # A missing extracted tree is extracted again.
+      os.remove(os.path.join(extracted_path, 'test.txt'))
+      os.rmdir(extracted_path)
+      get_file()
+      self.assertEqual(extract_archive.call_count, 1)
+      self.assertTrue(os.path.exists(extracted_path))
+
+      # A modified file is verified again.
+      with open(path, 'ab') as f:
+        f.write(b'corrupted')
+      with mock.patch.object(
+          data_utils, 'urlretrieve',
+          side_effect=lambda url, fpath, hook: shutil.copy(tar_file_path, fpath)
+      ) as urlretrieve:
+        get_file()
+      self.assertEqual(validate_file.call_count, 2)
+      urlretrieve.assert_called_once()
+
 
 class TestSequence(keras.utils.data_utils.Sequence):
 
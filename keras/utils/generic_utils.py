@@ -863,6 +863,18 @@ class Progbar:
     self._time_at_epoch_end = None
     self._time_after_first_step = None
 
+  def is_update_due(self):
+    """Returns whether the next `update` call would redraw the progress bar.
+
+    With `verbose=1`, the progress bar is only redrawn every `interval`
+    seconds, so callers can skip computing the values of updates that would
+    not be displayed. Final updates are always displayed.
+
+    Returns:
+        Whether `interval` seconds have elapsed since the last redraw.
+    """
+    return time.time() - self._last_update >= self.interval
+
   def update(self, current, values=None, finalize=None):
     """Updates the progress bar.
 
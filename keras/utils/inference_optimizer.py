@@ -0,0 +1,387 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Rewrites of Functional models that make inference faster."""
+
+import tensorflow.compat.v2 as tf
+
+import collections
+
+import numpy as np
+from keras import activations
+from keras import backend
+from keras.engine import input_layer
+from keras.engine import training
+from keras.layers import convolutional
+from keras.layers.core import dense
+from keras.layers.normalization import batch_normalization
+from keras.layers.normalization import batch_normalization_v1
+from keras.layers.preprocessing import image_preprocessing
+from keras.layers.preprocessing import normalization
+from tensorflow.python.util.tf_export import keras_export
+
+# The layer types are returned by functions rather than stored in constants,
+# since `keras.utils` is imported while the layer modules are initialized.
+
+
+def _linear_layers():
+  """Returns the types of the layers into which affine transforms are folded.
+
+  These layers compute a linear function of their inputs along the channel
+  axis. Exact types are used, since subclasses may change `call`.
+  """
+  return (
+      convolutional.Conv1D,
+      convolutional.Conv2D,
+      convolutional.Conv3D,
+      convolutional.DepthwiseConv1D,
+      convolutional.DepthwiseConv2D,
+      dense.Dense,
+  )
+
+
+def _depthwise_layers():
+  return (
+      convolutional.DepthwiseConv1D,
+      convolutional.DepthwiseConv2D,
+  )
+
+
+def _batch_normalization_layers():
+  return (
+      batch_normalization.BatchNormalization,
+      batch_normalization.SyncBatchNormalization,
+      batch_normalization_v1.BatchNormalization,
+  )
+
+
+def _input_affine_layers():
+  return (
+      image_preprocessing.Rescaling,
+      normalization.Normalization,
+  )
+
+
+@keras_export('keras.utils.optimize_for_inference', v1=[])
+def optimize_for_inference(model):
+  """Returns an equivalent model with fewer layers to run for inference.
+
+  The following rewrites are applied to the layers of the model:
+
+  - A `BatchNormalization` layer following a `Conv1D`, `Conv2D`, `Conv3D`,
+    `DepthwiseConv1D`, `DepthwiseConv2D` or `Dense` layer without activation
+    is removed, and its scale and shift (computed from its moving statistics)
+    are folded into the kernel and bias of the preceding layer.
+  - `Rescaling` and `Normalization` layers directly preceding one of these
+    layers are removed, and folded into its kernel and bias. Convolutions
+    with `'same'` or `'causal'` padding are only merged with layers that do
+    not shift their inputs, since the padding would be shifted too.
+
+  Layers are only rewritten when the result is equivalent, e.g. when the
+  intermediate outputs are not used by other layers. Nested Functional models
+  are optimized too. The returned model uses new layers and weights, and can
+  be saved like any Functional model.
+
+  ```python
+  model = tf.keras.applications.ResNet50()
+  serving_model = tf.keras.utils.optimize_for_inference(model)
+  serving_model.save('resnet50')
+  ```
+
+  The returned model must only be used for inference: training it does not
+  update the folded statistics, and layers and losses that are not used to
+  compute its outputs (e.g. added with `add_loss`) are dropped. It is not
+  compiled.
+
+  Args:
+    model: A Functional or Sequential `tf.keras.Model` built on inputs.
+
+  Returns:
+    A Functional `tf.keras.Model` computing the same outputs as `model` in
+    inference mode.
+
+  Raises:
+    ValueError: If `model` is not a Functional model.
+  """
+  if not isinstance(model, training.Model) or not model._is_graph_network:  # pylint: disable=protected-access
+    raise ValueError('`optimize_for_inference` only supports Functional '
+                     'models, or Sequential models built on inputs. '
+                     f'Received: model={model}')
+
+  # pylint: disable=protected-access
+  nodes = []
+  for depth in sorted(model._nodes_by_depth, reverse=True):
+    # Nodes with a negative depth do not compute the outputs.
+    if depth >= 0:
+      nodes.extend(model._nodes_by_depth[depth])
+  # pylint: enable=protected-access
+  graph = _Graph(nodes, model.outputs)
+
+  # Layers to remove, and the affine transformations to fold into the linear
+  # layers: `input_folds` maps linear layers to the `(layer, scale, offset)`
+  # of the layers preceding them, from the closest one, and `output_folds` to
+  # the batch normalization layers following them.
+  input_folds = {}
+  output_folds = {}
+  for node in nodes:
+    layer = node.layer
+    if type(layer) not in _linear_layers() or len(layer._inbound_nodes) != 1:  # pylint: disable=protected-access
+      continue
+    folds = _get_input_folds(layer, node, graph)
+    if folds:
+      input_folds[layer] = folds
+    batch_normalization_layer = _get_output_fold(layer, node, graph)
+    if batch_normalization_layer is not None:
+      output_folds[layer] = [batch_normalization_layer]
+  removed_layers = set()
+  for folds in input_folds.values():
+    removed_layers.update(input_layer_ for input_layer_, _, _ in folds)
+  for folds in output_folds.values():
+    removed_layers.update(folds)
+
+  # Rebuilds the graph, mapping the outputs of removed layers to their inputs.
+  tensor_map = {}
+  new_layers = {}
+  for node in nodes:
+    layer = node.layer
+    if node.is_input:
+      new_layer = input_layer.InputLayer(**layer.get_config())
+      tensor_map[id(node.outputs)] = new_layer.output
+      continue
+    if layer in removed_layers:
+      tensor_map[id(node.outputs)] = tensor_map[id(node.keras_inputs[0])]
+      continue
+    if layer not in new_layers:
+      new_layers[layer] = _copy_layer(
+          layer, use_bias=layer in input_folds or layer in output_folds)
+    args, kwargs = tf.nest.map_structure(
+        lambda t: tensor_map.get(id(t), t), (node.call_args, node.call_kwargs))
+    outputs = new_layers[layer](*args, **kwargs)
+    for tensor, new_tensor in zip(
+        tf.nest.flatten(node.outputs), tf.nest.flatten(outputs)):
+      tensor_map[id(tensor)] = new_tensor
+
+  inputs = tf.nest.map_structure(
+      lambda t: tensor_map[id(t)], model._nested_inputs)  # pylint: disable=protected-access
+  outputs = tf.nest.map_structure(
+      lambda t: tensor_map[id(t)], model._nested_outputs)  # pylint: disable=protected-access
+  new_model = training.Model(inputs, outputs, name=model.name)
+
+  weight_value_tuples = []
+  for layer, new_layer in new_layers.items():
+    if _is_functional(layer):
+      continue  # Already set by the recursive call.
+    if layer in input_folds or layer in output_folds:
+      weights = _fold(layer, input_folds.get(layer, ()),
+                      output_folds.get(layer, ()))
+    else:
+      weights = layer.get_weights()
+    weight_value_tuples.extend(zip(new_layer.weights, weights))
+  backend.batch_set_value(weight_value_tuples)
+  return new_model
+
+
+class _Graph:
+  """The nodes consuming every Keras tensor of a model."""
+
+  def __init__(self, nodes, outputs):
+    self._consumers = collections.defaultdict(list)
+    for node in nodes:
+      for tensor in node.keras_inputs:
+        self._consumers[id(tensor)].append(node)
+    self._output_ids = {id(tensor) for tensor in outputs}
+
+  def get_only_consumer(self, tensor):
+    """Returns the node consuming `tensor`, or `None` if it is used elsewhere."""
+    consumers = self._consumers[id(tensor)]
+    if len(consumers) != 1 or id(tensor) in self._output_ids:
+      return None
+    return consumers[0]
+
+
+def _is_functional(layer):
+  return isinstance(layer, training.Model) and layer._is_graph_network  # pylint: disable=protected-access
+
+
+def _copy_layer(layer, use_bias=False):
+  """Returns a new layer with the config of `layer`."""
+  if _is_functional(layer):
+    return optimize_for_inference(layer)
+  config = layer.get_config()
+  if use_bias:
+    config['use_bias'] = True
+  return layer.__class__.from_config(config)
+
+
+def _get_channel_axis(layer, rank):
+  """Returns the positive channel axis of the inputs and outputs of `layer`."""
+  if isinstance(layer, convolutional.Conv):
+    return layer._get_channel_axis() % rank  # pylint: disable=protected-access
+  return rank - 1
+
+
+def _is_single_input_call(node):
+  """Whether `node` calls its layer on one tensor, in inference mode."""
+  if len(node.keras_inputs) != 1 or len(tf.nest.flatten(node.call_args)) != 1:
+    return False
+  training_arg = node.call_kwargs.get('training')
+  return (set(node.call_kwargs) <= {'training'} and
+          (training_arg is None or training_arg is False))
+
+
+def _get_input_folds(layer, node, graph):
+  """Returns the `(layer, scale, offset)` to fold into the inputs of `layer`.
+
+  Args:
+    layer: A linear layer.
+    node: The node of `layer`.
+    graph: The `_Graph` of the model.
+
+  Returns:
+    A list with the `Rescaling` and `Normalization` layers directly preceding
+    `layer`, from the closest one, and the scale and offset they apply to the
+    input channels.
+  """
+  folds = []
+  if not _is_single_input_call(node) or getattr(layer, 'groups', 1) != 1:
+    return folds
+  padding = getattr(layer, 'padding', 'valid')
+  rank = node.keras_inputs[0].shape.rank
+  while True:
+    tensor = node.keras_inputs[0]
+    if graph.get_only_consumer(tensor) is not node:
+      break
+    input_layer_ = tensor._keras_history.layer  # pylint: disable=protected-access
+    if (type(input_layer_) not in _input_affine_layers() or
+        len(input_layer_._inbound_nodes) != 1):  # pylint: disable=protected-access
+      break
+    node = input_layer_._inbound_nodes[0]  # pylint: disable=protected-access
+    # Integer inputs are cast by the removed layer, and not by `layer`.
+    if (not _is_single_input_call(node) or
+        not node.keras_inputs[0].dtype.is_floating):
+      break
+    affine = _get_input_affine(input_layer_, layer, rank)
+    if affine is None:
+      break
+    scale, offset = affine
+    # Padding values would not be shifted.
+    if padding != 'valid' and np.any(offset):
+      break
+    folds.append((input_layer_, scale, offset))
+  return folds
+
+
+def _get_output_fold(layer, node, graph):
+  """Returns the batch normalization layer to fold into `layer`, if any."""
+  if layer.activation is not activations.linear:
+    return None
+  next_node = graph.get_only_consumer(node.outputs)
+  if next_node is None:
+    return None
+  next_layer = next_node.layer
+  if (type(next_layer) not in _batch_normalization_layers() or
+      len(next_layer._inbound_nodes) != 1 or  # pylint: disable=protected-access
+      not _is_single_input_call(next_node)):
+    return None
+  channel_axis = _get_channel_axis(layer, node.outputs.shape.rank)
+  if next_layer.axis != [channel_axis]:
+    return None
+  return next_layer
+
+
+def _get_input_affine(input_layer_, layer, rank):
+  """Returns `(scale, offset)` computed by `input_layer_` along channels.
+
+  Args:
+    input_layer_: A `Rescaling` or `Normalization` layer.
+    layer: The linear layer it is followed by.
+    rank: Rank of the inputs of `layer`.
+
+  Returns:
+    A tuple of 1D NumPy arrays with 1 or as many values as input channels, or
+    `None` if `input_layer_` does not compute the same affine transformation
+    for all the values of a channel.
+  """
+  if isinstance(input_layer_, image_preprocessing.Rescaling):
+    scale = np.asarray(input_layer_.scale, dtype='float64')
+    offset = np.asarray(input_layer_.offset, dtype='float64')
+    if scale.size != 1 or offset.size != 1:
+      return None
+    return scale.reshape(1), offset.reshape(1)
+
+  mean = np.asarray(backend.get_value(input_layer_.mean), dtype='float64')
+  variance = np.asarray(
+      backend.get_value(input_layer_.variance), dtype='float64')
+  channel_axis = _get_channel_axis(layer, rank)
+  if any(dim != 1 and axis != channel_axis
+         for axis, dim in enumerate(mean.shape)):
+    return None
+  scale = 1. / np.maximum(np.sqrt(variance.reshape(-1)), backend.epsilon())
+  return scale, -mean.reshape(-1) * scale
+
+
+def _fold(layer, input_folds, output_folds):
+  """Returns the weights of `layer` with the given layers folded in.
+
+  Args:
+    layer: A linear layer.
+    input_folds: List of `(layer, scale, offset)` of the layers preceding
+      `layer`, from the closest one.
+    output_folds: List of batch normalization layers following `layer`.
+
+  Returns:
+    The list `[kernel, bias]` of NumPy arrays.
+  """
+  weights = layer.get_weights()
+  kernel = weights[0].astype('float64')
+  if layer.use_bias:
+    bias = weights[1].astype('float64')
+  else:
+    bias = np.zeros(np.prod(kernel.shape[-2:]) if type(layer) in
+                    _depthwise_layers() else kernel.shape[-1])
+  is_depthwise = type(layer) in _depthwise_layers()
+  # The input channels are the next-to-last axis of all the kernels.
+  input_shape = [1] * kernel.ndim
+  input_shape[-2] = -1
+  for _, scale, offset in input_folds:
+    offsets = kernel * offset.reshape(input_shape)
+    kernel = kernel * scale.reshape(input_shape)
+    if is_depthwise:
+      bias = bias + offsets.sum(axis=tuple(range(kernel.ndim - 2))).reshape(-1)
+    else:
+      bias = bias + offsets.sum(axis=tuple(range(kernel.ndim - 1)))
+
+  for batch_normalization_layer in output_folds:
+    scale, shift = _get_batch_normalization_affine(batch_normalization_layer)
+    if is_depthwise:
+      kernel = kernel * scale.reshape(kernel.shape[-2:])
+    else:
+      kernel = kernel * scale
+    bias = bias * scale + shift
+
+  dtype = weights[0].dtype
+  return [kernel.astype(dtype), bias.astype(dtype)]
+
+
+def _get_batch_normalization_affine(layer):
+  """Returns the `(scale, shift)` applied by `layer` in inference mode."""
+  mean = backend.get_value(layer.moving_mean).astype('float64')
+  variance = backend.get_value(layer.moving_variance).astype('float64')
+  scale = 1. / np.sqrt(variance + layer.epsilon)
+  if layer.scale:
+    scale = scale * backend.get_value(layer.gamma)
+  shift = -mean * scale
+  if layer.center:
+    shift = shift + backend.get_value(layer.beta)
+  return scale, shift
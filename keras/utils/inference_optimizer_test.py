@@ -0,0 +1,140 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for inference_optimizer."""
+
+import os
+
+import keras
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+from keras.utils import inference_optimizer
+
+
+def _randomize_batch_normalization(model):
+  for layer in model.layers:
+    if isinstance(layer, keras.layers.BatchNormalization):
+      # Positive values are valid for all the weights, including variances.
+      layer.set_weights([
+          np.random.uniform(0.5, 1.5, size=w.shape)
+          for w in layer.get_weights()
+      ])
+
+
+def _layer_types(model):
+  return [layer.__class__.__name__ for layer in model.layers]
+
+
+class OptimizeForInferenceTest(tf.test.TestCase):
+
+  def _assert_equivalent(self, model, optimized_model, x):
+    self.assertAllClose(
+        model(x, training=False),
+        optimized_model(x, training=False),
+        rtol=1e-4,
+        atol=1e-4)
+
+  def test_fold_into_convolutions_and_dense(self):
+    inputs = keras.Input(shape=(8, 8, 3))
+    x = keras.layers.Rescaling(1. / 255)(inputs)
+    x = keras.layers.Conv2D(4, 3)(x)
+    x = keras.layers.BatchNormalization()(x)
+    x = keras.layers.ReLU()(x)
+    x = keras.layers.DepthwiseConv2D(
+        3, padding='same', depth_multiplier=2, use_bias=False)(x)
+    x = keras.layers.BatchNormalization()(x)
+    x = keras.layers.GlobalAveragePooling2D()(x)
+    x = keras.layers.Dense(5)(x)
+    outputs = keras.layers.BatchNormalization()(x)
+    model = keras.Model(inputs, outputs)
+    _randomize_batch_normalization(model)
+
+    optimized_model = inference_optimizer.optimize_for_inference(model)
+    self.assertEqual(
+        _layer_types(optimized_model),
+        ['InputLayer', 'Conv2D', 'ReLU', 'DepthwiseConv2D',
+         'GlobalAveragePooling2D', 'Dense'])
+    self._assert_equivalent(model, optimized_model,
+                            np.random.uniform(0, 255, size=(2, 8, 8, 3)))
+
+  def test_fold_normalization_chain(self):
+    x = np.random.uniform(0, 255, size=(16, 6, 6, 3))
+    normalization = keras.layers.Normalization()
+    normalization.adapt(x / 127.5 - 1.)
+    model = keras.Sequential([
+        keras.Input(shape=(6, 6, 3)),
+        keras.layers.Rescaling(1. / 127.5, offset=-1.),
+        normalization,
+        keras.layers.Conv2D(4, 3, activation='relu'),
+    ])
+
+    optimized_model = inference_optimizer.optimize_for_inference(model)
+    self.assertEqual(_layer_types(optimized_model), ['InputLayer', 'Conv2D'])
+    self._assert_equivalent(model, optimized_model, x)
+
+  def test_layers_are_not_folded_when_not_equivalent(self):
+    inputs = keras.Input(shape=(6, 6, 3))
+    # The offset would be applied to the padding.
+    x = keras.layers.Rescaling(2., offset=1.)(inputs)
+    conv = keras.layers.Conv2D(4, 3, padding='same')(x)
+    # The outputs of the convolution are used twice.
+    bn = keras.layers.BatchNormalization()(conv)
+    x = keras.layers.Add()([conv, bn])
+    # The activation is applied before batch normalization.
+    x = keras.layers.Conv2D(4, 3, activation='relu')(x)
+    outputs = keras.layers.BatchNormalization()(x)
+    model = keras.Model(inputs, outputs)
+    _randomize_batch_normalization(model)
+
+    optimized_model = inference_optimizer.optimize_for_inference(model)
+    self.assertEqual(_layer_types(optimized_model), _layer_types(model))
+    self._assert_equivalent(model, optimized_model,
+                            np.random.uniform(size=(2, 6, 6, 3)))
+
+  def test_nested_model_and_saving(self):
+    inner_inputs = keras.Input(shape=(4,))
+    x = keras.layers.Dense(8, use_bias=False)(inner_inputs)
+    inner_outputs = keras.layers.BatchNormalization()(x)
+    inner_model = keras.Model(inner_inputs, inner_outputs, name='inner')
+    inputs = keras.Input(shape=(4,))
+    outputs = keras.layers.Dense(2)(inner_model(inputs))
+    model = keras.Model(inputs, outputs)
+    _randomize_batch_normalization(inner_model)
+
+    optimized_model = inference_optimizer.optimize_for_inference(model)
+    self.assertEqual(
+        _layer_types(optimized_model.get_layer('inner')),
+        ['InputLayer', 'Dense'])
+    x = np.random.uniform(size=(3, 4))
+    self._assert_equivalent(model, optimized_model, x)
+
+    path = os.path.join(self.get_temp_dir(), 'optimized_model')
+    optimized_model.save(path)
+    loaded_model = keras.models.load_model(path)
+    self.assertAllClose(loaded_model(x), optimized_model(x))
+
+  def test_subclassed_model(self):
+
+    class MyModel(keras.Model):
+
+      def call(self, inputs):
+        return inputs
+
+    with self.assertRaisesRegex(ValueError, 'only supports Functional'):
+      inference_optimizer.optimize_for_inference(MyModel())
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -104,13 +104,23 @@ def count_params(weights):
       The total number of scalars composing the weights
   """
   unique_weights = {id(w): w for w in weights}.values()
-  # Ignore TrackableWeightHandlers, which will not have a shape defined.
-  unique_weights = [w for w in unique_weights if hasattr(w, 'shape')]
-  weight_shapes = [w.shape.as_list() for w in unique_weights]
-  standardized_weight_shapes = [
-      [0 if w_i is None else w_i for w_i in w] for w in weight_shapes
-  ]
-  return int(sum(np.prod(p) for p in standardized_weight_shapes))
+  total = 0
+  for w in unique_weights:
+    # Ignore TrackableWeightHandlers, which will not have a shape defined.
+    if hasattr(w, 'shape'):
+      # `None` when a dimension is unknown, which counts as zero parameters.
+      total += w.shape.num_elements() or 0
+  return int(total)
+
+
+def get_summary_output_shape(layer):
+  """Returns the output shape of `layer` as displayed by `print_summary`."""
+  try:
+    return layer.output_shape
+  except AttributeError:
+    return 'multiple'
+  except RuntimeError:  # output_shape unknown in Eager mode.
+    return '?'
 
 
 def print_summary(model,
@@ -141,6 +151,8 @@ def print_summary(model,
   if print_fn is None:
     print_fn = print
 
+  # Structural information cached by `Functional` models.
+  index = model._structural_index if model._is_graph_network else None
   if model.__class__.__name__ == 'Sequential':
     sequential_like = True
   elif not model._is_graph_network:
@@ -148,31 +160,7 @@ def print_summary(model,
     # purposes.
     sequential_like = True
   else:
-    sequential_like = True
-    nodes_by_depth = model._nodes_by_depth.values()
-    nodes = []
-    for v in nodes_by_depth:
-      if (len(v) > 1) or (len(v) == 1 and
-                          len(tf.nest.flatten(v[0].keras_inputs)) > 1):
-        # if the model has multiple nodes
-        # or if the nodes have multiple inbound_layers
-        # the model is no longer sequential
-        sequential_like = False
-        break
-      nodes += v
-    if sequential_like:
-      # search for shared layers
-      for layer in model.layers:
-        flag = False
-        for node in layer._inbound_nodes:
-          if node in nodes:
-            if flag:
-              sequential_like = False
-              break
-            else:
-              flag = True
-        if not sequential_like:
-          break
+    sequential_like = index.sequential_like
 
   if sequential_like:
     line_length = line_length or 65
@@ -188,9 +176,6 @@ def print_summary(model,
       positions = [int(line_length * p) for p in positions]
     # header names for the different log elements
     to_display = ['Layer (type)', 'Output Shape', 'Param #', 'Connected to']
-    relevant_nodes = []
-    for v in model._nodes_by_depth.values():
-      relevant_nodes += v
 
   if show_trainable:
     line_length += 11
@@ -243,6 +228,11 @@ def print_summary(model,
   print_row(to_display, positions)
   print_fn('=' * line_length)
 
+  def get_output_shape(layer):
+    if index is not None:
+      return index.get_output_shape(layer)
+    return get_summary_output_shape(layer)
+
   def print_layer_summary(layer, nested_level=0):
     """Prints a summary for a single layer.
 
@@ -251,12 +241,7 @@ def print_summary(model,
         nested_level: level of nesting of the layer inside its parent layer
           (e.g. 0 for a top-level layer, 1 for a nested layer).
     """
-    try:
-      output_shape = layer.output_shape
-    except AttributeError:
-      output_shape = 'multiple'
-    except RuntimeError:  # output_shape unknown in Eager mode.
-      output_shape = '?'
+    output_shape = get_output_shape(layer)
     name = layer.name
     cls_name = layer.__class__.__name__
     if not layer.built and not getattr(layer, '_is_graph_network', False):
@@ -280,19 +265,17 @@ def print_summary(model,
         nested_level: level of nesting of the layer inside its parent layer
           (e.g. 0 for a top-level layer, 1 for a nested layer).
     """
-    try:
-      output_shape = layer.output_shape
-    except AttributeError:
-      output_shape = 'multiple'
-    connections = []
-    for node in layer._inbound_nodes:
-      if relevant_nodes and node not in relevant_nodes:
-        # node is not part of the current network
-        continue
-
-      for inbound_layer, node_index, tensor_index, _ in node.iterate_inbound():
-        connections.append('{}[{}][{}]'.format(inbound_layer.name, node_index,
-                                               tensor_index))
+    output_shape = get_output_shape(layer)
+    if layer in index.inbound:
+      inbound = index.inbound[layer]
+    else:
+      # A layer of a nested model. Its nodes are not part of the current
+      # network.
+      inbound = []
+    connections = [
+        '{}[{}][{}]'.format(inbound_layer.name, node_index, tensor_index)
+        for inbound_layer, node_index, tensor_index in inbound
+    ]
 
     name = layer.name
     cls_name = layer.__class__.__name__
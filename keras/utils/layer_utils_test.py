@@ -77,6 +77,38 @@ class LayerUtilsTest(tf.test.TestCase):
     except ImportError:
       pass
 
+  def test_print_summary_connections(self):
+    inputs = keras.Input(shape=(4,), name='input')
+    shared = keras.layers.Dense(3, name='shared')
+    x = shared(inputs)
+    outputs = keras.layers.Add(name='add')([x, inputs[:, :3]])
+    model = keras.Model(inputs, outputs)
+    # Calling the layer outside of the model changes its output shape.
+    shared(keras.Input(shape=(2, 4)))
+
+    lines = []
+    layer_utils.print_summary(model, print_fn=lines.append)
+    text = '\n'.join(lines)
+    self.assertIn('Connected to', text)
+    self.assertIn("['shared[0][0]',", text)
+    self.assertRegex(text, r'shared \(Dense\) +multiple')
+    self.assertIn('Total params: 15', text)
+    self.assertFalse(model._structural_index.sequential_like)
+
+    # The cached index is rebuilt when layers are inserted in the graph.
+    index = model._structural_index
+    self.assertIs(model._structural_index, index)
+    model.add_metric(keras.backend.mean(outputs), name='mean')
+    self.assertIsNot(model._structural_index, index)
+
+  def test_count_params(self):
+    weights = [
+        tf.Variable(tf.zeros((3, 4))),
+        tf.Variable(1.),
+        tf.Variable(tf.zeros((5,)), shape=tf.TensorShape([None])),
+    ]
+    self.assertEqual(layer_utils.count_params(weights + weights[:1]), 13)
+
   def test_print_summary_expand_nested(self):
     shape = (None, None, 3)
 
@@ -0,0 +1,353 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Per-layer latency and activation memory profiling of Keras models."""
+
+import tensorflow.compat.v2 as tf
+
+import time
+
+import numpy as np
+from tensorflow.python.util.tf_export import keras_export
+
+_SORT_KEYS = ('total', 'forward', 'backward', 'memory', None)
+
+
+@keras_export('keras.utils.profile_model', v1=[])
+def profile_model(model,
+                  sample_batch,
+                  training=False,
+                  runs=10,
+                  warmup_runs=1,
+                  sort_by='total',
+                  trace_dir=None,
+                  line_length=98,
+                  print_fn=None):
+  """Profiles the latency and activation memory of the layers of a model.
+
+  Every top-level layer of `model` (see `model.layers`) is timed while the
+  model is called eagerly on `sample_batch`:
+
+  - the forward time is the duration of the layer's `call`.
+  - the backward time is the duration of the gradient of the layer's outputs
+    with respect to its inputs and trainable weights. It is computed
+    separately for every layer, with an upstream gradient of ones.
+
+  Asynchronous devices are synchronized after every measurement. Times are
+  the medians over `runs` calls of the model, after `warmup_runs` calls that
+  are not measured. Nested models are profiled as a single layer.
+
+  The activation memory of a layer is the size of its outputs. The peak live
+  activation memory is the largest total size of the layer outputs that are
+  alive at the same time during inference, i.e. between the call producing
+  them and the last call consuming them. During training, all activations
+  are kept alive for the backward pass, so the total activation memory is
+  reported as well.
+
+  The results are printed as a table ranked by `sort_by`:
+
+  >>> model = tf.keras.Sequential([
+  ...     tf.keras.layers.Dense(256, input_shape=(32,)),
+  ...     tf.keras.layers.Dense(8)])
+  >>> profile = tf.keras.utils.profile_model(
+  ...     model, tf.ones((64, 32)), sort_by=None, print_fn=lambda line: None)
+  >>> [layer['output_bytes'] for layer in profile['layers']]
+  [65536, 2048]
+  >>> profile['peak_activation_bytes']
+  67584
+
+  Eager timings include the Python overhead of running ops one at a time. To
+  see where time goes inside a traced `tf.function`, pass `trace_dir`: the
+  forward and backward passes of the model are then also run in a
+  `tf.function` under the TensorFlow Profiler, and the trace written to
+  `trace_dir` can be viewed in TensorBoard. The ops of every layer are grouped
+  under the layer's name scope, e.g. `dense/MatMul` in the forward pass and
+  `gradient_tape/dense/MatMul` in the backward pass.
+
+  Args:
+    model: A built Keras model.
+    sample_batch: A batch of inputs for `model`, as accepted by `model(...)`.
+    training: Whether to call the model in training mode. Note that calling
+      the model in training mode updates the state of layers such as
+      `BatchNormalization`, whose moving statistics then also include the
+      `warmup_runs + runs` calls on `sample_batch`.
+    runs: Number of measured calls of the model.
+    warmup_runs: Number of calls of the model to run before measuring.
+    sort_by: How to rank the layers: by `'total'` (forward + backward) time,
+      by `'forward'` or `'backward'` time, by output size (`'memory'`), or
+      `None` to keep the order of `model.layers`.
+    trace_dir: Optional directory where to write a TensorFlow Profiler trace
+      of the traced model.
+    line_length: Total length of printed lines.
+    print_fn: Print function to use. It will be called on each line of the
+      table. Defaults to `print`. Set it to a function that does nothing to
+      disable printing.
+
+  Returns:
+    A dict with the following keys:
+
+    - `'layers'`: a list with one dict per layer, ranked as in the table, with
+      keys `'name'`, `'class_name'`, `'forward_time'` and `'backward_time'`
+      (in seconds) and `'output_bytes'`.
+    - `'peak_activation_bytes'`: peak live activation memory in inference.
+    - `'total_activation_bytes'`: total size of the outputs of all layers.
+
+  Raises:
+    ValueError: If `sort_by` is not valid or if `runs` is not positive.
+    RuntimeError: If eager execution is disabled.
+  """
+  if sort_by not in _SORT_KEYS:
+    raise ValueError(f'`sort_by` must be one of {_SORT_KEYS}. '
+                     f'Received: sort_by={sort_by}')
+  if runs < 1:
+    raise ValueError(f'`runs` must be a positive integer. Received: {runs}')
+  if not tf.executing_eagerly():
+    raise RuntimeError('`profile_model` requires eager execution.')
+  if print_fn is None:
+    print_fn = print
+
+  layers = model.layers
+  records = [_LayerRecord(layer) for layer in layers]
+  for run in range(warmup_runs + runs):
+    calls = []
+    outputs = _call_with_timed_layers(model, sample_batch, training, records,
+                                      calls, measure=run >= warmup_runs)
+
+  peak_bytes, total_bytes = _activation_memory(
+      calls, tf.nest.flatten(outputs, expand_composites=True))
+  results = [record.result() for record in records if record.forward_times]
+  if sort_by is not None:
+    results.sort(key=_SORT_FNS[sort_by], reverse=True)
+  profile = {
+      'layers': results,
+      'peak_activation_bytes': peak_bytes,
+      'total_activation_bytes': total_bytes,
+  }
+  _print_profile(model, profile, line_length, print_fn)
+
+  if trace_dir:
+    _trace_model(model, sample_batch, training, runs, trace_dir)
+  return profile
+
+
+class _LayerRecord:
+  """Measurements of a single layer."""
+
+  def __init__(self, layer):
+    self.layer = layer
+    self.forward_times = []
+    self.backward_times = []
+    self.output_bytes = 0
+
+  def result(self):
+    return {
+        'name': self.layer.name,
+        'class_name': self.layer.__class__.__name__,
+        'forward_time': float(np.median(self.forward_times)),
+        'backward_time': (float(np.median(self.backward_times))
+                          if self.backward_times else 0.),
+        'output_bytes': self.output_bytes,
+    }
+
+
+_SORT_FNS = {
+    'total': lambda r: r['forward_time'] + r['backward_time'],
+    'forward': lambda r: r['forward_time'],
+    'backward': lambda r: r['backward_time'],
+    'memory': lambda r: r['output_bytes'],
+}
+
+
+def _call_with_timed_layers(model, sample_batch, training, records, calls,
+                            measure):
+  """Calls `model` with the `call` of its layers replaced by timed versions."""
+  patched = []
+  try:
+    for record in records:
+      layer = record.layer
+      patched.append((layer, layer.__dict__.get('call')))
+      layer.call = _make_timed_call(layer.call, record, calls, measure)
+    return model(sample_batch, training=training)
+  finally:
+    for layer, instance_call in patched:
+      if instance_call is None:
+        del layer.call
+      else:
+        layer.call = instance_call
+
+
+def _make_timed_call(call_fn, record, calls, measure):
+  """Returns a version of `call_fn` recording its forward and backward time."""
+  layer = record.layer
+
+  def timed_call(*args, **kwargs):
+    inputs = [t for t in tf.nest.flatten((args, kwargs)) if _is_float(t)]
+    sources = inputs + layer.trainable_weights
+    with tf.GradientTape(watch_accessed_variables=False) as tape:
+      tape.watch(sources)
+      start = time.perf_counter()
+      outputs = call_fn(*args, **kwargs)
+      _block_until_ready(outputs)
+      forward_time = time.perf_counter() - start
+
+    targets = [t for t in tf.nest.flatten(outputs) if _is_float(t)]
+    backward_time = None
+    if targets and sources:
+      start = time.perf_counter()
+      gradients = tape.gradient(targets, sources)
+      _block_until_ready([g for g in gradients if g is not None])
+      backward_time = time.perf_counter() - start
+
+    if measure:
+      record.forward_times.append(forward_time)
+      if backward_time is not None:
+        record.backward_times.append(backward_time)
+      record.output_bytes = _num_bytes(outputs)
+    calls.append((tf.nest.flatten((args, kwargs), expand_composites=True),
+                  tf.nest.flatten(outputs, expand_composites=True)))
+    return outputs
+
+  return timed_call
+
+
+def _is_float(value):
+  return (isinstance(value, tf.Tensor) and
+          (value.dtype.is_floating or value.dtype.is_complex))
+
+
+def _block_until_ready(structure):
+  """Waits for the tensors of `structure` to be computed."""
+  for value in tf.nest.flatten(structure, expand_composites=True):
+    # Eager ops run synchronously on CPU. On other devices, reading an element
+    # of the tensor back waits for its computation.
+    if (isinstance(value, tf.Tensor) and 'CPU' not in value.device and
+        value.shape.num_elements()):
+      tf.reshape(value, [-1])[:1].numpy()
+
+
+def _num_bytes(structure):
+  num_bytes = 0
+  for value in tf.nest.flatten(structure, expand_composites=True):
+    if isinstance(value, tf.Tensor) and value.dtype != tf.string:
+      num_bytes += value.shape.num_elements() * value.dtype.size
+  return num_bytes
+
+
+def _activation_memory(calls, model_outputs):
+  """Returns the peak live and total activation memory of a forward pass.
+
+  Args:
+    calls: List of `(flat_inputs, flat_outputs)` tuples, one per layer call, in
+      call order.
+    model_outputs: Flat list of the outputs of the model, which stay alive
+      until the end of the pass.
+
+  Returns:
+    A tuple `(peak_live_bytes, total_bytes)`.
+  """
+  produced_at = {}
+  last_use = {}
+  for index, (flat_inputs, flat_outputs) in enumerate(calls):
+    for value in flat_inputs:
+      if id(value) in produced_at:
+        last_use[id(value)] = index
+    for value in flat_outputs:
+      produced_at.setdefault(id(value), index)
+  for value in model_outputs:
+    last_use[id(value)] = len(calls)
+
+  live_bytes = np.zeros(len(calls) + 1, dtype='int64')
+  total_bytes = 0
+  seen = set()
+  for _, flat_outputs in calls:
+    for value in flat_outputs:
+      if id(value) in seen:
+        continue
+      seen.add(id(value))
+      num_bytes = _num_bytes(value)
+      total_bytes += num_bytes
+      start = produced_at[id(value)]
+      end = last_use.get(id(value), start)
+      live_bytes[start:end + 1] += num_bytes
+  return int(live_bytes.max()), total_bytes
+
+
+def _trace_model(model, sample_batch, training, runs, trace_dir):
+  """Writes a profiler trace of the traced forward and backward passes."""
+
+  @tf.function
+  def step(inputs):
+    with tf.GradientTape() as tape:
+      outputs = model(inputs, training=training)
+      targets = [t for t in tf.nest.flatten(outputs) if _is_float(t)]
+    return tape.gradient(targets, model.trainable_weights)
+
+  # Trace the function before profiling.
+  step(sample_batch)
+  tf.profiler.experimental.start(trace_dir)
+  try:
+    for step_num in range(runs):
+      with tf.profiler.experimental.Trace(
+          'profile_model', step_num=step_num, _r=1):
+        step(sample_batch)
+  finally:
+    tf.profiler.experimental.stop()
+
+
+def _format_bytes(num_bytes):
+  if num_bytes < 1024:
+    return '%d B' % num_bytes
+  for unit in ('KiB', 'MiB', 'GiB'):
+    num_bytes /= 1024.
+    if num_bytes < 1024 or unit == 'GiB':
+      return '%.1f %s' % (num_bytes, unit)
+
+
+def _print_profile(model, profile, line_length, print_fn):
+  """Prints `profile` as a table."""
+  positions = [int(line_length * p) for p in [.40, .55, .70, .82, 1.]]
+  total_time = sum(r['forward_time'] + r['backward_time']
+                   for r in profile['layers'])
+
+  def print_row(fields):
+    line = ''
+    for field, position in zip(fields, positions):
+      line += str(field)
+      line = line[:position - 1] + ' ' * (position - len(line))
+    print_fn(line.rstrip())
+
+  print_fn('Model: "{}"'.format(model.name))
+  print_fn('_' * line_length)
+  print_row(['Layer (type)', 'Forward (ms)', 'Backward (ms)', 'Time %',
+             'Output size'])
+  print_fn('=' * line_length)
+  for record in profile['layers']:
+    layer_time = record['forward_time'] + record['backward_time']
+    print_row([
+        '{} ({})'.format(record['name'], record['class_name']),
+        '%.3f' % (record['forward_time'] * 1000),
+        '%.3f' % (record['backward_time'] * 1000),
+        '%.1f%%' % (100. * layer_time / total_time if total_time else 0.),
+        _format_bytes(record['output_bytes']),
+    ])
+  print_fn('=' * line_length)
+  forward_time = sum(r['forward_time'] for r in profile['layers'])
+  print_fn('Total time: %.3f ms (forward: %.3f ms, backward: %.3f ms)' %
+           (total_time * 1000, forward_time * 1000,
+            (total_time - forward_time) * 1000))
+  print_fn('Total activation memory: {}'.format(
+      _format_bytes(profile['total_activation_bytes'])))
+  print_fn('Peak live activation memory (inference): {}'.format(
+      _format_bytes(profile['peak_activation_bytes'])))
+  print_fn('_' * line_length)
@@ -0,0 +1,88 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for model_profiler."""
+
+import keras
+import tensorflow.compat.v2 as tf
+
+from keras.utils import model_profiler
+
+
+class ProfileModelTest(tf.test.TestCase):
+
+  def _get_model(self):
+    inputs = keras.Input(shape=(16,))
+    hidden = keras.layers.Dense(32, name='hidden')(inputs)
+    dropout = keras.layers.Dropout(0.5, name='dropout')(hidden)
+    skip = keras.layers.Dense(32, name='skip')(inputs)
+    outputs = keras.layers.Add(name='add')([dropout, skip])
+    return keras.Model(inputs, outputs)
+
+  def test_profile_model(self):
+    model = self._get_model()
+    lines = []
+    profile = model_profiler.profile_model(
+        model, tf.ones((8, 16)), runs=3, sort_by=None, print_fn=lines.append)
+
+    layers = profile['layers']
+    self.assertEqual([layer['name'] for layer in layers],
+                     [layer.name for layer in model.layers[1:]])
+    self.assertCountEqual([layer['class_name'] for layer in layers],
+                          ['Dense', 'Dense', 'Dropout', 'Add'])
+    for layer in layers:
+      # Each layer outputs 8 x 32 float32 values.
+      self.assertEqual(layer['output_bytes'], 8 * 32 * 4)
+      self.assertGreater(layer['forward_time'], 0.)
+      self.assertGreater(layer['backward_time'], 0.)
+    self.assertEqual(profile['total_activation_bytes'], 4 * 8 * 32 * 4)
+    # `hidden` is released once `dropout` is computed, while `dropout` and
+    # `skip` stay alive until `add` is computed.
+    self.assertEqual(profile['peak_activation_bytes'], 3 * 8 * 32 * 4)
+
+    text = '\n'.join(lines)
+    for name in ('hidden (Dense)', 'dropout (Dropout)', 'Peak live'):
+      self.assertIn(name, text)
+
+    # The layers are left untouched.
+    for layer in model.layers:
+      self.assertNotIn('call', layer.__dict__)
+
+  def test_profile_model_keeps_layer_state(self):
+    model = keras.Sequential([
+        keras.layers.Dense(32, input_shape=(16,)),
+        keras.layers.BatchNormalization()])
+    batch_norm = model.layers[-1]
+    moving_mean = batch_norm.moving_mean.numpy()
+    moving_variance = batch_norm.moving_variance.numpy()
+
+    model_profiler.profile_model(
+        model, tf.ones((8, 16)), runs=2, print_fn=lambda line: None)
+    self.assertAllEqual(batch_norm.moving_mean, moving_mean)
+    self.assertAllEqual(batch_norm.moving_variance, moving_variance)
+
+  def test_sort_by(self):
+    model = self._get_model()
+    profile = model_profiler.profile_model(
+        model, tf.ones((8, 16)), runs=2, sort_by='forward',
+        print_fn=lambda line: None)
+    forward_times = [layer['forward_time'] for layer in profile['layers']]
+    self.assertEqual(forward_times, sorted(forward_times, reverse=True))
+
+    with self.assertRaisesRegex(ValueError, '`sort_by` must be one of'):
+      model_profiler.profile_model(model, tf.ones((8, 16)), sort_by='params')
+
+
+if __name__ == '__main__':
+  tf.test.main()
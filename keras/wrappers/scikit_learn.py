@@ -15,12 +15,16 @@
 """Wrapper for using the Scikit-Learn API with Keras models."""
 # pylint: disable=g-classes-have-attributes
 
+import collections
 import copy
+import hashlib
 import types
 import warnings
+import weakref
 
 import numpy as np
 
+from keras import backend
 from keras import losses
 from keras.models import Sequential
 from keras.utils.generic_utils import has_arg
@@ -68,10 +72,27 @@ class BaseWrapper:
   those you could pass to `sk_params`, including fitting parameters.
   In other words, you could use `grid_search` to search for the best
   `batch_size` or `epochs` as well as the model parameters.
+
+  When `reuse_model=True`, the model built by `build_fn` for a given set of
+  model parameters is cached for the lifetime of the process. Subsequent calls
+  to `fit` with the same `build_fn` and model parameters (for instance on every
+  fold of a `GridSearchCV`, which clones the estimator per fold) restore the
+  model and optimizer state from a snapshot taken right after the model was
+  built instead of rebuilding and retracing it. A cached model is owned by the
+  last estimator fitted with it, and is only reused by another estimator once
+  its owner has been garbage collected, so that fitting an estimator never
+  modifies the model of another live estimator (e.g. the `best_estimator_` of
+  a `GridSearchCV`). Model parameters must be hashable or NumPy arrays (or
+  lists, tuples and dicts of those). Since the cache lives in the
+  process, it also stays warm inside the worker processes that scikit-learn's
+  default `loky` backend keeps alive between tasks when `n_jobs > 1`. A
+  callable class instance used as `build_fn` is cached per instance, so it
+  only benefits from reuse when the same instance is fitted repeatedly.
   """
 
-  def __init__(self, build_fn=None, **sk_params):
+  def __init__(self, build_fn=None, reuse_model=False, **sk_params):
     self.build_fn = build_fn
+    self.reuse_model = reuse_model
     self.sk_params = sk_params
     self.check_params(sk_params)
 
@@ -113,7 +134,7 @@ class BaseWrapper:
         Dictionary of parameter names mapped to their values.
     """
     res = self.sk_params.copy()
-    res.update({'build_fn': self.build_fn})
+    res.update({'build_fn': self.build_fn, 'reuse_model': self.reuse_model})
     return res
 
   def set_params(self, **params):
@@ -125,6 +146,9 @@ class BaseWrapper:
     Returns:
         self
     """
+    params = params.copy()
+    if 'reuse_model' in params:
+      self.reuse_model = params.pop('reuse_model')
     self.check_params(params)
     self.sk_params.update(params)
     return self
@@ -146,19 +170,32 @@ class BaseWrapper:
             details about the training history at each epoch.
     """
     if self.build_fn is None:
-      self.model = self.__call__(**self.filter_sk_params(self.__call__))
+      build_fn, cache_owner = self.__call__, type(self)
+      build_args = self.filter_sk_params(self.__call__)
     elif (not isinstance(self.build_fn, types.FunctionType) and
           not isinstance(self.build_fn, types.MethodType)):
-      self.model = self.build_fn(
-          **self.filter_sk_params(self.build_fn.__call__))
+      build_fn, cache_owner = self.build_fn, self.build_fn
+      build_args = self.filter_sk_params(self.build_fn.__call__)
+    else:
+      build_fn, cache_owner = self.build_fn, self.build_fn
+      build_args = self.filter_sk_params(self.build_fn)
+
+    if self.reuse_model:
+      self.model = _get_or_build_cached_model(self, cache_owner, build_fn,
+                                              build_args)
     else:
-      self.model = self.build_fn(**self.filter_sk_params(self.build_fn))
+      self.model = build_fn(**build_args)
 
     if (losses.is_categorical_crossentropy(self.model.loss) and
         len(y.shape) != 2):
       y = to_categorical(y)
 
-    fit_args = copy.deepcopy(self.filter_sk_params(Sequential.fit))
+    if self.reuse_model:
+      # Deep-copying the fit arguments would copy validation data and
+      # callbacks on every fold, which defeats the purpose of model reuse.
+      fit_args = copy.copy(self.filter_sk_params(Sequential.fit))
+    else:
+      fit_args = copy.deepcopy(self.filter_sk_params(Sequential.fit))
     fit_args.update(kwargs)
 
     history = self.model.fit(x, y, **fit_args)
@@ -185,6 +222,122 @@ class BaseWrapper:
     return res
 
 
+# Maximum number of built models kept alive by `reuse_model=True`, per process.
+_MAX_CACHED_MODELS = 16
+
+# Maps `(build_fn owner, model params)` to a list of `[model, model weights,
+# optimizer weights, owner]` entries, with the weights snapshotted right after
+# the model was built, and `owner` a weak reference to the estimator that was
+# last fitted with the model.
+_MODEL_CACHE = collections.OrderedDict()
+
+
+def clear_model_cache():
+  """Drops all models cached by wrappers constructed with `reuse_model=True`."""
+  _MODEL_CACHE.clear()
+
+
+def _make_cache_key(cache_owner, build_args):
+  """Returns a hashable key for a `build_fn` owner and its arguments."""
+  return cache_owner, _freeze(build_args)
+
+
+def _freeze(value):
+  """Returns a hashable representation of a model parameter.
+
+  Args:
+    value: A hashable value, a NumPy array, or a list, tuple or dict of those.
+
+  Returns:
+    A hashable object. NumPy arrays are represented by a digest of their
+    contents.
+
+  Raises:
+    ValueError: If `value` is not supported.
+  """
+  if isinstance(value, np.ndarray):
+    contents = np.ascontiguousarray(value).tobytes()
+    return ('ndarray', value.dtype.str, value.shape,
+            hashlib.sha256(contents).hexdigest())
+  if isinstance(value, (list, tuple)):
+    return type(value).__name__, tuple(_freeze(v) for v in value)
+  if isinstance(value, dict):
+    return 'dict', tuple(
+        sorted((k, _freeze(v)) for k, v in value.items()))
+  try:
+    hash(value)
+  except TypeError:
+    raise ValueError(
+        '`reuse_model=True` requires the model parameters to be hashable, '
+        'NumPy arrays, or lists, tuples or dicts of those. Received an '
+        f'unhashable parameter of type {type(value).__name__}: {value}')
+  return value
+
+
+def _get_or_build_cached_model(estimator, cache_owner, build_fn, build_args):
+  """Returns a model for `build_args`, reset to its freshly built state.
+
+  A cached model is only reused if it is not owned by another live estimator.
+
+  Args:
+    estimator: the estimator being fitted, which becomes the owner of the
+      returned model.
+    cache_owner: object identifying `build_fn` across estimator clones (the
+      function itself, the callable instance, or the wrapper subclass).
+    build_fn: callable that builds and compiles the model.
+    build_args: dictionary of arguments passed to `build_fn`.
+
+  Returns:
+    A compiled Keras model.
+  """
+  key = _make_cache_key(cache_owner, build_args)
+  entries = _MODEL_CACHE.setdefault(key, [])
+  _MODEL_CACHE.move_to_end(key)
+  for entry in entries:
+    owner = entry[3]()
+    if owner is None or owner is estimator:
+      break
+  else:
+    model = build_fn(**build_args)
+    optimizer = getattr(model, 'optimizer', None)
+    if optimizer is not None and hasattr(optimizer, '_create_all_weights'):
+      # Create the slot variables now so that their initial values are part of
+      # the snapshot; otherwise they would be created during the first `fit`.
+      optimizer._create_all_weights(model.trainable_variables)  # pylint: disable=protected-access
+    optimizer_weights = (
+        backend.batch_get_value(optimizer.weights)
+        if optimizer is not None and hasattr(optimizer, 'weights') else [])
+    entries.append(
+        [model, model.get_weights(), optimizer_weights,
+         weakref.ref(estimator)])
+    _evict_cached_models()
+    return model
+
+  model, model_weights, optimizer_weights, _ = entry
+  entry[3] = weakref.ref(estimator)
+  model.set_weights(model_weights)
+  if optimizer_weights:
+    backend.batch_set_value(zip(model.optimizer.weights, optimizer_weights))
+  model.reset_metrics()
+  model.reset_states()
+  model.stop_training = False
+  return model
+
+
+def _evict_cached_models():
+  """Drops the least recently used models beyond `_MAX_CACHED_MODELS`.
+
+  Evicted models stay alive as long as their owner references them.
+  """
+  num_models = sum(len(entries) for entries in _MODEL_CACHE.values())
+  while num_models > _MAX_CACHED_MODELS:
+    key, entries = next(iter(_MODEL_CACHE.items()))
+    entries.pop(0)
+    num_models -= 1
+    if not entries:
+      del _MODEL_CACHE[key]
+
+
 @keras_export('keras.wrappers.scikit_learn.KerasClassifier')
 @doc_controls.do_not_generate_docs
 class KerasClassifier(BaseWrapper):
@@ -193,13 +346,13 @@ class KerasClassifier(BaseWrapper):
   DEPRECATED. Use [Sci-Keras](https://github.com/adriangb/scikeras) instead.
   """
 
-  def __init__(self, build_fn=None, **sk_params):
+  def __init__(self, build_fn=None, reuse_model=False, **sk_params):
     warnings.warn(
         'KerasClassifier is deprecated, '
         'use Sci-Keras (https://github.com/adriangb/scikeras) instead.',
         DeprecationWarning,
         stacklevel=2)
-    super().__init__(build_fn, **sk_params)
+    super().__init__(build_fn, reuse_model=reuse_model, **sk_params)
 
   def fit(self, x, y, **kwargs):
     """Constructs a new model with `build_fn` & fit the model to `(x, y)`.
@@ -330,13 +483,13 @@ class KerasRegressor(BaseWrapper):
   """
 
   @doc_controls.do_not_doc_inheritable
-  def __init__(self, build_fn=None, **sk_params):
+  def __init__(self, build_fn=None, reuse_model=False, **sk_params):
     warnings.warn(
         'KerasRegressor is deprecated, '
         'use Sci-Keras (https://github.com/adriangb/scikeras) instead.',
         DeprecationWarning,
         stacklevel=2)
-    super().__init__(build_fn, **sk_params)
+    super().__init__(build_fn, reuse_model=reuse_model, **sk_params)
 
   def predict(self, x, **kwargs):
     """Returns predictions for the given test data.
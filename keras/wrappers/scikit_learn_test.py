@@ -14,6 +14,7 @@
 # ==============================================================================
 """Tests for Scikit-learn API wrapper."""
 
+import gc
 import warnings
 
 import tensorflow.compat.v2 as tf
@@ -185,6 +186,83 @@ class ScikitLearnAPIWrapperTest(tf.test.TestCase):
 
       assert_regression_works(reg)
 
+  def test_classify_reuse_model(self):
+    with self.cached_session():
+      scikit_learn.clear_model_cache()
+      clf = scikit_learn.KerasClassifier(
+          build_fn=build_fn_clf,
+          reuse_model=True,
+          hidden_dim=HIDDEN_DIM,
+          batch_size=BATCH_SIZE,
+          epochs=EPOCHS)
+      assert_classification_works(clf)
+      model = clf.model
+      model_weights = model.get_weights()
+      initial_weights = scikit_learn._MODEL_CACHE[
+          scikit_learn._make_cache_key(build_fn_clf,
+                                       {'hidden_dim': HIDDEN_DIM})][0][1]
+
+      # A clone does not reuse the model of a live estimator.
+      clone = scikit_learn.KerasClassifier(**clf.get_params())
+      assert_classification_works(clone)
+      self.assertIsNot(clone.model, model)
+      for weight, fitted_weight in zip(model.get_weights(), model_weights):
+        self.assertAllClose(weight, fitted_weight)
+
+      # Once its owner is collected, the model is reused and reset to its
+      # initial weights before fitting.
+      del clf
+      gc.collect()
+      other_clone = scikit_learn.KerasClassifier(**clone.get_params())
+      other_clone.fit(
+          np.zeros((TRAIN_SAMPLES, INPUT_DIM)),
+          np.zeros((TRAIN_SAMPLES,)),
+          epochs=0)
+      self.assertIs(other_clone.model, model)
+      for weight, initial_weight in zip(model.get_weights(), initial_weights):
+        self.assertAllClose(weight, initial_weight)
+      self.assertEqual(model.optimizer.iterations.numpy(), 0)
+
+      # Different model parameters build a different model.
+      clone.set_params(hidden_dim=HIDDEN_DIM + 1)
+      assert_classification_works(clone)
+      self.assertIsNot(clone.model, model)
+      scikit_learn.clear_model_cache()
+
+  def test_reuse_model_cache_key(self):
+    array = np.zeros((2000,))
+    other_array = np.zeros((2000,))
+    other_array[1000] = 1.
+    # The reprs of both arrays are identical, since they are truncated.
+    self.assertEqual(repr(array), repr(other_array))
+    self.assertNotEqual(
+        scikit_learn._make_cache_key(build_fn_clf, {'weights': array}),
+        scikit_learn._make_cache_key(build_fn_clf, {'weights': other_array}))
+    self.assertEqual(
+        scikit_learn._make_cache_key(build_fn_clf, {'sizes': [1, 2]}),
+        scikit_learn._make_cache_key(build_fn_clf, {'sizes': [1, 2]}))
+    with self.assertRaisesRegex(ValueError, 'requires the model parameters'):
+      scikit_learn._make_cache_key(build_fn_clf, {'items': {1, 2}})
+
+  def test_regression_reuse_model(self):
+    with self.cached_session():
+      scikit_learn.clear_model_cache()
+      reg = scikit_learn.KerasRegressor(
+          build_fn=build_fn_reg,
+          reuse_model=True,
+          hidden_dim=HIDDEN_DIM,
+          batch_size=BATCH_SIZE,
+          epochs=EPOCHS)
+      assert_regression_works(reg)
+      model = reg.model
+      assert_regression_works(reg)
+      self.assertIs(reg.model, model)
+      self.assertTrue(reg.get_params()['reuse_model'])
+      reg.set_params(reuse_model=False)
+      assert_regression_works(reg)
+      self.assertIsNot(reg.model, model)
+      scikit_learn.clear_model_cache()
+
   def test_regressor_deprecated(self):
     with warnings.catch_warnings(record=True) as w:
       warnings.simplefilter('always')